@@ -41,6 +41,17 @@ setuptools.setup(
         "pandas>=0.25",
         "requests>=2.22.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+        "fast": ["orjson>=3.6"],
+        "zstd": ["zstandard>=0.15"],
+    },
+    entry_points={
+        "console_scripts": [
+            "waizao-backfill=waizao.backfill:main",
+            "waizao-proxy=waizao.proxy:main",
+        ],
+    },
     package_data={"": ["*.py", "*.json", "*.pk", "*.js", "*.zip"]},
     keywords=[
         "waizao",
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 测试公用的Mock Transport，通过HttpClient.mount挂载，不访问网络
+"""
+
+import io
+import json
+import threading
+import time
+from urllib.parse import parse_qsl
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from waizao import fields_tool
+from waizao.api import http_client
+from waizao.api.retry import RetryPolicy
+
+# K线接口的示例数据
+ROWS = [{"code": "600000", "tdate": "2024-01-02", "close": 10.5, "open": 10.1},
+        {"code": "000001", "tdate": "2024-01-02", "close": 9.2, "open": 9.0}]
+
+
+def payload(rows: list, code: int = 200, message: str = "执行成功") -> str:
+    return json.dumps({"code": code, "message": message, "data": rows}, ensure_ascii=False)
+
+
+def klineParams(fields: str = "all", filter: str = "", **kwargs) -> dict:
+    return dict({"code": "600000,000001", "ktype": 101, "fq": 0, "startDate": "2024-01-01",
+                 "endDate": "2024-01-31", "fields": fields, "export": 1, "token": "t", "filter": filter}, **kwargs)
+
+
+def projectRows(endpoint, params) -> str:
+    # 按fields参数返回ROWS的对应字段，模拟服务端的字段投影
+    names = fields_tool.parseFields(params.get("fields"))
+    rows = ROWS if names is None else [{name: row[name] for name in names} for row in ROWS]
+    return payload(rows)
+
+
+class MockAdapter(BaseAdapter):
+    """
+    按handler(endpoint, params)的返回值构造响应，返回str时状态码为200，返回(状态码, str)时使用指定的状态码，
+    抛出的异常原样传给客户端。calls记录每次请求的 (接口名称, 参数)
+    """
+
+    def __init__(self, handler, delay: float = 0):
+        super().__init__()
+        self.handler = handler
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        endpoint = url.path.rsplit("/", 1)[-1]
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        with self._lock:
+            self.calls.append((endpoint, params))
+        if self.delay:
+            time.sleep(self.delay)
+        result = self.handler(endpoint, params)
+        status, text = result if isinstance(result, tuple) else (200, result)
+        response = requests.Response()
+        response.status_code = status
+        response._content = text.encode("utf-8")
+        # stream=True时iter_content从raw读取
+        response.raw = io.BytesIO(response._content)
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def mock_client():
+    """
+    创建挂载了MockAdapter的HttpClient，重试不等待，例如：client, adapter = mock_client(handler, cache=...)
+    """
+    clients = []
+
+    def create(handler, delay: float = 0, **kwargs):
+        kwargs.setdefault("retry", RetryPolicy(base_delay=0))
+        client = http_client.HttpClient(base_url="http://mock/doc/", **kwargs)
+        adapter = MockAdapter(handler, delay)
+        client.mount("http://", adapter)
+        clients.append(client)
+        return client, adapter
+
+    yield create
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def mock_api(mock_client):
+    """
+    将挂载了MockAdapter的HttpClient设为全局客户端，stock_api的接口函数均通过它请求，例如：adapter = mock_api(handler)
+    """
+    previous = []
+
+    def install(handler, **kwargs):
+        client, adapter = mock_client(handler, **kwargs)
+        previous.append(http_client.setClient(client))
+        return adapter
+
+    yield install
+    if previous:
+        http_client.setClient(previous[0])
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 本地复权测试
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from waizao import adjust_tool
+from waizao.adjust_tool import AdjustEngine
+
+TDATES = pd.date_range("2024-01-02", periods=6).strftime("%Y-%m-%d").tolist()
+
+
+def _bars(closes, code: str = "600000") -> pd.DataFrame:
+    return pd.DataFrame({"code": code, "tdate": TDATES[:len(closes)], "close": np.asarray(closes, dtype="float64"),
+                         "cjl": 100.0})
+
+
+def _factors(rows) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["code", "tdate", "factor"])
+
+
+def test_action_ratios():
+    # 每10股派1元、送10股：除权参考价 = (10 - 0.1) / 2
+    actions = pd.DataFrame({"code": ["600000"], "tdate": pd.to_datetime([TDATES[2]]), "cash": [1], "bonus": [10]})
+    bars = _bars([10, 10, 4.95]).assign(tdate=lambda df: pd.to_datetime(df["tdate"]))
+    ratios = adjust_tool.actionRatios(bars, actions, per=10)
+    assert ratios["ratio"].tolist() == pytest.approx([0.495])
+    factors = adjust_tool.ratiosToFactors(ratios)
+    assert factors["factor"].tolist() == pytest.approx([1 / 0.495])
+
+
+def test_adjust_forward_backward():
+    engine = AdjustEngine(_factors([("600000", "2024-01-01", 1.0), ("600000", TDATES[2], 2.0)]))
+    bars = _bars([10, 10, 5, 5])
+    assert engine.adjust(bars, adjust_tool.FQ_FORWARD)["close"].tolist() == [5, 5, 5, 5]
+    assert engine.adjust(bars, adjust_tool.FQ_BACKWARD)["close"].tolist() == [10, 10, 10, 10]
+    assert engine.adjust(bars, adjust_tool.FQ_FORWARD, volume=True)["cjl"].tolist() == [200, 200, 100, 100]
+    assert engine.adjust(bars, adjust_tool.FQ_NONE).equals(bars)
+    # 没有因子的股票不复权
+    assert engine.adjust(_bars([10, 10], "000001"), adjust_tool.FQ_FORWARD)["close"].tolist() == [10, 10]
+    with pytest.raises(ValueError):
+        engine.adjust(bars, 3)
+
+
+def test_add_actions():
+    engine = AdjustEngine()
+    bars = _bars([10, 10, 5, 5])
+    engine.addActions(bars, pd.DataFrame({"code": ["600000"], "tdate": [TDATES[2]], "bonus": [1]}))
+    assert engine.adjust(bars, adjust_tool.FQ_FORWARD)["close"].tolist() == pytest.approx([5, 5, 5, 5])
+    with pytest.raises(ValueError):
+        engine.addActions(bars, pd.DataFrame({"code": ["600000"], "tdate": ["1960-01-04"], "bonus": [1]}))
+
+
+def test_rebase_matches_full_adjust():
+    bars = _bars([20, 20, 10, 10, 5, 5])
+    first = _factors([("600000", "2024-01-01", 1.0), ("600000", TDATES[2], 2.0)])
+    engine = AdjustEngine(first)
+    adjusted = engine.adjust(bars, adjust_tool.FQ_FORWARD)
+    rebased = engine.rebase(adjusted, _factors([("600000", TDATES[4], 4.0)]))
+    expected = AdjustEngine(pd.concat([first, _factors([("600000", TDATES[4], 4.0)])])).adjust(
+        bars, adjust_tool.FQ_FORWARD)
+    assert rebased["close"].tolist() == pytest.approx(expected["close"].tolist())
+    assert rebased["close"].tolist() == pytest.approx([5] * 6)
+
+
+def test_rebase_actions():
+    bars = _bars([20, 20, 10, 10, 5, 5])
+    engine = AdjustEngine()
+    engine.addActions(bars, pd.DataFrame({"code": ["600000"], "tdate": [TDATES[2]], "bonus": [1]}))
+    adjusted = engine.adjust(bars, adjust_tool.FQ_FORWARD)
+    rebased = engine.rebaseActions(adjusted, bars.iloc[3:4], pd.DataFrame({"code": ["600000"], "tdate": [TDATES[4]],
+                                                                           "bonus": [1]}))
+    assert rebased["close"].tolist() == pytest.approx([5] * 6)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 批量回补任务拆分测试
+"""
+
+import pytest
+
+from waizao import backfill
+from waizao.api import stock_api
+
+DATES = ["2024-01-02", "2024-01-03", "2024-01-04"]
+
+
+def _tasks(job):
+    return job.db.execute("SELECT code, startDate, endDate FROM task ORDER BY id").fetchall()
+
+
+def test_plan_all_by_single_day(tmp_path):
+    with backfill.BackfillJob(str(tmp_path / "backfill.db")) as job:
+        job.plan("getDayKLine", "all", "2024-01-01", "2024-01-05", str(tmp_path), {"type": 1, "ktype": 101, "fq": 0},
+                 dates=DATES)
+        assert _tasks(job) == [("all", date, date) for date in DATES]
+
+
+def test_plan_all_without_calendar(tmp_path):
+    with backfill.BackfillJob(str(tmp_path / "backfill.db")) as job:
+        assert job.plan("getDayKLine", "all", "2024-01-01", "2024-01-03", str(tmp_path), window=30) == 3
+
+
+def test_plan_chunks_codes(tmp_path):
+    codes = ["%06d" % i for i in range(120)]
+    with backfill.BackfillJob(str(tmp_path / "backfill.db")) as job:
+        job.plan("getDayKLine", codes, "2024-01-01", "2024-01-05", str(tmp_path), dates=DATES)
+        tasks = _tasks(job)
+    assert [len(code.split(",")) for code, _, _ in tasks] == [50, 50, 20]
+    assert {(start, end) for _, start, end in tasks} == {("2024-01-02", "2024-01-04")}
+
+
+def test_plan_rejects_unsupported_all(tmp_path):
+    with backfill.BackfillJob(str(tmp_path / "backfill.db")) as job:
+        with pytest.raises(ValueError):
+            job.plan("getMinuteKLine", "all", "2024-01-01", "2024-01-05", str(tmp_path), {"type": 1})
+        assert not job.planned
+
+
+def test_main_requires_codes_without_all_support(tmp_path):
+    with pytest.raises(SystemExit):
+        backfill.main(["getMinuteKLine", "--token", "t", "--output", str(tmp_path)])
+
+
+def test_parse_param_by_signature():
+    assert backfill._parseParam("ktype=101", stock_api.getDayKLine) == ("ktype", 101)
+    assert backfill._parseParam("code=000001", stock_api.getDayKLine) == ("code", "000001")
+    assert backfill._parseParam("ktype=101") == ("ktype", "101")
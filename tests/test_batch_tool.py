@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 批量请求工具测试
+"""
+
+import json
+
+import pytest
+
+from tests.conftest import payload
+from waizao import batch_tool
+from waizao.api import stock_api
+
+CODES = ["%06d" % code for code in range(120)]
+
+
+def _handler(endpoint, params):
+    return payload([{"code": code} for code in params["code"].split(",")])
+
+
+def _request(codes, export):
+    return batch_tool.batchRequest(stock_api.getDayKLine, codes, type=1, ktype=101, fq=1, startDate="2024-01-01",
+                                   endDate="2024-01-31", fields="all", export=export, token="t", filter="")
+
+
+def test_chunk_codes():
+    assert batch_tool.chunkCodes("600000, 000001,,300750", 2) == ["600000,000001", "300750"]
+    assert [len(chunk.split(",")) for chunk in batch_tool.chunkCodes(CODES)] == [50, 50, 20]
+
+
+@pytest.mark.parametrize("export", [1, "1", 5, "5"])
+def test_merge_json(mock_api, export):
+    adapter = mock_api(_handler)
+    data = json.loads(_request(CODES, export))["data"]
+    assert [row["code"] for row in data] == CODES
+    assert len(adapter.calls) == 3
+
+
+@pytest.mark.parametrize("export", [2, "2", 6, "csv"])
+def test_unsupported_export_before_requests(mock_api, export):
+    # 无法合并的数据导出类型在请求之前抛出ValueError，不下载任何数据
+    adapter = mock_api(_handler)
+    with pytest.raises(ValueError):
+        _request(CODES, export)
+    assert adapter.calls == []
+
+
+def test_merge_csv():
+    header = "code,close\n代码,收盘价\n"
+    responses = [header + "600000,1\n", "﻿" + header + "000001,2\n300750,3\n", header]
+    for export in (4, "4"):
+        assert batch_tool.mergeResponses(responses, export) == header + "600000,1\n000001,2\n300750,3\n"
+
+
+def test_merge_failed_response():
+    with pytest.raises(ValueError):
+        batch_tool.mergeResponses([payload([]), json.dumps({"code": 500, "message": "令牌无效"})], 1)
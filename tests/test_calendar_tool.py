@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 交易日历测试
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.conftest import payload
+from waizao import calendar_tool
+from waizao.calendar_tool import TradeCalendar
+
+# 2024年1月的交易日，1月1日为节假日
+DATES = pd.bdate_range("2024-01-02", "2024-01-31").strftime("%Y-%m-%d").tolist()
+
+
+@pytest.fixture
+def calendar():
+    return TradeCalendar(DATES, "2023-12-25", "2024-02-10")
+
+
+def test_is_trading_day(calendar):
+    assert calendar.isTradingDay("2024-01-02")
+    assert not calendar.isTradingDay("2024-01-01")
+    assert not calendar.isTradingDay("2024-01-06")
+    assert calendar.isTradingDay(np.array(["2024-01-05", "2024-01-06"], dtype="datetime64[D]")).tolist() == \
+        [True, False]
+
+
+def test_next_prev_trading_day(calendar):
+    assert calendar.nextTradingDay("2024-01-05") == "2024-01-08"
+    assert calendar.nextTradingDay("2024-01-06") == "2024-01-08"
+    assert calendar.nextTradingDay("2023-12-29") == "2024-01-02"
+    assert calendar.prevTradingDay("2024-01-08") == "2024-01-05"
+    assert calendar.prevTradingDay("2024-01-07") == "2024-01-05"
+    assert calendar.prevTradingDay(["2024-01-03", "2024-01-09"]).tolist() == ["2024-01-02", "2024-01-08"]
+    assert calendar.nextTradingDay("2024-01-05", asString=False) == np.datetime64("2024-01-08")
+
+
+def test_trading_days_between(calendar):
+    assert calendar.tradingDaysBetween("2024-01-01", "2024-01-07") == 4
+    assert calendar.tradingDaysBetween("2024-01-06", "2024-01-07") == 0
+    assert calendar.tradingDaysBetween("2024-01-10", "2024-01-02") == 0
+    assert calendar.tradingDaysBetween(["2024-01-02", "2024-01-08"], ["2024-01-31", "2024-01-12"]).tolist() == \
+        [len(DATES), 5]
+
+
+def test_shift(calendar):
+    assert calendar.shift("2024-01-05", 1) == "2024-01-08"
+    assert calendar.shift("2024-01-08", -1) == "2024-01-05"
+    assert calendar.shift("2024-01-08", 0) == "2024-01-08"
+    # 非交易日：0滚动到下一交易日，向后从上一交易日计算，向前从下一交易日计算
+    assert calendar.shift("2024-01-06", 0) == "2024-01-08"
+    assert calendar.shift("2024-01-06", 1) == "2024-01-08"
+    assert calendar.shift("2024-01-06", -1) == "2024-01-05"
+    assert calendar.shift(["2024-01-02", "2024-01-06"], [2, 1]).tolist() == ["2024-01-04", "2024-01-08"]
+    # 数组与标量的结果一致
+    dates = pd.date_range("2024-01-06", "2024-01-20").strftime("%Y-%m-%d").tolist()
+    for n in (-3, 0, 4):
+        assert calendar.shift(dates, n).tolist() == [calendar.shift(date, n) for date in dates]
+
+
+def test_out_of_range(calendar):
+    with pytest.raises(ValueError):
+        calendar.nextTradingDay("2024-03-01")
+    with pytest.raises(ValueError):
+        calendar.shift("2024-01-31", 1)
+    with pytest.raises(ValueError):
+        calendar.prevTradingDay("2024-01-02")
+
+
+def test_trading_days(calendar):
+    assert calendar.tradingDays("2024-01-06", "2024-01-09") == ["2024-01-08", "2024-01-09"]
+    assert calendar.tradingDays() == DATES
+    assert calendar.covers("2024-01-01", "2024-02-10")
+    assert not calendar.covers("2023-01-01", "2024-01-10")
+
+
+def test_get_calendar_cached(mock_api):
+    adapter = mock_api(lambda endpoint, params: payload([{"tdate": date} for date in DATES]))
+    calendar_tool.setCalendar(calendar_tool.MTYPE_STOCK, None)
+    try:
+        first = calendar_tool.getCalendar(calendar_tool.MTYPE_STOCK, "t", "2024-01-01", "2024-01-31")
+        second = calendar_tool.getCalendar(calendar_tool.MTYPE_STOCK, "t", "2024-01-10", "2024-01-20")
+        assert first is second
+        assert len(adapter.calls) == 1
+        assert adapter.calls[0][0] == "getStockTradeDate"
+        # 不覆盖请求的范围时重新请求
+        calendar_tool.getCalendar(calendar_tool.MTYPE_STOCK, "t", "2024-01-01", "2099-12-31")
+        assert len(adapter.calls) == 2
+    finally:
+        calendar_tool.setCalendar(calendar_tool.MTYPE_STOCK, None)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 接口响应磁盘缓存测试
+"""
+
+import datetime
+import json
+
+import pytest
+
+from tests.conftest import ROWS
+from tests.conftest import klineParams
+from tests.conftest import payload
+from tests.conftest import projectRows
+from waizao.api import errors
+from waizao.api.disk_cache import DiskCache
+from waizao.api.disk_cache import cacheKey
+
+
+def test_cache_key_ignores_token_and_order():
+    params = klineParams()
+    assert cacheKey("getDayKLine", params) == cacheKey("getDayKLine", dict(reversed(params.items()), token="x"))
+    assert cacheKey("getDayKLine", params) != cacheKey("getDayKLine", klineParams(fields="code"))
+
+
+def test_ttl(tmp_path):
+    cache = DiskCache(str(tmp_path), today_ttl=60)
+    today = datetime.date.today().isoformat()
+    assert cache.ttl("getDayKLine", klineParams()) is None
+    assert cache.ttl("getDayKLine", klineParams(endDate=today)) == 60
+
+
+def test_get_put(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    assert cache.get("getDayKLine", klineParams()) is None
+    cache.put("getDayKLine", klineParams(), payload(ROWS))
+    cache.put("getDailyMarket", klineParams(), payload(ROWS))
+    cache.put("getDayKLine", klineParams(fields="code"), payload([], 500, "参数错误"))
+    # 重新打开时从缓存目录恢复
+    cache = DiskCache(str(tmp_path))
+    assert cache.get("getDayKLine", klineParams()) == payload(ROWS)
+    assert cache.get("getDailyMarket", klineParams()) is None
+    assert cache.get("getDayKLine", klineParams(fields="code")) is None
+    assert cache.stats()["entries"] == 1
+
+
+def test_lru_eviction(tmp_path):
+    text = payload(ROWS)
+    cache = DiskCache(str(tmp_path), max_size=2 * (len(text.encode("utf-8")) + 4))
+    for code in ("600000", "000001"):
+        cache.put("getDayKLine", klineParams(code=code), text)
+    cache.get("getDayKLine", klineParams(code="600000"))
+    cache.put("getDayKLine", klineParams(code="300750"), text)
+    assert cache.get("getDayKLine", klineParams(code="000001")) is None
+    assert cache.get("getDayKLine", klineParams(code="600000")) == text
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_hit_skips_upstream(mock_client, tmp_path):
+    client, adapter = mock_client(projectRows, cache=DiskCache(str(tmp_path)))
+    first = client.request("getDayKLine", klineParams())
+    # 缓存键不含token
+    second = client.request("getDayKLine", klineParams(token="other"))
+    assert first == second
+    assert len(adapter.calls) == 1
+    assert client.cache.stats()["hits"] == 1
+
+
+def test_errors_not_cached(mock_client, tmp_path):
+    client, adapter = mock_client(lambda endpoint, params: payload([], 500, "参数错误"),
+                                  cache=DiskCache(str(tmp_path)))
+    for _ in range(2):
+        with pytest.raises(errors.ApiError):
+            client.request("getDayKLine", klineParams())
+    assert len(adapter.calls) == 2
+
+
+def test_one_miss_per_request(mock_client, tmp_path):
+    # 查找字段和筛选条件的超集时不计数，每次请求只计入一次未命中或命中
+    client, adapter = mock_client(projectRows, cache=DiskCache(str(tmp_path)))
+    client.request("getDayKLine", klineParams())
+    text = client.request("getDayKLine", klineParams(fields="code,close", filter="close>10"))
+    assert json.loads(text)["data"] == [{"code": "600000", "close": 10.5}]
+    assert client.cache.stats()["misses"] == 1
+    assert client.cache.stats()["hits"] == 1
+    client.request("getDayKLine", klineParams(code="300750", fields="code,close", filter="close>10"))
+    assert client.cache.stats()["misses"] == 2
+    assert len(adapter.calls) == 2
+    # 未启用缓存的接口不计数
+    client.request("getDailyMarket", klineParams())
+    assert client.cache.stats()["misses"] == 2
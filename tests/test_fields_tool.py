@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 字段投影、字段超集缓存和字段放宽测试
+"""
+
+import json
+
+from tests.conftest import ROWS
+from tests.conftest import klineParams
+from tests.conftest import payload
+from tests.conftest import projectRows
+from waizao import fields_tool
+from waizao.api.disk_cache import DiskCache
+
+
+def test_parse_fields():
+    assert fields_tool.parseFields(None) is None
+    assert fields_tool.parseFields("all") is None
+    assert fields_tool.parseFields("code,ALL") is None
+    assert fields_tool.parseFields(" code, close,code,") == ["code", "close"]
+    assert fields_tool.parseFields("") is None
+
+
+def test_covers():
+    assert fields_tool.covers("code,close", "all")
+    assert fields_tool.covers("close,code", "code,close,open")
+    assert not fields_tool.covers("code,tdate", "code,close")
+    assert not fields_tool.covers("all", "code,close")
+
+
+def test_project():
+    text = fields_tool.project(payload(ROWS), "close,code")
+    assert json.loads(text)["data"] == [{"close": 10.5, "code": "600000"}, {"close": 9.2, "code": "000001"}]
+    assert fields_tool.project(payload(ROWS), "all") == payload(ROWS)
+    assert fields_tool.project(payload(ROWS), "code,volume") is None
+
+
+def test_project_data_frame_format():
+    data = json.dumps({"code": 200, "en": ["code", "close"], "zh": ["代码", "收盘价"],
+                       "data": [["600000", 10.5], ["000001", 9.2]]}, ensure_ascii=False)
+    result = json.loads(fields_tool.project(data, "close"))
+    assert result["en"] == ["close"]
+    assert result["zh"] == ["收盘价"]
+    assert result["data"] == [[10.5], [9.2]]
+
+
+def test_superset_serves_subset(mock_client, tmp_path):
+    client, adapter = mock_client(projectRows, cache=DiskCache(str(tmp_path)))
+    client.request("getDayKLine", klineParams())
+    text = client.request("getDayKLine", klineParams(fields="code,close", filter="close>10"))
+    assert json.loads(text)["data"] == [{"code": "600000", "close": 10.5}]
+    assert len(adapter.calls) == 1
+
+
+def test_planner_widens_repeated_requests(mock_client, tmp_path):
+    client, adapter = mock_client(projectRows, cache=DiskCache(str(tmp_path)),
+                                  field_planner=fields_tool.FieldPlanner(widen_after=2))
+    first = client.request("getDayKLine", klineParams(fields="code,close"))
+    second = client.request("getDayKLine", klineParams(fields="code,open"))
+    third = client.request("getDayKLine", klineParams(fields="code,tdate"))
+    assert [params["fields"] for _, params in adapter.calls] == ["code,close", "all"]
+    assert json.loads(first)["data"][0] == {"code": "600000", "close": 10.5}
+    assert json.loads(second)["data"][0] == {"code": "600000", "open": 10.1}
+    assert json.loads(third)["data"][0] == {"code": "600000", "tdate": "2024-01-02"}
+
+
+def test_planner_skips_uncached_endpoints(mock_client, tmp_path):
+    client, adapter = mock_client(projectRows, cache=DiskCache(str(tmp_path)),
+                                  field_planner=fields_tool.FieldPlanner(widen_after=1))
+    for fields in ("code,close", "code,open", "code,close"):
+        client.request("getDailyMarket", klineParams(fields=fields))
+    assert [params["fields"] for _, params in adapter.calls] == ["code,close", "code,open", "code,close"]
+
+
+def test_planner_always_widens_listed_endpoints():
+    planner = fields_tool.FieldPlanner(widen_after=0, endpoints=["getDayKLine"])
+    assert planner.plan("getDayKLine", klineParams(fields="code,close"))["fields"] == fields_tool.ALL_FIELDS
+    assert planner.plan("getHourKLine", klineParams(fields="code,close"))["fields"] == "code,close"
+    assert planner.plan("getDayKLine", klineParams())["fields"] == "all"
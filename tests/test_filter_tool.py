@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 本地过滤表达式测试
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.conftest import ROWS
+from tests.conftest import payload
+from waizao import filter_tool
+from waizao.filter_tool import FilterError
+
+FRAME = pd.DataFrame({"code": ["600000", "000001", "300750", None], "close": [10.5, 9.2, 180.0, np.nan],
+                      "tdate": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"])})
+
+
+@pytest.mark.parametrize("expr, rows", [
+    ("close>10", [0, 2]),
+    ("close>=9.2 and close<100", [0, 1]),
+    ("close<10 || close>100", [1, 2]),
+    ("(close>10 & close<100) or code='000001'", [0, 1]),
+    # 空值不满足任何比较条件
+    ("code!=600000", [1, 2]),
+    ("tdate>=2024-01-03", [1, 2, 3]),
+    ("", [0, 1, 2, 3]),
+])
+def test_apply_filter(expr, rows):
+    assert filter_tool.applyFilter(FRAME, expr).index.tolist() == rows
+
+
+def test_apply_filter_dict():
+    data = {"close": np.array([1.0, 2.0, 3.0]), "open": np.array([3.0, 2.0, 1.0])}
+    assert filter_tool.applyFilter(data, "close>1 and open>1")["close"].tolist() == [2.0]
+
+
+@pytest.mark.parametrize("expr", ["close>", "close>>1", "(close>1", "volume>1", "close>abc"])
+def test_invalid_expression(expr):
+    with pytest.raises(FilterError):
+        filter_tool.applyFilter(FRAME, expr)
+
+
+def test_filter_response():
+    result = json.loads(filter_tool.filterResponse(payload(ROWS), "close>10"))
+    assert result["data"] == ROWS[:1]
+    assert filter_tool.filterResponse(payload(ROWS), "") == payload(ROWS)
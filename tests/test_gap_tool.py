@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 缺失K线检测测试
+"""
+
+import pandas as pd
+
+from waizao import calendar_tool
+from waizao import gap_tool
+
+DATES = ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05", "2024-01-08", "2024-01-09"]
+
+
+def _calendar():
+    return calendar_tool.TradeCalendar(DATES)
+
+
+def _bars(code: str, dates: list) -> pd.DataFrame:
+    return pd.DataFrame({"code": code, "tdate": pd.to_datetime(dates), "close": 1.0})
+
+
+def test_detect_gaps_in_bars():
+    bars = pd.concat([_bars("600000", ["2024-01-02", "2024-01-03", "2024-01-08", "2024-01-09"]),
+                      _bars("000001", DATES)])
+    gaps = gap_tool.detectGaps(bars, _calendar())
+    assert gaps.to_dict("records") == [
+        {"code": "600000", "startDate": "2024-01-04", "endDate": "2024-01-05", "days": 2}]
+
+
+def test_listing_and_suspension():
+    bars = _bars("600000", ["2024-01-04", "2024-01-09"])
+    listings = pd.DataFrame({"code": ["600000"], "start": ["2024-01-03"], "end": [None]})
+    suspended = pd.DataFrame({"code": ["600000"], "tdate": ["2024-01-05"]})
+    gaps = gap_tool.detectGaps(bars, _calendar(), "2024-01-02", "2024-01-09", listings, suspended)
+    assert gaps[["startDate", "endDate"]].values.tolist() == [["2024-01-03", "2024-01-03"],
+                                                               ["2024-01-08", "2024-01-08"]]
+
+
+def test_empty_store_with_listings():
+    listings = pd.DataFrame({"code": ["600000", "000001"], "start": ["2024-01-02", "2024-01-05"],
+                             "end": [None, "2024-01-08"]})
+    gaps = gap_tool.detectGaps(pd.DataFrame(), _calendar(), endDate="2024-01-09", listings=listings)
+    assert gaps.to_dict("records") == [
+        {"code": "000001", "startDate": "2024-01-05", "endDate": "2024-01-08", "days": 2},
+        {"code": "600000", "startDate": "2024-01-02", "endDate": "2024-01-09", "days": 6}]
+    assert gap_tool.detectGaps(pd.DataFrame(), _calendar()).empty
+
+
+def test_plan_repairs_groups_and_splits():
+    gaps = pd.DataFrame({"code": ["600000", "000001", "000002"], "startDate": ["2024-01-02"] * 2 + ["2024-01-08"],
+                         "endDate": ["2024-01-05"] * 2 + ["2024-01-08"], "days": [4, 4, 1]})
+    tasks = gap_tool.planRepairs(gaps, _calendar(), days=3)
+    assert tasks == [("000001,600000", ("2024-01-02", "2024-01-04")), ("000001,600000", ("2024-01-05", "2024-01-05")),
+                     ("000002", ("2024-01-08", "2024-01-08"))]
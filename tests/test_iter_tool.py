@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 分块迭代测试
+"""
+
+import pytest
+
+from tests.conftest import payload
+from waizao import iter_tool
+from waizao import range_tool
+from waizao.api import stock_api
+
+DATES = ["2024-01-02", "2024-01-03", "2024-01-04"]
+
+
+def _bars(endpoint, params):
+    return payload([{"code": code, "tdate": params["startDate"][:10], "close": 10.0}
+                    for code in params["code"].split(",")])
+
+
+def test_plan_tasks_by_chunk_and_window():
+    codes = ["%06d" % i for i in range(60)]
+    tasks = range_tool.planTasks(stock_api.getDayKLine, codes, "2024-01-01", "2024-01-31", "t", dates=DATES, days=2,
+                                 type=1, ktype=101)
+    assert [(len(chunk.split(",")), window) for chunk, window in tasks] == [
+        (50, ("2024-01-02", "2024-01-03")), (50, ("2024-01-04", "2024-01-04")),
+        (10, ("2024-01-02", "2024-01-03")), (10, ("2024-01-04", "2024-01-04"))]
+
+
+def test_iter_all_by_single_day(mock_api):
+    adapter = mock_api(_bars)
+    frames = list(iter_tool.iterDayKLine(1, "all", 101, 0, "2024-01-01", "2024-01-31", "t", dates=DATES, prefetch=0))
+    assert [params["startDate"] == params["endDate"] for _, params in adapter.calls] == [True] * 3
+    assert [str(df["tdate"].iloc[0])[:10] for df in frames] == DATES
+
+
+def test_iter_minute_rejects_all(mock_api):
+    adapter = mock_api(_bars)
+    with pytest.raises(ValueError):
+        next(iter_tool.iterMinuteKLine(1, "all", "2024-01-01", "2024-01-31", "t", dates=DATES))
+    assert adapter.calls == []
+
+
+def test_iter_minute_datetime_bounds(mock_api):
+    adapter = mock_api(_bars)
+    list(iter_tool.iterMinuteKLine(1, "600000", "2024-01-01", "2024-01-31", "t", dates=DATES))
+    assert [(params["startDate"], params["endDate"]) for _, params in adapter.calls] == [
+        ("2024-01-02 00:00:00", "2024-01-04 23:59:59")]
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 本地列式K线存储测试
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from waizao.store import KLineStore
+from waizao.store import kline_store
+
+
+def _bars(codes, start: str, periods: int, close: float = 0) -> pd.DataFrame:
+    tdate = pd.date_range(start, periods=periods)
+    return pd.DataFrame({
+        "code": np.repeat(codes, periods),
+        "tdate": np.tile(tdate, len(codes)),
+        "close": close + np.arange(len(codes) * periods, dtype="float64"),
+    })
+
+
+def test_write_read(tmp_path):
+    store = KLineStore(str(tmp_path))
+    store.write(_bars(["600000", "000001"], "2023-12-30", 5), 1, 101, 1)
+    assert store.years(1, 101, 1) == [2023, 2024]
+    assert store.codes(1, 101, 1) == ["000001", "600000"]
+    columns = store.read(1, 101, 1, "000001", "2023-12-31", "2024-01-02")
+    assert columns["close"].tolist() == [6, 7, 8]
+    assert store.read(1, 101, 1, "300750") == {}
+
+
+def test_incremental_write_appends_delta(tmp_path):
+    store = KLineStore(str(tmp_path))
+    store.write(_bars(["600000", "000001"], "2024-01-01", 10), 1, 101, 1)
+    path = store.partitionPath(1, 101, 1, 2024)
+    base = os.stat(os.path.join(path, kline_store.INDEX_FILE)).st_mtime_ns
+    store.write(_bars(["600000"], "2024-01-11", 2, close=100), 1, 101, 1)
+    store.write(_bars(["300750"], "2024-01-01", 3), 1, 101, 1)
+    assert [os.path.basename(folder) for folder in store._deltas(path)] == ["delta-000001", "delta-000002"]
+    assert os.stat(os.path.join(path, kline_store.INDEX_FILE)).st_mtime_ns == base
+    assert store.codes(1, 101, 1) == ["000001", "300750", "600000"]
+    assert store.read(1, 101, 1, "600000", "2024-01-09")["close"].tolist() == [8, 9, 100, 101]
+
+
+def test_later_write_overrides(tmp_path):
+    store = KLineStore(str(tmp_path))
+    store.write(_bars(["600000"], "2024-01-01", 5), 1, 101, 1)
+    store.write(_bars(["600000"], "2024-01-03", 1, close=50), 1, 101, 1)
+    store.write(_bars(["600000"], "2024-01-03", 1, close=60), 1, 101, 1)
+    columns = store.read(1, 101, 1, "600000")
+    assert columns["close"].tolist() == [0, 1, 60, 3, 4]
+    assert (np.diff(columns["tdate"]) > np.timedelta64(0)).all()
+
+
+def test_compaction(tmp_path, monkeypatch):
+    monkeypatch.setattr(kline_store, "MAX_DELTAS", 3)
+    store = KLineStore(str(tmp_path))
+    for day in range(5):
+        store.write(_bars(["600000"], "2024-01-%02d" % (day + 1), 1, close=day), 1, 101, 1)
+    path = store.partitionPath(1, 101, 1, 2024)
+    # 第5次写入时已有3个增量段，合并为一个分区
+    assert store._deltas(path) == []
+    assert store.read(1, 101, 1, "600000")["close"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_concurrent_writes(tmp_path):
+    store = KLineStore(str(tmp_path))
+    codes = ["%06d" % code for code in range(16)]
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda code: store.write(_bars([code], "2024-01-01", 20), 1, 101, 1), codes))
+    assert store.codes(1, 101, 1) == codes
+    assert len(store.readFrame(1, 101, 1)) == 16 * 20
+
+
+def test_read_frame(tmp_path):
+    store = KLineStore(str(tmp_path))
+    store.write(_bars(["600000", "000001"], "2023-12-20", 20), 1, 101, 1)
+    store.write(_bars(["000001"], "2024-01-05", 3, close=100), 1, 101, 1)
+    frame = store.readFrame(1, 101, 1, startDate="2023-12-25", endDate="2024-01-06")
+    assert frame["code"].unique().tolist() == ["000001", "600000"]
+    for code, group in frame.groupby("code"):
+        expected = store.read(1, 101, 1, code, "2023-12-25", "2024-01-06")
+        assert group["close"].tolist() == expected["close"].tolist()
+    assert store.readFrame(1, 101, 1, "600000,000001")["code"].unique().tolist() == ["600000", "000001"]
+    assert store.readFrame(1, 101, 1, ["300750"]).empty
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 缓存代理服务测试
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from tests.conftest import payload
+from waizao import proxy
+from waizao.api.disk_cache import DiskCache
+
+ROWS = [{"code": "600000", "tdate": "2024-01-02", "close": 10.5}]
+
+PARAMS = {"type": 1, "code": "600000", "ktype": 101, "fq": 0, "startDate": "2024-01-02", "endDate": "2024-01-02",
+          "fields": "all", "export": 1, "filter": ""}
+
+
+def _upstream(endpoint, params):
+    if params["token"] != "good":
+        return payload([], 500, "令牌无效")
+    return payload(ROWS)
+
+
+@pytest.fixture
+def serve(mock_client, tmp_path):
+    servers = []
+
+    def start(handler=_upstream, delay: float = 0, **kwargs):
+        client, adapter = mock_client(handler, delay, cache=DiskCache(str(tmp_path), endpoints=None),
+                                      single_flight=False)
+        server = proxy.ProxyServer(("127.0.0.1", 0), client, quiet=True, **kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        session = requests.Session()
+        session.trust_env = False
+        url = "http://127.0.0.1:%d%s" % (server.server_address[1], proxy.PATH_PREFIX)
+
+        def get(token: str, endpoint: str = "getDayKLine"):
+            response = session.get(url + endpoint, params=dict(PARAMS, token=token))
+            return response.status_code, json.loads(response.text)
+
+        return get, adapter, server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_cache_shared_between_clients(serve):
+    get, adapter, _ = serve()
+    assert get("good") == (200, json.loads(payload(ROWS)))
+    assert get("other")[1]["data"] == ROWS
+    assert len(adapter.calls) == 1
+
+
+def test_concurrent_requests_coalesced(serve):
+    get, adapter, server = serve(delay=0.2)
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda _: get("good"), range(4)))
+    assert all(body["data"] == ROWS for _, body in results)
+    assert len(adapter.calls) == 1
+    assert server.single_flight.stats()["shared"] == 3
+
+
+def test_token_errors_not_shared(serve):
+    get, adapter, _ = serve(delay=0.2)
+    with ThreadPoolExecutor(2) as executor:
+        bad = executor.submit(get, "bad")
+        good = executor.submit(get, "good")
+        assert bad.result()[1]["message"] == "令牌无效"
+        assert good.result()[1]["data"] == ROWS
+    assert sorted(params["token"] for _, params in adapter.calls) == ["bad", "good"]
+
+
+def test_upstream_token_replaces_client_token(serve):
+    get, adapter, _ = serve(token="good")
+    assert get("bad")[1]["data"] == ROWS
+    assert adapter.calls[0][1]["token"] == "good"
+
+
+def test_client_rate_limit(serve):
+    get, adapter, server = serve(limiter=proxy.ClientLimiter(rate=0.001, burst=1))
+    assert get("good")[0] == 200
+    status, body = get("good")
+    assert status == 429 and body["code"] == 429
+    assert get("other")[0] == 200
+    assert server.stats()["throttled"] == 1
+
+
+def test_unknown_path(serve):
+    get, _, _ = serve()
+    assert get("good", "a/b")[0] == 404
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 日期范围拆分测试
+"""
+
+import json
+
+import pytest
+
+from tests.conftest import payload
+from waizao import range_tool
+from waizao.api import stock_api
+
+DATES = ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05", "2024-01-08"]
+
+
+def test_window_days_by_rows_per_request():
+    assert range_tool.windowDays("getMinuteKLine") == 50000 // 241
+    assert range_tool.windowDays("getMinuteKLine", codes=50) == 50000 // (241 * 50)
+    assert range_tool.windowDays("getDayKLine", 101, 50) == 1000
+    assert range_tool.windowDays("getLevel2TimeDeal", codes=50) == 1
+
+
+def test_plan_windows_disjoint():
+    assert range_tool.planWindows(DATES, 2) == [("2024-01-02", "2024-01-03"), ("2024-01-04", "2024-01-05"),
+                                                ("2024-01-08", "2024-01-08")]
+    assert range_tool.planWindows([], 2) == []
+
+
+def test_all_uses_single_day_windows():
+    chunks = range_tool.planChunks(stock_api.getDayKLine, "all")
+    assert chunks == ["all"]
+    assert range_tool.chunkDays("getDayKLine", 101, chunks) == 1
+    assert range_tool.chunkDays("getDayKLine", 101, chunks, days=30) == 1
+    assert range_tool.chunkDays("getDayKLine", 101, ["600000"], days=30) == 30
+
+
+@pytest.mark.parametrize("func", [stock_api.getMinuteKLine, stock_api.getLevel2TimeDeal])
+def test_all_rejected_when_unsupported(func):
+    assert not range_tool.supportsAll(func)
+    with pytest.raises(ValueError):
+        range_tool.planChunks(func, "all")
+
+
+def test_range_request_all(mock_api):
+    adapter = mock_api(lambda endpoint, params: payload([{"code": "600000", "tdate": params["startDate"]}]))
+    text = range_tool.rangeRequest(stock_api.getDayKLine, "all", "2024-01-01", "2024-01-31", "t", dates=DATES,
+                                   type=1, ktype=101, fq=0)
+    assert sorted((params["startDate"], params["endDate"]) for _, params in adapter.calls) == \
+        [(date, date) for date in DATES]
+    assert [row["tdate"] for row in json.loads(text)["data"]] == DATES
+
+
+def test_stitch_keeps_rows_with_same_time():
+    # 分时成交同一秒内可能有多笔相同的成交
+    deal = {"code": "600000", "tdate": "2024-01-02", "ttime": "09:30:00", "price": 10.0, "volume": 100}
+    text = range_tool.stitch([payload([deal, deal]), payload([dict(deal, tdate="2024-01-03")])])
+    assert len(json.loads(text)["data"]) == 3
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 客户端限流测试
+"""
+
+import asyncio
+import threading
+import time
+
+from waizao.api import rate_limit
+from waizao.api.rate_limit import RateLimiter
+from waizao.api.rate_limit import TokenBucket
+
+
+def test_burst_then_rate():
+    bucket = TokenBucket(rate=50, burst=5)
+    start = time.monotonic()
+    for _ in range(10):
+        bucket.acquire()
+    # 前5个令牌立即获取，之后每个令牌等待1/50秒
+    assert 0.08 <= time.monotonic() - start < 0.5
+
+
+def test_try_acquire():
+    bucket = TokenBucket(rate=10, burst=1)
+    assert bucket.tryAcquire() == 0
+    assert 0 < bucket.tryAcquire() <= 0.1
+
+
+def test_priority_order():
+    bucket = TokenBucket(rate=20, burst=1)
+    bucket.acquire()
+    order = []
+    threads = [threading.Thread(target=lambda p=p: (bucket.acquire(p), order.append(p)))
+               for p in (rate_limit.PRIORITY_BULK, rate_limit.PRIORITY_DEFAULT, rate_limit.PRIORITY_REALTIME)]
+    with bucket._condition:
+        # 持有锁时启动，保证三个等待者同时排队
+        for thread in threads:
+            thread.start()
+        while len(bucket._waiters) < 3:
+            bucket._condition.wait(0.01)
+    for thread in threads:
+        thread.join()
+    assert order == [rate_limit.PRIORITY_REALTIME, rate_limit.PRIORITY_DEFAULT, rate_limit.PRIORITY_BULK]
+
+
+def test_groups_and_priorities():
+    limiter = RateLimiter(limits={"indicator": (5, 10)})
+    assert limiter.group("getIndicatorTaMacd") == "indicator"
+    assert limiter.group("getDayKLine") == "getDayKLine"
+    assert limiter.priority("getWatchStockTimeKLine") == rate_limit.PRIORITY_REALTIME
+    assert limiter.priority("getDayKLine") == rate_limit.PRIORITY_DEFAULT
+    with rate_limit.priority(rate_limit.PRIORITY_BULK):
+        assert limiter.priority("getWatchStockTimeKLine") == rate_limit.PRIORITY_BULK
+    limiter.acquire("getIndicatorTaMacd")
+    assert limiter.buckets["indicator"].tokens < 10
+    assert limiter.bucket.tokens < 40
+
+
+def test_acquire_async():
+    limiter = RateLimiter(rate=50, burst=2)
+
+    async def run():
+        await asyncio.gather(*[limiter.acquireAsync("getDayKLine") for _ in range(6)])
+
+    start = time.monotonic()
+    asyncio.run(run())
+    assert 0.06 <= time.monotonic() - start < 0.5
+
+
+def test_set_limiter():
+    limiter = RateLimiter()
+    previous = rate_limit.setLimiter(limiter)
+    try:
+        assert rate_limit.getLimiter() is limiter
+    finally:
+        rate_limit.setLimiter(previous)
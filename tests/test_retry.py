@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 失败重试和错误识别测试
+"""
+
+import asyncio
+import json
+
+import pytest
+import requests
+
+from tests.conftest import ROWS
+from tests.conftest import klineParams
+from tests.conftest import payload
+from waizao.api import errors
+from waizao.api.retry import RetryBudget
+from waizao.api.retry import RetryPolicy
+
+
+@pytest.mark.parametrize("text, error", [
+    (payload([], 500, "令牌无效"), errors.TokenError),
+    (payload([], 500, "请求过于频繁，请稍后再试"), errors.ThrottleError),
+    (payload([], 500, "今日调用次数已用完"), errors.ApiError),
+])
+def test_check_response(text, error):
+    with pytest.raises(error):
+        errors.checkResponse("getDayKLine", 200, text)
+
+
+def test_is_transient():
+    assert errors.isTransient(errors.HttpError("busy", 503, "getDayKLine"))
+    assert errors.isTransient(requests.exceptions.ConnectionError("reset"))
+    assert not errors.isTransient(errors.HttpError("not found", 404, "getDayKLine"))
+    assert not errors.isTransient(ValueError("参数错误"))
+
+
+def test_delay_bounds():
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+    assert all(0 <= policy.delay(0) <= 1 for _ in range(100))
+    assert all(0 <= policy.delay(10) <= 5 for _ in range(100))
+
+
+def test_budget_limits_retries():
+    budget = RetryBudget(ratio=0, min_retries=2)
+    policy = RetryPolicy(max_retries=5, base_delay=0, budget=budget)
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise errors.HttpError("busy", 503, "getDayKLine")
+
+    with pytest.raises(errors.HttpError):
+        policy.call(fail)
+    assert len(calls) == 3
+    with pytest.raises(errors.HttpError):
+        policy.call(fail)
+    assert len(calls) == 4
+
+
+def test_call_async():
+    failures = [errors.HttpError("bad gateway", 502, "getDayKLine")]
+
+    async def func():
+        if failures:
+            raise failures.pop()
+        return "ok"
+
+    assert asyncio.run(RetryPolicy(base_delay=0).callAsync(func)) == "ok"
+
+
+def test_retry_transient_errors(mock_client):
+    responses = iter([(503, "busy"), payload([], 429, "请求过于频繁"), payload(ROWS)])
+    client, adapter = mock_client(lambda endpoint, params: next(responses))
+    assert json.loads(client.request("getDayKLine", klineParams()))["data"] == ROWS
+    assert len(adapter.calls) == 3
+
+
+def test_retry_connection_error(mock_client):
+    failures = [requests.exceptions.ConnectionError("reset")]
+
+    def handler(endpoint, params):
+        if failures:
+            raise failures.pop()
+        return payload(ROWS)
+
+    client, adapter = mock_client(handler)
+    client.request("getDayKLine", klineParams())
+    assert len(adapter.calls) == 2
+
+
+@pytest.mark.parametrize("message, error", [
+    ("令牌无效", errors.TokenError),
+    ("今日调用次数已用完", errors.ApiError),
+])
+def test_no_retry_on_permanent_errors(mock_client, message, error):
+    client, adapter = mock_client(lambda endpoint, params: payload([], 500, message))
+    with pytest.raises(error):
+        client.request("getDayKLine", klineParams())
+    assert len(adapter.calls) == 1
+
+
+def test_retry_gives_up(mock_client):
+    client, adapter = mock_client(lambda endpoint, params: (502, "bad gateway"),
+                                  retry=RetryPolicy(max_retries=2, base_delay=0))
+    with pytest.raises(errors.HttpError):
+        client.request("getDayKLine", klineParams())
+    assert len(adapter.calls) == 3
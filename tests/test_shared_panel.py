@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 共享内存K线面板测试
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from waizao.store import SharedPanel
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _bars(n: int = 100) -> pd.DataFrame:
+    return pd.DataFrame({
+        "code": np.repeat(["600000", "000001"], n),
+        "name": np.repeat(["浦发银行", "平安银行"], n),
+        "tdate": np.tile(pd.date_range("2024-01-01", periods=n), 2),
+        "close": np.arange(2 * n, dtype="float64"),
+    })
+
+
+@pytest.fixture
+def name():
+    value = "wz-test-%s" % uuid.uuid4().hex[:8]
+    yield value
+    try:
+        SharedPanel.attach(name=value, timeout=0).unlink()
+    except (FileNotFoundError, TimeoutError):
+        pass
+
+
+def test_publish_attach(name):
+    panel = SharedPanel.publish(_bars(), name=name)
+    other = SharedPanel.attach(name=name)
+    assert other.codes() == ["000001", "600000"]
+    assert other.read("000001")["close"].tolist() == list(range(100, 200))
+    assert not other.columns["close"].flags.writeable
+    frame = other.frame("600000")
+    assert frame["name"].unique().tolist() == ["浦发银行"]
+    assert len(frame) == 100
+    other.close()
+    panel.close()
+
+
+def test_views_outlive_close(tmp_path, name):
+    # close后已取出的视图仍然可读，不能解除映射导致访问已释放的内存
+    path = str(tmp_path / "day.panel")
+    code = textwrap.dedent("""
+        import sys
+        from waizao.store import SharedPanel
+        panel = SharedPanel.attach(%s)
+        view = panel.read("000001")["close"]
+        panel.close()
+        print(view.sum())
+    """)
+    SharedPanel.publish(_bars(), path=path).close()
+    SharedPanel.publish(_bars(), name=name).close()
+    for target in ("path=%r" % path, "name=%r" % name):
+        result = subprocess.run([sys.executable, "-c", code % target], cwd=ROOT, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert float(result.stdout) == sum(range(100, 200))
+
+
+def test_load_calls_loader_once(tmp_path, name):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return _bars()
+
+    path = str(tmp_path / "day.panel")
+    with ThreadPoolExecutor(8) as executor:
+        panels = list(executor.map(lambda _: SharedPanel.load(path=path, loader=loader), range(8)))
+    assert len(calls) == 1
+    assert all(panel.read("600000")["close"][0] == 0 for panel in panels)
+
+    calls.clear()
+    first = SharedPanel.load(name=name, loader=loader)
+    second = SharedPanel.load(name=name, loader=loader)
+    assert len(calls) == 1
+    assert second.read("000001")["close"][-1] == 199
+    first.close()
+    second.close()
+
+
+def test_load_after_failed_loader(name):
+    def broken():
+        raise RuntimeError("加载失败")
+
+    with pytest.raises(RuntimeError):
+        SharedPanel.load(name=name, loader=broken)
+    panel = SharedPanel.load(name=name, loader=_bars, timeout=1)
+    assert panel.rows == 200
+    panel.close()
+
+
+def test_load_after_killed_loader(name):
+    # 加载进程在持有锁时被杀死，锁随进程释放，之后的load不需要等待超时
+    code = textwrap.dedent("""
+        import os
+        from waizao.store import SharedPanel
+        SharedPanel.load(name=%r, loader=lambda: os._exit(1))
+    """)
+    result = subprocess.run([sys.executable, "-c", code % name], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 1, result.stderr
+    panel = SharedPanel.load(name=name, loader=_bars, timeout=1)
+    assert panel.codes() == ["000001", "600000"]
+    panel.close()
+
+
+def test_load_replaces_incomplete_publish(name):
+    # 发布方写入过程中退出，留下没有标记的共享内存
+    stale = shared_memory.SharedMemory(name=name, create=True, size=4096)
+    stale.close()
+    panel = SharedPanel.load(name=name, loader=_bars, timeout=1)
+    assert panel.read("600000")["close"][0] == 0
+    panel.close()
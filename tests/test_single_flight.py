@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 请求合并测试
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.conftest import klineParams
+from tests.conftest import payload
+from tests.conftest import projectRows
+from waizao.api import errors
+from waizao.api.single_flight import SingleFlight
+from waizao.api.single_flight import flightKey
+
+
+def test_flight_key():
+    params = klineParams()
+    assert flightKey("getDayKLine", params) == flightKey("getDayKLine", dict(reversed(params.items())))
+    # token参与计算，不同令牌的请求不合并
+    assert flightKey("getDayKLine", params) != flightKey("getDayKLine", klineParams(token="other"))
+    assert flightKey("getDayKLine", params) != flightKey("getDayKLine", params, "get")
+
+
+def test_sequential_calls_not_shared():
+    flight = SingleFlight()
+    assert [flight.call("key", lambda: value) for value in range(3)] == [0, 1, 2]
+    assert flight.stats() == {"calls": 3, "shared": 0, "inflight": 0}
+
+
+def test_call_shares_result():
+    flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return "result"
+
+    with ThreadPoolExecutor(4) as executor:
+        first = executor.submit(flight.call, "key", slow)
+        started.wait()
+        others = [executor.submit(flight.call, "key", slow) for _ in range(3)]
+        assert [future.result() for future in [first] + others] == ["result"] * 4
+    assert len(calls) == 1
+    assert flight.stats()["shared"] == 3
+
+
+def test_call_async_shares_result():
+    flight = SingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*[flight.callAsync("key", slow) for _ in range(4)])
+
+    assert asyncio.run(run()) == ["result"] * 4
+    assert len(calls) == 1
+
+
+def test_call_async_shares_errors():
+    flight = SingleFlight()
+
+    async def broken():
+        await asyncio.sleep(0.05)
+        raise errors.ApiError("参数错误", 500, "getDayKLine")
+
+    async def run():
+        return await asyncio.gather(*[flight.callAsync("key", broken) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, errors.ApiError) for result in results)
+    assert flight.stats()["shared"] == 2
+
+
+def test_single_flight_coalesces_concurrent_requests(mock_client):
+    client, adapter = mock_client(projectRows, delay=0.2)
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: client.request("getDailyMarket", klineParams()), range(8)))
+    assert len(set(results)) == 1
+    assert len(adapter.calls) == 1
+    assert client.single_flight.stats()["shared"] == 7
+
+
+def test_single_flight_shares_errors(mock_client):
+    client, adapter = mock_client(lambda endpoint, params: payload([], 500, "参数错误"), delay=0.2)
+
+    def call(_):
+        with pytest.raises(errors.ApiError):
+            client.request("getDailyMarket", klineParams())
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(call, range(4)))
+    assert len(adapter.calls) == 1
+
+
+def test_single_flight_disabled(mock_client):
+    client, adapter = mock_client(projectRows, delay=0.1, single_flight=False)
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda _: client.request("getDailyMarket", klineParams()), range(4)))
+    assert len(adapter.calls) == 4
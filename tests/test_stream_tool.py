@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: Csv数据流式下载测试
+"""
+
+import gzip
+
+import pandas as pd
+import pytest
+
+from tests.conftest import payload
+from waizao import stream_tool
+from waizao.api import errors
+from waizao.api import stock_api
+
+ROWS = ["600000,浦发银行,2024-01-02 09:31:00,%s" % (10 + index / 100) for index in range(50)]
+CSV = "﻿code,name,tdate,close\n代码,名称,交易时间,收盘价\n" + "\n".join(ROWS) + "\n"
+
+KWARGS = {"type": 1, "code": "600000", "startDate": "2024-01-02", "endDate": "2024-01-02", "fields": "all",
+          "token": "t", "filter": ""}
+
+
+def test_request_params():
+    endpoint, params, method = stream_tool.requestParams(stock_api.getMinuteKLine, dict(KWARGS, export=1))
+    assert endpoint == "getMinuteKLine"
+    assert params["export"] == 4
+    assert method == "post"
+
+
+def test_download(mock_api, tmp_path):
+    adapter = mock_api(lambda endpoint, params: CSV)
+    file = stream_tool.download(stock_api.getMinuteKLine, str(tmp_path / "minute.csv.gz"), "gzip", chunk_size=7,
+                                **KWARGS)
+    with gzip.open(file, "rt", encoding="utf-8") as f:
+        assert f.read() == CSV
+    assert adapter.calls[0][1]["export"] == "4"
+    assert [path.name for path in tmp_path.iterdir()] == ["minute.csv.gz"]
+
+
+def test_download_error_leaves_no_file(mock_api, tmp_path):
+    mock_api(lambda endpoint, params: payload([], 500, "参数错误"))
+    with pytest.raises(errors.ApiError):
+        stream_tool.download(stock_api.getMinuteKLine, str(tmp_path / "minute.csv"), **KWARGS)
+    assert list(tmp_path.iterdir()) == []
+    with pytest.raises(ValueError):
+        stream_tool.download(stock_api.getMinuteKLine, str(tmp_path / "minute.csv"), "bz2", **KWARGS)
+
+
+def test_iter_rows(mock_api):
+    mock_api(lambda endpoint, params: CSV)
+    # 响应块很小，行和多字节字符都会被拆开
+    frames = list(stream_tool.iterRows(stock_api.getMinuteKLine, batch_rows=20, schema=False, chunk_size=5, **KWARGS))
+    assert len(frames) > 1
+    df = pd.concat(frames, ignore_index=True)
+    assert df.columns.tolist() == ["code", "name", "tdate", "close"]
+    assert len(df) == len(ROWS)
+    assert df["code"].unique().tolist() == ["600000"]
+    assert df["name"].unique().tolist() == ["浦发银行"]
+    assert df["close"].tolist() == pytest.approx([10 + index / 100 for index in range(50)])
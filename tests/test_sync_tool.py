@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 增量同步测试
+"""
+
+import pytest
+
+from tests.conftest import payload
+from waizao import calendar_tool
+from waizao import sync_tool
+from waizao.api import stock_api
+
+DATES = ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05", "2024-01-08", "2024-01-09"]
+
+
+class _Store:
+
+    def __init__(self):
+        self.frames = []
+
+    def write(self, df, type, ktype, fq):
+        self.frames.append((df, type, ktype, fq))
+
+
+@pytest.fixture(autouse=True)
+def calendar():
+    calendar_tool.setCalendar(1, calendar_tool.TradeCalendar(DATES, "2024-01-01", "2024-12-31"))
+    yield
+    calendar_tool.setCalendar(1, None)
+
+
+def _bars(endpoint, params):
+    return payload([{"code": code, "tdate": params["startDate"][:10], "close": 10.0}
+                    for code in params["code"].split(",")])
+
+
+def test_kline_sync_uses_windows(mock_api, tmp_path):
+    adapter = mock_api(_bars)
+    store = _Store()
+    codes = ["%06d" % i for i in range(50)]
+    engine = sync_tool.SyncEngine("t", str(tmp_path / "sync.json"))
+    engine.addKLine("minute", store, stock_api.getMinuteKLine, codes, 1, 1, update_key="分线数据",
+                    initial_date="2024-01-01")
+    tasks = engine.pending({"分线数据": "2024-01-09 15:30:00"})
+    assert tasks == {"minute": ("2024-01-01", "2024-01-09", "2024-01-09 15:30:00")}
+    engine.datasets["minute"]["fetch"]("2024-01-01", "2024-01-09")
+    # 50只股票的1分钟K线每个请求最多4个交易日
+    assert sorted((params["startDate"], params["endDate"]) for _, params in adapter.calls) == [
+        ("2024-01-02 00:00:00", "2024-01-05 23:59:59"), ("2024-01-08 00:00:00", "2024-01-09 23:59:59")]
+    assert sum(len(df) for df, *_ in store.frames) == 100
+    assert {tuple(key) for _, *key in store.frames} == {(1, 1, 0)}
+
+
+def test_kline_sync_all_by_day(mock_api, tmp_path):
+    adapter = mock_api(_bars)
+    engine = sync_tool.SyncEngine("t", str(tmp_path / "sync.json"))
+    engine.addKLine("day", _Store(), stock_api.getDayKLine, "all", 1, 101)
+    engine.datasets["day"]["fetch"]("2024-01-04", "2024-01-08")
+    assert sorted((params["startDate"], params["endDate"]) for _, params in adapter.calls) == [
+        (date, date) for date in ("2024-01-04", "2024-01-05", "2024-01-08")]
+
+
+def test_kline_sync_rejects_unsupported_all(tmp_path):
+    engine = sync_tool.SyncEngine("t", str(tmp_path / "sync.json"))
+    with pytest.raises(ValueError):
+        engine.addKLine("minute", _Store(), stock_api.getMinuteKLine, "all", 1, 1)
+
+
+def test_pending_high_water(tmp_path):
+    engine = sync_tool.SyncEngine("t", str(tmp_path / "sync.json"))
+    engine.add("day", lambda start, end: None, "日线数据", initial_date="2024-01-01")
+    engine.state["day"] = {"date": "2024-01-05", "updated": "2024-01-05 16:00:00"}
+    assert engine.pending({"日线数据": "2024-01-05 16:00:00"}) == {}
+    assert engine.pending({"日线数据": "2024-01-08 16:00:00"}) == {
+        "day": ("2024-01-05", "2024-01-08", "2024-01-08 16:00:00")}
+
+
+def test_pending_unknown_update_key(tmp_path):
+    engine = sync_tool.SyncEngine("t", str(tmp_path / "sync.json"))
+    engine.add("day", lambda start, end: None, "日线数据")
+    with pytest.raises(ValueError):
+        engine.pending({"日线": "2024-01-08 16:00:00"})
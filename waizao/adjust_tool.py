@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，本地复权工具。只保存不复权K线（fq为0）和复权因子（getFuQuanYinZi）或除权除息数据（getChuQuanChuXi），
+      通过按股票代码的累积因子向量化计算前复权、后复权的开高低收，不必按fq分别下载三份K线；
+      新的除权除息发生后，已有的前复权数据乘以新事件的比例即可完成重新基准，无需重新下载历史数据
+http://www.waizaowang.com/
+"""
+
+import numpy as np
+import pandas as pd
+
+# 复权信息，取值范围：0|不复权；1|前复权；2|后复权
+FQ_NONE = 0
+FQ_FORWARD = 1
+FQ_BACKWARD = 2
+
+# 由除权除息数据计算因子时，累积因子的起始日期
+EPOCH = np.datetime64("1970-01-01", "s")
+
+# 需要复权的价格字段
+PRICE_FIELDS = ("open", "close", "high", "low", "zrsp", "avg", "price")
+
+# 复权因子的标准字段：股票代码、除权除息日、累积因子
+FACTOR_COLUMNS = ("code", "tdate", "factor")
+
+# 除权除息的标准字段：股票代码、除权除息日、每股派息（元）、每股送转股、每股配股、配股价（元）
+ACTION_COLUMNS = ("code", "tdate", "cash", "bonus", "rights", "rights_price")
+
+
+def _standardize(df: pd.DataFrame, columns: dict, required: tuple) -> pd.DataFrame:
+    if columns:
+        df = df.rename(columns=columns)
+    missing = [column for column in required if column not in df.columns]
+    if missing:
+        raise ValueError("缺少字段%s，可通过columns参数指定字段对应关系" % ",".join(missing))
+    df = df.assign(code=df["code"].astype(str), tdate=pd.to_datetime(df["tdate"]).astype("datetime64[s]"))
+    return df.sort_values(["code", "tdate"], kind="stable").reset_index(drop=True)
+
+
+def actionRatios(bars: pd.DataFrame, actions: pd.DataFrame, per: int = 1) -> pd.DataFrame:
+    """
+    计算每次除权除息的价格比例：除权参考价 / 除权除息日前一交易日收盘价，
+    除权参考价 = (前收盘价 - 每股派息 + 每股配股 × 配股价) / (1 + 每股送转股 + 每股配股)
+    :param bars    : 不复权K线，包含code、tdate、close字段
+    :param actions : 除权除息数据，包含ACTION_COLUMNS中的字段，缺少的数量字段按0处理
+    :param per     : 派息、送转股、配股数量的单位，例如数据为每10股派息时取10
+    :return: pandas.DataFrame，字段为code、tdate、ratio
+    """
+    actions = actions.copy()
+    for column in ACTION_COLUMNS[2:]:
+        values = pd.to_numeric(actions[column], errors="coerce") if column in actions.columns else 0.0
+        actions[column] = np.nan_to_num(np.asarray(values, dtype="float64") * np.ones(len(actions)))
+    actions[["cash", "bonus", "rights"]] /= per
+    actions = actions.assign(code=actions["code"].astype(str))
+    closes = bars[["code", "tdate", "close"]].rename(columns={"close": "prev_close"})
+    closes = closes.assign(code=closes["code"].astype(str),
+                           prev_close=pd.to_numeric(closes["prev_close"], errors="coerce").astype("float64"))
+    merged = pd.merge_asof(actions.sort_values("tdate", kind="stable"), closes.sort_values("tdate", kind="stable"),
+                           on="tdate", by="code", direction="backward", allow_exact_matches=False)
+    prev_close = merged["prev_close"].to_numpy()
+    reference = (prev_close - merged["cash"].to_numpy() + merged["rights"].to_numpy() *
+                 merged["rights_price"].to_numpy()) / (1 + merged["bonus"].to_numpy() + merged["rights"].to_numpy())
+    ratio = reference / prev_close
+    # 没有前收盘价（例如上市首日之前的事件）的除权除息不影响K线
+    ratio = np.where(np.isfinite(ratio) & (ratio > 0), ratio, 1.0)
+    result = pd.DataFrame({"code": merged["code"].to_numpy(), "tdate": merged["tdate"].to_numpy(), "ratio": ratio})
+    return result.sort_values(["code", "tdate"], kind="stable").reset_index(drop=True)
+
+
+def ratiosToFactors(ratios: pd.DataFrame) -> pd.DataFrame:
+    """
+    将每次除权除息的价格比例转换为累积因子：除权除息日及之后的K线乘以之前所有比例倒数的累积乘积
+    :param ratios : actionRatios的返回值
+    :return: pandas.DataFrame，字段为code、tdate、factor
+    """
+    factor = (1.0 / ratios["ratio"]).groupby(ratios["code"], sort=False).cumprod()
+    return pd.DataFrame({"code": ratios["code"].to_numpy(), "tdate": ratios["tdate"].to_numpy(),
+                         "factor": factor.to_numpy()})
+
+
+class AdjustEngine:
+    """
+    本地复权引擎。累积因子为按日期的阶梯函数g(t)：后复权价 = 价格 × g(t) / g(最早)，前复权价 = 价格 × g(t) / g(最新)，
+    因此前复权和后复权可以由同一份因子得到，getFuQuanYinZi的前复权或后复权因子均可使用。
+    后复权以因子表中最早的因子为基准，因子表应覆盖上市以来的所有除权除息
+    """
+
+    def __init__(self, factors: pd.DataFrame = None, columns: dict = None):
+        """
+        :param factors : 复权因子，包含code、tdate、factor字段，例如export_tool.toDataFrame(stock_api.getFuQuanYinZi(...))
+        :param columns : 字段对应关系，例如{"rq": "tdate", "yz": "factor"}
+        """
+        self.factors = pd.DataFrame({"code": pd.Series(dtype=object), "tdate": pd.Series(dtype="datetime64[s]"),
+                                     "factor": pd.Series(dtype="float64")})
+        if factors is not None:
+            self.addFactors(factors, columns)
+
+    def addFactors(self, factors: pd.DataFrame, columns: dict = None):
+        """
+        添加复权因子，相同 (code, tdate) 的因子以新数据为准
+        :param factors : 复权因子，包含code、tdate、factor字段
+        :param columns : 字段对应关系
+        """
+        factors = _standardize(factors, columns, FACTOR_COLUMNS)
+        factors = factors.assign(factor=pd.to_numeric(factors["factor"], errors="coerce").astype("float64"))
+        factors = factors.loc[factors["factor"] > 0, list(FACTOR_COLUMNS)]
+        merged = pd.concat([self.factors, factors], ignore_index=True)
+        merged = merged.drop_duplicates(["code", "tdate"], keep="last")
+        self.factors = merged.sort_values(["code", "tdate"], kind="stable").reset_index(drop=True)
+
+    def addActions(self, bars: pd.DataFrame, actions: pd.DataFrame, columns: dict = None, per: int = 1):
+        """
+        由除权除息数据计算累积因子并添加。已有因子的股票，已有因子先还原为每次除权除息的比例，与新的比例按日期合并后
+        从其第一个因子重新累积，因此新的除权除息可以早于已有的因子；早于该股票第一个因子的除权除息无法定位，抛出ValueError
+        :param bars    : 不复权K线，包含code、tdate、close字段，需包含每个除权除息日之前的交易日
+        :param actions : 除权除息数据，例如export_tool.toDataFrame(stock_api.getChuQuanChuXi(...))
+        :param columns : 除权除息数据的字段对应关系，对应到ACTION_COLUMNS
+        :param per     : 派息、送转股、配股数量的单位，例如数据为每10股派息时取10
+        """
+        actions = _standardize(actions, columns, ACTION_COLUMNS[:2])
+        bars = _standardize(bars, None, ("code", "tdate", "close"))
+        ratios = actionRatios(bars, actions, per)
+        known = self.factors.set_index(["code", "tdate"]).index
+        ratios = ratios[~pd.MultiIndex.from_frame(ratios[["code", "tdate"]]).isin(known)]
+        if ratios.empty:
+            return
+        first = self.factors.groupby("code", sort=False)["tdate"].first()
+        early = ratios["tdate"].to_numpy() <= first.reindex(ratios["code"]).to_numpy(dtype="datetime64[s]")
+        if early.any():
+            codes = ",".join(pd.unique(ratios.loc[early, "code"]))
+            raise ValueError("股票%s的除权除息日不晚于已有的第一个复权因子，无法计算累积因子" % codes)
+        existing = self.factors[self.factors["code"].isin(ratios["code"])]
+        previous = existing.groupby("code", sort=False)["factor"].shift(1)
+        steps = existing[previous.notna()]
+        steps = pd.DataFrame({"code": steps["code"].to_numpy(), "tdate": steps["tdate"].to_numpy(),
+                              "ratio": (previous[previous.notna()] / steps["factor"]).to_numpy()})
+        # 新股票从EPOCH的因子1开始累积，第一次除权除息之前的K线不复权
+        origin = existing[previous.isna()][list(FACTOR_COLUMNS)]
+        fresh = pd.unique(ratios.loc[~ratios["code"].isin(origin["code"]), "code"])
+        origin = pd.concat([origin, pd.DataFrame({"code": fresh, "tdate": np.full(len(fresh), EPOCH), "factor": 1.0})],
+                           ignore_index=True)
+        combined = pd.concat([steps, ratios], ignore_index=True).sort_values(["code", "tdate"], kind="stable")
+        factors = ratiosToFactors(combined.reset_index(drop=True))
+        base = origin.set_index("code")["factor"].reindex(factors["code"]).to_numpy(dtype="float64")
+        factors = factors.assign(factor=factors["factor"].to_numpy() * base)
+        self.addFactors(pd.concat([origin, factors], ignore_index=True))
+
+    def factorAt(self, codes, tdates) -> np.ndarray:
+        """
+        获取每根K线对应的累积因子g(t)，第一个因子之前的K线取该股票的第一个因子
+        :param codes  : 每根K线的股票代码
+        :param tdates : 每根K线的交易时间
+        :return: numpy.ndarray，float64
+        """
+        bars = pd.DataFrame({"code": np.asarray(codes).astype(str),
+                             "tdate": pd.to_datetime(tdates).astype("datetime64[s]"),
+                             "row": np.arange(len(codes))})
+        factors = self.factors.assign(code=self.factors["code"].astype(str))
+        merged = pd.merge_asof(bars.sort_values("tdate", kind="stable"), factors.sort_values("tdate", kind="stable"),
+                               on="tdate", by="code", direction="backward")
+        first = self.factors.groupby("code", sort=False)["factor"].first()
+        factor = merged["factor"].fillna(merged["code"].map(first)).fillna(1.0).to_numpy()
+        result = np.empty(len(bars))
+        result[merged["row"].to_numpy()] = factor
+        return result
+
+    def scale(self, codes, tdates, fq: int) -> np.ndarray:
+        """
+        计算每根K线价格的复权乘数
+        :param codes  : 每根K线的股票代码
+        :param tdates : 每根K线的交易时间
+        :param fq     : 复权信息，取值范围：0|不复权；1|前复权；2|后复权
+        :return: numpy.ndarray，float64
+        """
+        if fq == FQ_NONE:
+            return np.ones(len(codes))
+        if fq not in (FQ_FORWARD, FQ_BACKWARD):
+            raise ValueError("复权信息%s无效，取值范围：0|不复权；1|前复权；2|后复权" % fq)
+        codes = pd.Series(np.asarray(codes).astype(str))
+        grouped = self.factors.groupby("code", sort=False)["factor"]
+        base = codes.map(grouped.last() if fq == FQ_FORWARD else grouped.first()).fillna(1.0).to_numpy()
+        return self.factorAt(codes.to_numpy(), tdates) / base
+
+    def adjust(self, bars: pd.DataFrame, fq: int, fields=PRICE_FIELDS, volume: bool = False) -> pd.DataFrame:
+        """
+        计算复权K线，原DataFrame不变
+        例如：engine.adjust(store.readFrame(1, 101, 0, codes), 1)
+        :param bars   : 不复权K线，包含code、tdate及价格字段
+        :param fq     : 复权信息，取值范围：0|不复权；1|前复权；2|后复权
+        :param fields : 需要复权的价格字段，不存在的字段忽略
+        :param volume : 是否同时按比例调整成交量（成交量除以复权乘数），默认不调整
+        :return: pandas.DataFrame
+        """
+        if fq == FQ_NONE or bars.empty:
+            return bars.copy()
+        scale = self.scale(bars["code"].to_numpy(), bars["tdate"], fq)
+        return bars.assign(**_scaled(bars, scale, fields, volume))
+
+    def rebase(self, adjusted: pd.DataFrame, factors: pd.DataFrame, columns: dict = None,
+               fields=PRICE_FIELDS, volume: bool = False) -> pd.DataFrame:
+        """
+        添加新的复权因子，并将已计算好的前复权K线重新基准：每根K线乘以 新的复权乘数 / 旧的复权乘数，
+        新的除权除息日及之后的K线不变，只对有新因子的股票生效，不需要不复权K线和重新下载
+        :param adjusted : 已计算好的前复权K线，包含code、tdate字段
+        :param factors  : 新的复权因子，包含code、tdate、factor字段
+        :param columns  : 字段对应关系
+        :param fields   : 需要复权的价格字段
+        :param volume   : 前复权K线的成交量是否经过调整
+        :return: pandas.DataFrame，重新基准后的前复权K线
+        """
+        before = self.factors
+        self.addFactors(factors, columns)
+        return self._rebase(adjusted, before, fields, volume)
+
+    def rebaseActions(self, adjusted: pd.DataFrame, bars: pd.DataFrame, actions: pd.DataFrame,
+                      columns: dict = None, per: int = 1, fields=PRICE_FIELDS, volume: bool = False) -> pd.DataFrame:
+        """
+        由新的除权除息数据重新基准前复权K线，参数同addActions和rebase
+        :param adjusted : 已计算好的前复权K线
+        :param bars     : 不复权K线，只需包含新的除权除息日之前的最后一个交易日
+        :param actions  : 新的除权除息数据
+        :return: pandas.DataFrame
+        """
+        before = self.factors
+        self.addActions(bars, actions, columns, per)
+        return self._rebase(adjusted, before, fields, volume)
+
+    def _rebase(self, adjusted: pd.DataFrame, before: pd.DataFrame, fields, volume: bool) -> pd.DataFrame:
+        # 按K线逐行计算 新的前复权乘数 / 旧的前复权乘数，原来没有因子的股票旧乘数为1（前复权价即不复权价）
+        if adjusted.empty:
+            return adjusted.copy()
+        previous = AdjustEngine()
+        previous.factors = before
+        codes = adjusted["code"].astype(str).to_numpy()
+        tdates = adjusted["tdate"].to_numpy()
+        scale = self.scale(codes, tdates, FQ_FORWARD) / previous.scale(codes, tdates, FQ_FORWARD)
+        return adjusted.assign(**_scaled(adjusted, scale, fields, volume))
+
+
+def _scaled(bars: pd.DataFrame, scale: np.ndarray, fields, volume: bool) -> dict:
+    columns = {}
+    for field in fields:
+        if field in bars.columns:
+            values = pd.to_numeric(bars[field], errors="coerce")
+            dtype = values.dtype if values.dtype.kind == "f" else np.dtype("float64")
+            columns[field] = (values.to_numpy(dtype="float64") * scale).astype(dtype)
+    if volume and "cjl" in bars.columns:
+        columns["cjl"] = pd.to_numeric(bars["cjl"], errors="coerce").to_numpy(dtype="float64") / scale
+    return columns
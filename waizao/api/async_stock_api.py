@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，stock_api.py的异步版本。函数名、参数、返回值均与stock_api.py保持一致，所有函数均为async def协程，
+      共享同一个AsyncHttpClient连接池，适合一次性并发请求大量股票代码。
+http://www.waizaowang.com/
+"""
+
+import inspect
+
+from waizao.api import rate_limit
+from waizao.api import stock_api
+from waizao.api.http_client import AsyncHttpClient
+
+_client = None
+
+
+def getClient() -> AsyncHttpClient:
+    """
+    获取全局异步客户端，首次调用时创建，与同步的全局客户端共享rate_limit.getLimiter()限流
+    """
+    global _client
+    if _client is None:
+        _client = AsyncHttpClient(rate_limiter=rate_limit.getLimiter())
+    return _client
+
+
+def setClient(client):
+    """
+    替换全局异步客户端，返回原客户端。client只需实现协程方法request(endpoint, params, method)
+    :param client : AsyncHttpClient或兼容的客户端对象
+    """
+    global _client
+    previous = _client
+    _client = client
+    return previous
+
+
+# 兼容早期版本的函数名
+get_client = getClient
+set_client = setClient
+
+
+async def request(endpoint: str, params: dict, method: str = "post") -> str:
+    """
+    使用全局异步客户端发送请求
+    :param endpoint : 接口名称
+    :param params   : 请求参数
+    :param method   : 请求方式，post或get
+    """
+    return await getClient().request(endpoint, params, method)
+
+
+async def close():
+    """
+    关闭全局异步客户端的连接池
+    """
+    if _client is not None:
+        await _client.close()
+
+
+def _mirror(func):
+    # stock_api中的接口均按签名顺序组装请求参数（method除外），异步版本沿用同样的规则
+    endpoint = func.__name__
+    signature = inspect.signature(func)
+    keys = [name for name in signature.parameters if name != "method"]
+
+    async def coroutine(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        params = {key: bound.arguments[key] for key in keys}
+        return await request(endpoint, params, bound.arguments["method"])
+
+    coroutine.__name__ = endpoint
+    coroutine.__qualname__ = endpoint
+    coroutine.__doc__ = func.__doc__
+    coroutine.__signature__ = signature
+    coroutine.__module__ = __name__
+    return coroutine
+
+
+__all__ = ["getClient", "setClient", "get_client", "set_client", "request", "close"]
+
+for _name, _func in inspect.getmembers(stock_api, inspect.isfunction):
+    if _func.__module__ == stock_api.__name__ and not _name.startswith("_"):
+        globals()[_name] = _mirror(_func)
+        __all__.append(_name)
+
+del _name, _func
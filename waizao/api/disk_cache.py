@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，接口响应的本地磁盘缓存。以接口名称和请求参数（不含token）计算缓存键，
+      结束日期早于今天的历史数据永久缓存，包含今天的数据短期缓存，缓存总大小超限时按LRU淘汰
+http://www.waizaowang.com/
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from waizao.api import errors
+
+# 历史数据不会再变化的接口，默认只缓存这些接口
+HISTORY_ENDPOINTS = (
+    "getDayKLine",
+    "getHourKLine",
+    "getMinuteKLine",
+    "getFuQuanYinZi",
+    "getChuQuanChuXi",
+)
+
+# 不参与缓存键计算的参数
+IGNORED_PARAMS = ("token",)
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".waizao", "cache")
+
+
+def normalizeParams(params: dict) -> dict:
+    """
+    规范化请求参数：去掉token及空值，所有取值转为字符串，并按参数名排序
+    :param params : 请求参数
+    """
+    return {key: str(params[key]) for key in sorted(params)
+            if key not in IGNORED_PARAMS and params[key] is not None}
+
+
+def cacheKey(endpoint: str, params: dict) -> str:
+    """
+    计算缓存键，sha256(接口名称 + 规范化参数)
+    :param endpoint : 接口名称
+    :param params   : 请求参数
+    """
+    content = json.dumps([endpoint, normalizeParams(params)], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def isCacheable(text: str) -> bool:
+    """
+    判断响应是否可以缓存，空响应和错误响应不缓存
+    :param text : 响应字符串
+    """
+    if not text:
+        return False
+    code = errors.responseCode(text)
+    return code is None or code == errors.SUCCESS_CODE
+
+
+class DiskCache:
+    """
+    接口响应的本地磁盘缓存，线程安全。
+    每条缓存为一个文件，第一行为过期时间戳（0表示永不过期），其余为响应字符串。
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, max_size: int = 2 * 1024 ** 3, today_ttl: int = 300,
+                 endpoints=HISTORY_ENDPOINTS):
+        """
+        :param path      : 缓存目录
+        :param max_size  : 缓存总大小上限，单位字节，超出后按最近最少使用淘汰
+        :param today_ttl : 日期范围包含今天（或之后）的数据的缓存时间，单位秒
+        :param endpoints : 需要缓存的接口名称，为None时缓存所有接口
+        """
+        self.path = path
+        self.max_size = max_size
+        self.today_ttl = today_ttl
+        self.endpoints = None if endpoints is None else set(endpoints)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._index = None
+        self._size = 0
+        self._fields = {}
+
+    def accepts(self, endpoint: str) -> bool:
+        """
+        判断接口是否启用缓存
+        :param endpoint : 接口名称
+        """
+        return self.endpoints is None or endpoint in self.endpoints
+
+    def ttl(self, endpoint: str, params: dict):
+        """
+        计算缓存时间，结束日期早于今天返回None（永久缓存），否则返回today_ttl
+        :param endpoint : 接口名称
+        :param params   : 请求参数
+        """
+        end_date = str(params.get("endDate") or "")[:10]
+        if end_date and end_date < datetime.date.today().isoformat():
+            return None
+        return self.today_ttl
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key)
+
+    def _loadIndex(self):
+        # 首次使用时扫描缓存目录，按修改时间排序恢复LRU顺序
+        if self._index is not None:
+            return
+        entries = []
+        if os.path.isdir(self.path):
+            for root, _, files in os.walk(self.path):
+                for name in files:
+                    if name.startswith("."):
+                        continue
+                    stat = os.stat(os.path.join(root, name))
+                    entries.append((stat.st_mtime, name, stat.st_size))
+        entries.sort()
+        self._index = OrderedDict((name, size) for _, name, size in entries)
+        self._size = sum(self._index.values())
+
+    def fieldSets(self, endpoint: str, params: dict) -> list:
+        """
+        获取除fields外参数相同的请求已缓存过的fields取值，总是包含all，用于按字段投影已缓存的响应。
+        除all外只记录本进程内写入或命中的请求
+        :param endpoint : 接口名称
+        :param params   : 请求参数
+        """
+        key = cacheKey(endpoint, dict(params, fields=None))
+        with self._lock:
+            return ["all"] + sorted(self._fields.get(key, ()))
+
+    def _rememberFields(self, endpoint: str, params: dict):
+        fields = params.get("fields")
+        if fields is None or str(fields).strip() == "all":
+            return
+        if len(self._fields) >= 10000:
+            self._fields.clear()
+        self._fields.setdefault(cacheKey(endpoint, dict(params, fields=None)), set()).add(str(fields))
+
+    def get(self, endpoint: str, params: dict, count: bool = True):
+        """
+        读取缓存，未命中或已过期返回None
+        :param endpoint : 接口名称
+        :param params   : 请求参数
+        :param count    : 是否计入命中和未命中次数；一次请求查找多个缓存键时传False，最后调用record计数一次
+        """
+        if not self.accepts(endpoint):
+            return None
+        key = cacheKey(endpoint, params)
+        with self._lock:
+            self._loadIndex()
+            if key not in self._index:
+                self.misses += count
+                return None
+            file = self._file(key)
+            try:
+                with open(file, "r", encoding="utf-8", newline="") as f:
+                    expires = float(f.readline())
+                    if expires and expires < time.time():
+                        text = None
+                    else:
+                        text = f.read()
+            except (OSError, ValueError):
+                text = None
+            if text is None:
+                self._remove(key)
+                self.misses += count
+                return None
+            self._index.move_to_end(key)
+            os.utime(file)
+            self._rememberFields(endpoint, params)
+            self.hits += count
+            return text
+
+    def record(self, hit: bool):
+        """
+        计入一次命中或未命中，与get(..., count=False)配合使用
+        :param hit : 是否命中
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def put(self, endpoint: str, params: dict, text: str):
+        """
+        写入缓存，写临时文件后重命名，保证文件完整
+        :param endpoint : 接口名称
+        :param params   : 请求参数
+        :param text     : 响应字符串
+        """
+        if not self.accepts(endpoint) or not isCacheable(text):
+            return
+        key = cacheKey(endpoint, params)
+        ttl = self.ttl(endpoint, params)
+        expires = 0 if ttl is None else time.time() + ttl
+        file = self._file(key)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        fd, temp = tempfile.mkstemp(prefix=".", dir=os.path.dirname(file))
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write("%s\n" % expires)
+            f.write(text)
+        os.replace(temp, file)
+        size = os.path.getsize(file)
+        with self._lock:
+            self._loadIndex()
+            self._size += size - self._index.pop(key, 0)
+            self._index[key] = size
+            self._rememberFields(endpoint, params)
+            while self._size > self.max_size and len(self._index) > 1:
+                self._remove(next(iter(self._index)))
+                self.evictions += 1
+
+    def _remove(self, key: str):
+        self._size -= self._index.pop(key, 0)
+        try:
+            os.remove(self._file(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        清空缓存
+        """
+        with self._lock:
+            self._loadIndex()
+            for key in list(self._index):
+                self._remove(key)
+
+    def stats(self) -> dict:
+        """
+        缓存统计信息，包括命中次数、未命中次数、淘汰次数、缓存条数和缓存大小
+        """
+        with self._lock:
+            self._loadIndex()
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "entries": len(self._index), "size": self._size}
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，接口异常。接口返回 {"code": 200, "message": "执行成功", "data": [...]}，
+      code不为200或HTTP状态码异常时抛出对应的异常，避免错误信息被当作数据写入文件或传给toDataFrame
+http://www.waizaowang.com/
+"""
+
+import asyncio
+import json
+import re
+
+import requests
+
+SUCCESS_CODE = 200
+
+_RESPONSE_CODE = re.compile(r'^\s*\{\s*"code"\s*:\s*(-?\d+)')
+
+# 根据错误信息识别异常类型的关键字
+TOKEN_KEYWORDS = ("token", "令牌", "登录", "权限")
+THROTTLE_KEYWORDS = ("频繁", "限流", "稍后再试", "rate limit", "too many")
+
+
+class WaizaoError(Exception):
+    """
+    歪枣网接口异常的基类
+    """
+
+    def __init__(self, message: str, code: int = None, endpoint: str = None):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+        self.endpoint = endpoint
+
+    def __str__(self):
+        return "%s[code=%s]: %s" % (self.endpoint or "", self.code, self.message)
+
+
+class HttpError(WaizaoError):
+    """
+    HTTP状态码异常，5xx为临时错误，可重试
+    """
+
+    @property
+    def transient(self) -> bool:
+        return self.code is not None and self.code >= 500
+
+
+class TokenError(WaizaoError):
+    """
+    令牌为空、无效或无权限
+    """
+
+    transient = False
+
+
+class ThrottleError(WaizaoError):
+    """
+    请求过于频繁被服务端限流，可重试
+    """
+
+    transient = True
+
+
+class ApiError(WaizaoError):
+    """
+    其他接口错误，例如参数错误
+    """
+
+    transient = False
+
+
+def responseCode(text: str):
+    """
+    读取响应开头的code字段，非Json响应（Txt、Csv）返回None
+    :param text : 响应字符串
+    """
+    match = _RESPONSE_CODE.match(text[:64]) if text else None
+    return None if match is None else int(match.group(1))
+
+
+def checkResponse(endpoint: str, status: int, text: str):
+    """
+    校验响应，异常时抛出HttpError、TokenError、ThrottleError或ApiError
+    :param endpoint : 接口名称
+    :param status   : HTTP状态码
+    :param text     : 响应字符串
+    """
+    if status == 429:
+        raise ThrottleError(text[:200], status, endpoint)
+    if status >= 400:
+        raise HttpError(text[:200], status, endpoint)
+    if not text:
+        raise ApiError("响应为空", None, endpoint)
+    code = responseCode(text)
+    if code is None or code == SUCCESS_CODE:
+        return
+    try:
+        message = str(json.loads(text).get("message", ""))
+    except ValueError:
+        message = text[:200]
+    lowered = message.lower()
+    if any(keyword in lowered for keyword in THROTTLE_KEYWORDS):
+        raise ThrottleError(message, code, endpoint)
+    if any(keyword in lowered for keyword in TOKEN_KEYWORDS):
+        raise TokenError(message, code, endpoint)
+    raise ApiError(message, code, endpoint)
+
+
+def isTransient(error: Exception) -> bool:
+    """
+    判断异常是否为可重试的临时错误，包括限流、5xx以及网络连接和超时
+    :param error : 异常
+    """
+    if isinstance(error, WaizaoError):
+        return bool(getattr(error, "transient", False))
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                          requests.exceptions.ChunkedEncodingError, asyncio.TimeoutError)):
+        return True
+    try:
+        import aiohttp
+    except ImportError:
+        return False
+    return isinstance(error, aiohttp.ClientConnectionError)
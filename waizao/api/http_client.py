@@ -0,0 +1,407 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，共享的HTTP连接池客户端，stock_api.py中所有接口均通过本模块发送请求
+http://www.waizaowang.com/
+"""
+
+import asyncio
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from waizao import fields_tool
+from waizao import filter_tool
+from waizao.api import errors
+from waizao.api import rate_limit
+from waizao.api.retry import RetryPolicy
+from waizao.api.single_flight import SingleFlight
+from waizao.api.single_flight import flightKey
+
+BASE_URL = "http://api.waizaowang.com/doc/"
+
+# 接口根地址的环境变量，例如指向本地的waizao-proxy：WAIZAO_BASE_URL=http://127.0.0.1:8787/doc/
+BASE_URL_ENV = "WAIZAO_BASE_URL"
+
+# 默认超时时间，(连接超时, 读取超时)，单位秒
+DEFAULT_TIMEOUT = (5, 60)
+
+# 数据量较大的接口使用更长的读取超时
+DEFAULT_TIMEOUTS = {
+    "getMinuteKLine": (5, 180),
+    "getHourKLine": (5, 120),
+    "getDayKLine": (5, 120),
+    "getDailyMarket": (5, 120),
+    "getLevel2TimeDeal": (5, 180),
+}
+
+# 可以在本地按fields投影、按filter重新筛选的数据导出类型：1|Json字符串；3|Json文件；5|DataFrame格式
+JSON_EXPORTS = ("1", "3", "5")
+
+
+class HttpClient:
+    """
+    基于requests.Session的连接池客户端，复用TCP连接（keep-alive），并开启gzip压缩传输。
+    可通过setClient替换为自定义客户端，或通过mount挂载自定义Transport（例如测试用的Mock Adapter）。
+    """
+
+    def __init__(self, base_url: str = None, pool_connections: int = 10, pool_maxsize: int = 50,
+                 timeout: tuple = DEFAULT_TIMEOUT, timeouts: dict = None, headers: dict = None,
+                 session: requests.Session = None, cache=None, rate_limiter=None, retry: RetryPolicy = None,
+                 validate: bool = True, single_flight=True, field_planner=None):
+        """
+        :param base_url         : 接口根地址，例如：http://api.waizaowang.com/doc/，为空时跟随getBaseUrl()
+        :param pool_connections : 连接池缓存的主机数量
+        :param pool_maxsize     : 每个主机的最大连接数，多线程并发时应不小于线程数
+        :param timeout          : 默认超时时间，(连接超时, 读取超时)
+        :param timeouts         : 按接口名称配置的超时时间，例如：{"getMinuteKLine": (5, 300)}
+        :param headers          : 额外的请求头
+        :param session          : 自定义的requests.Session，为空时自动创建
+        :param cache            : 响应缓存，例如disk_cache.DiskCache()，为空时不缓存
+        :param rate_limiter     : 限流器，例如rate_limit.RateLimiter()，为空时不限流
+        :param retry            : 重试策略，为空时使用默认的RetryPolicy()，不重试可传RetryPolicy(max_retries=0)
+        :param validate         : 是否校验响应，校验失败时抛出errors中的异常
+        :param single_flight    : 请求合并，True|合并相同的并发请求；False|不合并；也可以传入共享的SingleFlight
+        :param field_planner    : 字段放宽策略，例如fields_tool.FieldPlanner()，启用缓存时将部分字段的请求放宽为all
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+        if headers:
+            session.headers.update(headers)
+        self.session = session
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry or RetryPolicy()
+        self.validate = validate
+        self.single_flight = _singleFlight(single_flight)
+        self.field_planner = field_planner
+
+    @property
+    def base_url(self) -> str:
+        # 未指定接口根地址时跟随getBaseUrl()，setBaseUrl之后立即生效
+        return self._base_url or _normalizeUrl(getBaseUrl())
+
+    @base_url.setter
+    def base_url(self, value: str):
+        self._base_url = value and _normalizeUrl(value)
+
+    def url(self, endpoint: str) -> str:
+        """
+        获取接口的请求地址
+        :param endpoint : 接口名称，例如：getDayKLine
+        """
+        return self.base_url + endpoint
+
+    def getTimeout(self, endpoint: str) -> tuple:
+        """
+        获取接口的超时时间
+        :param endpoint : 接口名称
+        """
+        return self.timeouts.get(endpoint, self.timeout)
+
+    # 兼容早期版本的方法名
+    get_timeout = getTimeout
+
+    def mount(self, prefix: str, adapter):
+        """
+        挂载自定义Transport，例如测试时使用的Mock Adapter
+        :param prefix  : 地址前缀，例如：http://
+        :param adapter : requests.adapters.BaseAdapter的实现
+        """
+        self.session.mount(prefix, adapter)
+
+    def send(self, endpoint: str, params: dict, method: str = "post", stream: bool = False) -> requests.Response:
+        """
+        发送请求，返回requests.Response
+        :param endpoint : 接口名称
+        :param params   : 请求参数
+        :param method   : 请求方式，post或get
+        :param stream   : 是否流式读取响应体
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(endpoint)
+        http_method = "POST" if method == "post" else "GET"
+        return self.session.request(http_method, self.url(endpoint), params=params,
+                                    timeout=self.getTimeout(endpoint), stream=stream)
+
+    def request(self, endpoint: str, params: dict, method: str = "post") -> str:
+        """
+        发送请求，返回响应字符串
+        :param endpoint : 接口名称
+        :param params   : 请求参数
+        :param method   : 请求方式，post或get
+        """
+        if self.cache is not None and self.cache.accepts(endpoint):
+            # 精确查找和超集查找都不计数，每次请求只计入一次命中或未命中
+            text = self.cache.get(endpoint, params, count=False)
+            if text is None:
+                text = self._fromSuperset(endpoint, params)
+            self.cache.record(text is not None)
+            if text is not None:
+                return text
+        fetch_params = params
+        if (self.field_planner is not None and self.cache is not None and self.cache.accepts(endpoint)
+                and self._isJson(params)):
+            fetch_params = self.field_planner.plan(endpoint, params)
+        if self.single_flight is None:
+            text = self._load(endpoint, fetch_params, method)
+        else:
+            text = self.single_flight.call(flightKey(endpoint, fetch_params, method),
+                                           lambda: self._load(endpoint, fetch_params, method))
+        if fetch_params is not params:
+            projected = fields_tool.project(text, params.get("fields"))
+            if projected is not None:
+                return projected
+            text = self._load(endpoint, params, method)
+        return text
+
+    @staticmethod
+    def _isJson(params: dict) -> bool:
+        return str(params.get("export")) in JSON_EXPORTS
+
+    def _fromSuperset(self, endpoint: str, params: dict):
+        # 未命中时查找字段包含所请求字段（例如fields为all）、或filter为空的已缓存请求，在本地投影和筛选
+        if not self._isJson(params):
+            return None
+        fields = params.get("fields")
+        expr = str(params.get("filter") or "").strip()
+        field_options = [fields] + [option for option in self.cache.fieldSets(endpoint, params)
+                                    if option != fields and fields_tool.covers(fields, option)]
+        filter_options = [expr, ""] if expr else [expr]
+        for option in field_options:
+            for superset_filter in filter_options:
+                if option == fields and superset_filter == expr:
+                    continue
+                text = self.cache.get(endpoint, dict(params, fields=option, filter=superset_filter), count=False)
+                if text is None:
+                    continue
+                try:
+                    if superset_filter != expr:
+                        text = filter_tool.filterResponse(text, expr)
+                except filter_tool.FilterError:
+                    continue
+                text = fields_tool.project(text, fields)
+                if text is not None:
+                    return text
+        return None
+
+    def _load(self, endpoint: str, params: dict, method: str) -> str:
+        text = self.retry.call(lambda: self._fetch(endpoint, params, method))
+        if self.cache is not None:
+            self.cache.put(endpoint, params, text)
+        return text
+
+    def _fetch(self, endpoint: str, params: dict, method: str) -> str:
+        response = self.send(endpoint, params, method)
+        text = response.text
+        if self.validate:
+            errors.checkResponse(endpoint, response.status_code, text)
+        return text
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncHttpClient:
+    """
+    基于aiohttp的异步客户端，所有协程共享同一个连接池，并通过信号量限制同时在途的请求数量。
+    需要安装aiohttp：pip install waizao[async]
+    """
+
+    def __init__(self, base_url: str = None, concurrency: int = 100, timeout: tuple = DEFAULT_TIMEOUT,
+                 timeouts: dict = None, headers: dict = None, rate_limiter=None, retry: RetryPolicy = None,
+                 validate: bool = True, single_flight=True):
+        """
+        :param base_url    : 接口根地址，例如：http://api.waizaowang.com/doc/，为空时跟随getBaseUrl()
+        :param concurrency : 同时在途的最大请求数量
+        :param timeout     : 默认超时时间，(连接超时, 读取超时)
+        :param timeouts    : 按接口名称配置的超时时间，例如：{"getMinuteKLine": (5, 300)}
+        :param headers     : 额外的请求头
+        :param rate_limiter : 限流器，可与同步客户端共享同一个rate_limit.RateLimiter
+        :param retry       : 重试策略，为空时使用默认的RetryPolicy()
+        :param validate    : 是否校验响应，校验失败时抛出errors中的异常
+        :param single_flight : 请求合并，True|合并相同的并发请求；False|不合并；也可以传入共享的SingleFlight
+        """
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.single_flight = _singleFlight(single_flight)
+        self.rate_limiter = rate_limiter
+        self.retry = retry or RetryPolicy()
+        self.validate = validate
+        self.timeout = timeout
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.headers = {"Accept-Encoding": "gzip, deflate"}
+        if headers:
+            self.headers.update(headers)
+        self._session = None
+        self._semaphore = None
+        self._loop = None
+
+    @property
+    def base_url(self) -> str:
+        # 未指定接口根地址时跟随getBaseUrl()，setBaseUrl之后立即生效
+        return self._base_url or _normalizeUrl(getBaseUrl())
+
+    @base_url.setter
+    def base_url(self, value: str):
+        self._base_url = value and _normalizeUrl(value)
+
+    def url(self, endpoint: str) -> str:
+        return self.base_url + endpoint
+
+    def getTimeout(self, endpoint: str) -> tuple:
+        return self.timeouts.get(endpoint, self.timeout)
+
+    # 兼容早期版本的方法名
+    get_timeout = getTimeout
+
+    def _getSession(self):
+        # aiohttp的会话和信号量绑定创建时的事件循环，多次asyncio.run()时每个事件循环重新创建
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("异步接口需要安装aiohttp：pip install waizao[async]") from e
+            connector = aiohttp.TCPConnector(limit=self.concurrency)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+        return self._session
+
+    async def request(self, endpoint: str, params: dict, method: str = "post") -> str:
+        """
+        发送请求，返回响应字符串
+        :param endpoint : 接口名称
+        :param params   : 请求参数
+        :param method   : 请求方式，post或get
+        """
+        if self.single_flight is None:
+            return await self.retry.callAsync(lambda: self._fetch(endpoint, params, method))
+        return await self.single_flight.callAsync(
+            flightKey(endpoint, params, method),
+            lambda: self.retry.callAsync(lambda: self._fetch(endpoint, params, method)))
+
+    async def _fetch(self, endpoint: str, params: dict, method: str) -> str:
+        import aiohttp
+        session = self._getSession()
+        connect, read = self.getTimeout(endpoint)
+        timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        params = {key: value for key, value in params.items() if value is not None}
+        http_method = "POST" if method == "post" else "GET"
+        if self.rate_limiter is not None:
+            acquire = getattr(self.rate_limiter, "acquireAsync", None)
+            if acquire is not None:
+                await acquire(endpoint)
+            else:
+                await asyncio.get_running_loop().run_in_executor(None, self.rate_limiter.acquire, endpoint)
+        async with self._semaphore:
+            async with session.request(http_method, self.url(endpoint), params=params, timeout=timeout) as response:
+                text = await response.text()
+                if self.validate:
+                    errors.checkResponse(endpoint, response.status, text)
+                return text
+
+    async def close(self):
+        # 原事件循环已关闭的会话无法再关闭，直接丢弃
+        if self._session is not None and self._loop is asyncio.get_running_loop():
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+def _singleFlight(value):
+    if value is True:
+        return SingleFlight()
+    return value or None
+
+
+def _normalizeUrl(base_url: str) -> str:
+    return base_url if base_url.endswith("/") else base_url + "/"
+
+
+_base_url = None
+_client = None
+_client_lock = threading.Lock()
+
+
+def getBaseUrl() -> str:
+    """
+    获取默认的接口根地址，优先级：setBaseUrl设置的地址 > 环境变量WAIZAO_BASE_URL > BASE_URL
+    """
+    return _base_url or os.environ.get(BASE_URL_ENV) or BASE_URL
+
+
+def setBaseUrl(base_url: str):
+    """
+    设置默认的接口根地址，例如指向本地的waizao-proxy：setBaseUrl("http://127.0.0.1:8787/doc/")。
+    未指定base_url的客户端（包括同步和异步的全局客户端）立即使用新地址，指定了base_url的客户端不受影响
+    :param base_url : 接口根地址，为None时恢复为环境变量WAIZAO_BASE_URL或BASE_URL
+    """
+    global _base_url
+    _base_url = base_url and _normalizeUrl(base_url)
+
+
+def getClient():
+    """
+    获取全局客户端，首次调用时创建，所有接口共享rate_limit.getLimiter()限流
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient(rate_limiter=rate_limit.getLimiter())
+    return _client
+
+
+def setClient(client):
+    """
+    替换全局客户端，返回原客户端。client只需实现request(endpoint, params, method)方法
+    :param client : HttpClient或兼容的客户端对象，为None时下次请求重新创建默认客户端
+    """
+    global _client
+    with _client_lock:
+        previous = _client
+        _client = client
+    return previous
+
+
+# 兼容早期版本的函数名
+get_client = getClient
+set_client = setClient
+
+
+def request(endpoint: str, params: dict, method: str = "post") -> str:
+    """
+    使用全局客户端发送请求
+    :param endpoint : 接口名称
+    :param params   : 请求参数
+    :param method   : 请求方式，post或get
+    """
+    return getClient().request(endpoint, params, method)
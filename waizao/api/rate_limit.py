@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，客户端限流。令牌桶控制每秒请求数和突发请求数，可按接口分组单独限流，
+      等待中的请求按优先级排队，实时行情等高优先级请求优先于批量回补请求发出
+http://www.waizaowang.com/
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+# 优先级，数值越小越优先
+PRIORITY_REALTIME = 0
+PRIORITY_DEFAULT = 5
+PRIORITY_BULK = 9
+
+# 默认按接口名称设置的优先级
+DEFAULT_PRIORITIES = {
+    "getWatchStockTimeKLine": PRIORITY_REALTIME,
+}
+
+# 接口分组，按接口名称前缀匹配，例如getIndicatorTaMacd属于indicator分组
+DEFAULT_GROUPS = {
+    "getIndicatorTa": "indicator",
+}
+
+# 异步等待时，排在队首之后的等待者检查令牌的间隔，单位秒
+POLL_INTERVAL = 0.005
+
+# 当前线程（或协程）内请求的优先级，协程之间互不影响
+_priority = contextvars.ContextVar("waizao_priority", default=None)
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+@contextmanager
+def priority(value: int):
+    """
+    设置当前线程或协程内请求的优先级，例如批量回补时：with rate_limit.priority(rate_limit.PRIORITY_BULK): ...
+    :param value : 优先级，数值越小越优先
+    """
+    token = _priority.set(value)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def getLimiter():
+    """
+    获取全局共享的限流器，首次调用时以默认参数创建，全局客户端（同步和异步）均使用该限流器
+    """
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter()
+    return _limiter
+
+
+def setLimiter(limiter):
+    """
+    替换全局共享的限流器，返回原限流器。只影响之后创建的全局客户端，已创建的客户端可直接修改rate_limiter属性
+    :param limiter : RateLimiter，为None时下次调用getLimiter重新创建默认限流器
+    """
+    global _limiter
+    with _limiter_lock:
+        previous = _limiter
+        _limiter = limiter
+    return previous
+
+
+class TokenBucket:
+    """
+    令牌桶，每秒补充rate个令牌，最多积累burst个令牌。令牌不足时等待，等待者按 (优先级, 到达顺序) 排队
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        :param rate  : 每秒请求数
+        :param burst : 突发请求数
+        """
+        self.rate = float(rate)
+        self.burst = max(int(burst), 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, priority: int = PRIORITY_DEFAULT):
+        """
+        获取一个令牌，令牌不足时阻塞等待
+        :param priority : 优先级，数值越小越优先
+        """
+        waiter = (priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiters, waiter)
+            try:
+                while True:
+                    self._refill()
+                    if self._waiters[0] == waiter and self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    self._condition.wait((1 - self.tokens) / self.rate if self.tokens < 1 else None)
+            finally:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    async def acquireAsync(self, priority: int = PRIORITY_DEFAULT):
+        """
+        协程版本的acquire，与同步等待者共同排队，令牌不足时以asyncio.sleep等待，不占用线程
+        :param priority : 优先级，数值越小越优先
+        """
+        waiter = (priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiters, waiter)
+        try:
+            while True:
+                with self._condition:
+                    self._refill()
+                    if self._waiters[0] == waiter and self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    delay = (1 - self.tokens) / self.rate if self.tokens < 1 else POLL_INTERVAL
+                await asyncio.sleep(delay)
+        finally:
+            with self._condition:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def tryAcquire(self) -> float:
+        """
+        不等待地获取一个令牌
+        :return: float，获取成功返回0，否则返回预计需要等待的秒数
+        """
+        with self._condition:
+            self._refill()
+            if not self._waiters and self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return max((1 - self.tokens) / self.rate, 0.0) + len(self._waiters) / self.rate
+
+
+class RateLimiter:
+    """
+    客户端限流器，所有请求先经过分组令牌桶（如果有），再经过全局令牌桶
+    例如：http_client.getClient().rate_limiter = RateLimiter(20, 40, limits={"indicator": (5, 10)})
+    """
+
+    def __init__(self, rate: float = 20, burst: int = 40, limits: dict = None, groups: dict = None,
+                 priorities: dict = None):
+        """
+        :param rate       : 全局每秒请求数
+        :param burst      : 全局突发请求数
+        :param limits     : 分组限流，{分组名称: (每秒请求数, 突发请求数)}，分组名称也可以是接口名称
+        :param groups     : 接口分组，{接口名称前缀: 分组名称}，默认getIndicatorTa*属于indicator分组
+        :param priorities : 接口默认优先级，{接口名称: 优先级}，默认getWatchStockTimeKLine为实时优先级
+        """
+        self.bucket = TokenBucket(rate, burst)
+        self.buckets = {name: TokenBucket(*limit) for name, limit in (limits or {}).items()}
+        self.groups = dict(DEFAULT_GROUPS if groups is None else groups)
+        self.priorities = dict(DEFAULT_PRIORITIES if priorities is None else priorities)
+
+    def group(self, endpoint: str) -> str:
+        """
+        获取接口所属分组，未匹配任何前缀时分组名称即接口名称
+        :param endpoint : 接口名称
+        """
+        for prefix, name in self.groups.items():
+            if endpoint.startswith(prefix):
+                return name
+        return endpoint
+
+    def priority(self, endpoint: str) -> int:
+        """
+        获取请求优先级，当前线程或协程通过priority()设置的优先级优先于接口默认优先级
+        :param endpoint : 接口名称
+        """
+        value = _priority.get()
+        if value is not None:
+            return value
+        return self.priorities.get(endpoint, PRIORITY_DEFAULT)
+
+    def acquire(self, endpoint: str, priority: int = None):
+        """
+        请求前调用，令牌不足时阻塞等待
+        :param endpoint : 接口名称
+        :param priority : 优先级，为空时按priority(endpoint)计算
+        """
+        if priority is None:
+            priority = self.priority(endpoint)
+        bucket = self.buckets.get(self.group(endpoint))
+        if bucket is not None:
+            bucket.acquire(priority)
+        self.bucket.acquire(priority)
+
+    async def acquireAsync(self, endpoint: str, priority: int = None):
+        """
+        协程版本的acquire，令牌不足时异步等待
+        :param endpoint : 接口名称
+        :param priority : 优先级，为空时按priority(endpoint)计算
+        """
+        if priority is None:
+            priority = self.priority(endpoint)
+        bucket = self.buckets.get(self.group(endpoint))
+        if bucket is not None:
+            await bucket.acquireAsync(priority)
+        await self.bucket.acquireAsync(priority)
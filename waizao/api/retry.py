@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，失败重试。对限流、5xx、网络连接和超时等临时错误按指数退避（带随机抖动）重试，
+      并通过重试预算限制重试请求占总请求的比例，避免服务端故障时重试风暴
+http://www.waizaowang.com/
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+from waizao.api import errors
+
+
+class RetryBudget:
+    """
+    重试预算，每次请求存入ratio个令牌，每次重试消耗1个令牌，令牌上限为min_retries + ratio * 1000
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        """
+        :param ratio       : 允许重试的请求比例
+        :param min_retries : 预算的初始令牌数，保证请求量较少时也可以重试
+        """
+        self.ratio = ratio
+        self.capacity = min_retries + ratio * 1000
+        self.tokens = float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class RetryPolicy:
+    """
+    重试策略，第n次重试前等待 random(0, min(max_delay, base_delay * 2 ** n)) 秒
+    """
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 30,
+                 budget: RetryBudget = None):
+        """
+        :param max_retries : 单个请求的最大重试次数
+        :param base_delay  : 退避的基础等待时间，单位秒
+        :param max_delay   : 单次等待时间上限，单位秒
+        :param budget      : 重试预算，为空时使用默认预算
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget or RetryBudget()
+
+    def delay(self, attempt: int) -> float:
+        """
+        第attempt次重试前的等待时间
+        :param attempt : 重试次数，从0开始
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def shouldRetry(self, error: Exception, attempt: int) -> bool:
+        """
+        判断出错后是否重试：临时错误、未超过最大重试次数且重试预算充足
+        :param error   : 异常
+        :param attempt : 已重试次数，从0开始
+        """
+        return attempt < self.max_retries and errors.isTransient(error) and self.budget.withdraw()
+
+    def call(self, func):
+        """
+        调用func()，临时错误时重试，重试次数或预算用尽后抛出最后一次的异常
+        :param func : 无参数的请求函数
+        """
+        self.budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                if not self.shouldRetry(e, attempt):
+                    raise
+            time.sleep(self.delay(attempt))
+            attempt += 1
+
+    async def callAsync(self, func):
+        """
+        call的异步版本
+        :param func : 无参数的协程函数
+        """
+        self.budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                if not self.shouldRetry(e, attempt):
+                    raise
+            await asyncio.sleep(self.delay(attempt))
+            attempt += 1
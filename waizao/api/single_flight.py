@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，请求合并（single-flight）。多个线程或协程同时以相同的接口名称和请求参数发起请求时，
+      只有第一个请求真正发送到服务端，其余请求等待并共享同一个结果（或异常），突发的相同请求只消耗一次调用
+http://www.waizaowang.com/
+"""
+
+import asyncio
+import json
+import threading
+
+
+def flightKey(endpoint: str, params: dict, method: str = "post") -> str:
+    """
+    计算请求合并的键：接口名称、请求方式和规范化的请求参数。
+    与缓存键不同，token参与计算，不同令牌的请求不会共享结果
+    :param endpoint : 接口名称
+    :param params   : 请求参数
+    :param method   : 请求方式，post或get
+    """
+    normalized = {key: str(params[key]) for key in sorted(params) if params[key] is not None}
+    return json.dumps([endpoint, method, normalized], ensure_ascii=False, separators=(",", ":"))
+
+
+class _Call:
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    请求合并，线程安全。同一个键同时只有一个在途请求，请求完成后立即移除，之后的请求重新发送
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._flights = {}
+        self._async_flights = {}
+
+    def call(self, key: str, func):
+        """
+        调用func()，若已有相同键的在途请求，则等待并返回该请求的结果
+        :param key  : 请求合并的键，例如flightKey(endpoint, params, method)
+        :param func : 无参数的请求函数
+        """
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Call()
+            else:
+                self.shared += 1
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = func()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    async def callAsync(self, key: str, func):
+        """
+        call的异步版本，在同一个事件循环内合并相同键的协程
+        :param key  : 请求合并的键
+        :param func : 无参数的协程函数
+        """
+        key = (id(asyncio.get_running_loop()), key)
+        self.calls += 1
+        future = self._async_flights.get(key)
+        if future is not None:
+            self.shared += 1
+            return await asyncio.shield(future)
+        future = asyncio.get_running_loop().create_future()
+        self._async_flights[key] = future
+        try:
+            result = await func()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 没有等待者时避免"Future exception was never retrieved"警告
+            future.exception()
+            raise
+        finally:
+            self._async_flights.pop(key, None)
+
+    def stats(self) -> dict:
+        """
+        统计信息，包括请求次数、共享结果的次数和当前在途的请求数量
+        """
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared, "inflight": len(self._flights)}
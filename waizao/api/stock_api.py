@@ -6,9 +6,21 @@ Desc: 歪枣网，财经数据库
 http://www.waizaowang.com/
 """
 
-import requests
+from waizao.api import http_client
 
 
+def getUpdateInfo(fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
+    """
+    记录每日行情、分线数据、时线数据、日线数据等部分接口数据更新时间信息。温馨提示：建议选择左上角菜单栏【浏览模式】查询数据。
+    :param fields    : 数据字段，多个字段之间使用逗号分隔，若获取所有字段，则取值为all。
+     :param export    : 数据导出类型，取值范围：0|Txt字符串；1|Json字符串；2|Txt文件；3|Json文件；4|Csv文件；5|DataFrame格式
+     :param token     : 令牌，登录后可获取
+     :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
+     :return: pandas.DataFrame
+    """
+    params = {"fields": fields,"export": export,"token": token,"filter": filter}
+    return http_client.request("getUpdateInfo", params, method)
+
 def getBaseInfo(type: int, code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
     沪深京A股、沪深京B股、港股、美股、黄金、汇率、Reits、沪深指数、香港指数、全球指数、债券指数、场内基金、沪深债券、行业板块、概念板块、地域板块等范围列表。其中行业数据包括行业板块、概念板块、地域板块；场内基金包括ETF基金和LOF基金。可根据股票代码，调用通用接口中的每日行情、分线数据、时线数据、日线数据等接口。温馨提示：建议选择左上角菜单栏【浏览模式】查询数据。
@@ -20,14 +32,8 @@ def getBaseInfo(type: int, code: str, fields: str, export: int, token: str, filt
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getBaseInfo"
     params = {"type": type,"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getBaseInfo", params, method)
 
 def getStockType(flags: int, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -39,14 +45,8 @@ def getStockType(flags: int, fields: str, export: int, token: str, filter: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockType"
     params = {"flags": flags,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockType", params, method)
 
 def getTradeDate(mtype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -60,14 +60,8 @@ def getTradeDate(mtype: int, startDate: str, endDate: str, fields: str, export:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getTradeDate"
     params = {"mtype": mtype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getTradeDate", params, method)
 
 def getIndicatorMoney(type: int, code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -82,14 +76,8 @@ def getIndicatorMoney(type: int, code: str, startDate: str, endDate: str, fields
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorMoney"
     params = {"type": type,"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorMoney", params, method)
 
 def getIndicatorBaseInfo(type: int, code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -104,14 +92,8 @@ def getIndicatorBaseInfo(type: int, code: str, startDate: str, endDate: str, fie
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorBaseInfo"
     params = {"type": type,"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorBaseInfo", params, method)
 
 def getDailyMarket(type: int, code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -126,14 +108,8 @@ def getDailyMarket(type: int, code: str, startDate: str, endDate: str, fields: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getDailyMarket"
     params = {"type": type,"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getDailyMarket", params, method)
 
 def getMinuteKLine(type: int, code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -148,14 +124,8 @@ def getMinuteKLine(type: int, code: str, startDate: str, endDate: str, fields: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getMinuteKLine"
     params = {"type": type,"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getMinuteKLine", params, method)
 
 def getHourKLine(type: int, code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -171,14 +141,8 @@ def getHourKLine(type: int, code: str, ktype: int, startDate: str, endDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getHourKLine"
     params = {"type": type,"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getHourKLine", params, method)
 
 def getDayKLine(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -195,14 +159,8 @@ def getDayKLine(type: int, code: str, ktype: int, fq: int, startDate: str, endDa
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getDayKLine"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getDayKLine", params, method)
 
 def getLevel2TimeDeal(type: int, code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -217,14 +175,8 @@ def getLevel2TimeDeal(type: int, code: str, startDate: str, endDate: str, fields
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getLevel2TimeDeal"
     params = {"type": type,"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getLevel2TimeDeal", params, method)
 
 def getHangyeCfg(bkcode: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -236,14 +188,8 @@ def getHangyeCfg(bkcode: str, fields: str, export: int, token: str, filter: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getHangyeCfg"
     params = {"bkcode": bkcode,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getHangyeCfg", params, method)
 
 def getZhiShuChengFenGuZhongZhen(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -255,14 +201,8 @@ def getZhiShuChengFenGuZhongZhen(code: str, fields: str, export: int, token: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getZhiShuChengFenGuZhongZhen"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getZhiShuChengFenGuZhongZhen", params, method)
 
 def getZhiShuChengFenGu(mtype: int, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -274,14 +214,8 @@ def getZhiShuChengFenGu(mtype: int, fields: str, export: int, token: str, filter
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getZhiShuChengFenGu"
     params = {"mtype": mtype,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getZhiShuChengFenGu", params, method)
 
 def getWatchStockTimeKLine(type: int, code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -294,14 +228,8 @@ def getWatchStockTimeKLine(type: int, code: str, fields: str, export: int, token
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getWatchStockTimeKLine"
     params = {"type": type,"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getWatchStockTimeKLine", params, method)
 
 def getIndicatorTaAcos(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -319,14 +247,8 @@ def getIndicatorTaAcos(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAcos"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAcos", params, method)
 
 def getIndicatorTaAd(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -343,14 +265,8 @@ def getIndicatorTaAd(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAd"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAd", params, method)
 
 def getIndicatorTaAdOsc(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -369,14 +285,8 @@ def getIndicatorTaAdOsc(type: int, code: str, ktype: int, fq: int, startDate: st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAdOsc"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAdOsc", params, method)
 
 def getIndicatorTaAdd(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -395,14 +305,8 @@ def getIndicatorTaAdd(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAdd"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAdd", params, method)
 
 def getIndicatorTaAdx(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -420,14 +324,8 @@ def getIndicatorTaAdx(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAdx"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAdx", params, method)
 
 def getIndicatorTaAdxr(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -445,14 +343,8 @@ def getIndicatorTaAdxr(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAdxr"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAdxr", params, method)
 
 def getIndicatorTaApo(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, input4: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -473,14 +365,8 @@ def getIndicatorTaApo(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaApo"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"input4": input4,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaApo", params, method)
 
 def getIndicatorTaAroon(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -498,14 +384,8 @@ def getIndicatorTaAroon(type: int, code: str, ktype: int, fq: int, startDate: st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAroon"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAroon", params, method)
 
 def getIndicatorTaAroonOsc(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -523,14 +403,8 @@ def getIndicatorTaAroonOsc(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAroonOsc"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAroonOsc", params, method)
 
 def getIndicatorTaAsin(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -548,14 +422,8 @@ def getIndicatorTaAsin(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAsin"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAsin", params, method)
 
 def getIndicatorTaAtan(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -573,14 +441,8 @@ def getIndicatorTaAtan(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAtan"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAtan", params, method)
 
 def getIndicatorTaAtr(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -598,14 +460,8 @@ def getIndicatorTaAtr(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAtr"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAtr", params, method)
 
 def getIndicatorTaAvgPrice(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -622,14 +478,8 @@ def getIndicatorTaAvgPrice(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaAvgPrice"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaAvgPrice", params, method)
 
 def getIndicatorTaBbands(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, input4: str, input5: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -651,14 +501,8 @@ def getIndicatorTaBbands(type: int, code: str, ktype: int, fq: int, startDate: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaBbands"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"input4": input4,"input5": input5,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaBbands", params, method)
 
 def getIndicatorTaBeta(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -678,14 +522,8 @@ def getIndicatorTaBeta(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaBeta"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaBeta", params, method)
 
 def getIndicatorTaBop(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -702,14 +540,8 @@ def getIndicatorTaBop(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaBop"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaBop", params, method)
 
 def getIndicatorTaCci(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -727,14 +559,8 @@ def getIndicatorTaCci(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCci"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCci", params, method)
 
 def getIndicatorTaCdl2Crows(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -751,14 +577,8 @@ def getIndicatorTaCdl2Crows(type: int, code: str, ktype: int, fq: int, startDate
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdl2Crows"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdl2Crows", params, method)
 
 def getIndicatorTaCdl3BlackCrows(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -775,14 +595,8 @@ def getIndicatorTaCdl3BlackCrows(type: int, code: str, ktype: int, fq: int, star
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdl3BlackCrows"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdl3BlackCrows", params, method)
 
 def getIndicatorTaCdl3Inside(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -799,14 +613,8 @@ def getIndicatorTaCdl3Inside(type: int, code: str, ktype: int, fq: int, startDat
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdl3Inside"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdl3Inside", params, method)
 
 def getIndicatorTaCdl3LineStrike(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -823,14 +631,8 @@ def getIndicatorTaCdl3LineStrike(type: int, code: str, ktype: int, fq: int, star
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdl3LineStrike"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdl3LineStrike", params, method)
 
 def getIndicatorTaCdl3Outside(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -847,14 +649,8 @@ def getIndicatorTaCdl3Outside(type: int, code: str, ktype: int, fq: int, startDa
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdl3Outside"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdl3Outside", params, method)
 
 def getIndicatorTaCdl3StarsInSouth(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -871,14 +667,8 @@ def getIndicatorTaCdl3StarsInSouth(type: int, code: str, ktype: int, fq: int, st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdl3StarsInSouth"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdl3StarsInSouth", params, method)
 
 def getIndicatorTaCdl3WhiteSoldiers(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -895,14 +685,8 @@ def getIndicatorTaCdl3WhiteSoldiers(type: int, code: str, ktype: int, fq: int, s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdl3WhiteSoldiers"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdl3WhiteSoldiers", params, method)
 
 def getIndicatorTaCdlAbandonedBaby(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -920,14 +704,8 @@ def getIndicatorTaCdlAbandonedBaby(type: int, code: str, ktype: int, fq: int, st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlAbandonedBaby"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlAbandonedBaby", params, method)
 
 def getIndicatorTaCdlAdvanceBlock(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -944,14 +722,8 @@ def getIndicatorTaCdlAdvanceBlock(type: int, code: str, ktype: int, fq: int, sta
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlAdvanceBlock"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlAdvanceBlock", params, method)
 
 def getIndicatorTaCdlBeltHold(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -968,14 +740,8 @@ def getIndicatorTaCdlBeltHold(type: int, code: str, ktype: int, fq: int, startDa
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlBeltHold"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlBeltHold", params, method)
 
 def getIndicatorTaCdlBreakaway(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -992,14 +758,8 @@ def getIndicatorTaCdlBreakaway(type: int, code: str, ktype: int, fq: int, startD
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlBreakaway"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlBreakaway", params, method)
 
 def getIndicatorTaCdlClosingMarubozu(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1016,14 +776,8 @@ def getIndicatorTaCdlClosingMarubozu(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlClosingMarubozu"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlClosingMarubozu", params, method)
 
 def getIndicatorTaCdlConcealBabysWall(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1040,14 +794,8 @@ def getIndicatorTaCdlConcealBabysWall(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlConcealBabysWall"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlConcealBabysWall", params, method)
 
 def getIndicatorTaCdlCounterAttack(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1064,14 +812,8 @@ def getIndicatorTaCdlCounterAttack(type: int, code: str, ktype: int, fq: int, st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlCounterAttack"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlCounterAttack", params, method)
 
 def getIndicatorTaCdlDarkCloudCover(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1089,14 +831,8 @@ def getIndicatorTaCdlDarkCloudCover(type: int, code: str, ktype: int, fq: int, s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlDarkCloudCover"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlDarkCloudCover", params, method)
 
 def getIndicatorTaCdlDoji(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1113,14 +849,8 @@ def getIndicatorTaCdlDoji(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlDoji"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlDoji", params, method)
 
 def getIndicatorTaCdlDojiStar(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1137,14 +867,8 @@ def getIndicatorTaCdlDojiStar(type: int, code: str, ktype: int, fq: int, startDa
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlDojiStar"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlDojiStar", params, method)
 
 def getIndicatorTaCdlDragonflyDoji(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1161,14 +885,8 @@ def getIndicatorTaCdlDragonflyDoji(type: int, code: str, ktype: int, fq: int, st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlDragonflyDoji"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlDragonflyDoji", params, method)
 
 def getIndicatorTaCdlEngulfing(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1185,14 +903,8 @@ def getIndicatorTaCdlEngulfing(type: int, code: str, ktype: int, fq: int, startD
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlEngulfing"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlEngulfing", params, method)
 
 def getIndicatorTaCdlEveningDojiStar(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1210,14 +922,8 @@ def getIndicatorTaCdlEveningDojiStar(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlEveningDojiStar"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlEveningDojiStar", params, method)
 
 def getIndicatorTaCdlEveningStar(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1235,14 +941,8 @@ def getIndicatorTaCdlEveningStar(type: int, code: str, ktype: int, fq: int, star
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlEveningStar"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlEveningStar", params, method)
 
 def getIndicatorTaCdlGapSideSideWhite(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1259,14 +959,8 @@ def getIndicatorTaCdlGapSideSideWhite(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlGapSideSideWhite"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlGapSideSideWhite", params, method)
 
 def getIndicatorTaCdlGravestoneDoji(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1283,14 +977,8 @@ def getIndicatorTaCdlGravestoneDoji(type: int, code: str, ktype: int, fq: int, s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlGravestoneDoji"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlGravestoneDoji", params, method)
 
 def getIndicatorTaCdlHammer(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1307,14 +995,8 @@ def getIndicatorTaCdlHammer(type: int, code: str, ktype: int, fq: int, startDate
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlHammer"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlHammer", params, method)
 
 def getIndicatorTaCdlHangingMan(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1331,14 +1013,8 @@ def getIndicatorTaCdlHangingMan(type: int, code: str, ktype: int, fq: int, start
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlHangingMan"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlHangingMan", params, method)
 
 def getIndicatorTaCdlHarami(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1355,14 +1031,8 @@ def getIndicatorTaCdlHarami(type: int, code: str, ktype: int, fq: int, startDate
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlHarami"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlHarami", params, method)
 
 def getIndicatorTaCdlHaramiCross(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1379,14 +1049,8 @@ def getIndicatorTaCdlHaramiCross(type: int, code: str, ktype: int, fq: int, star
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlHaramiCross"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlHaramiCross", params, method)
 
 def getIndicatorTaCdlHignWave(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1403,14 +1067,8 @@ def getIndicatorTaCdlHignWave(type: int, code: str, ktype: int, fq: int, startDa
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlHignWave"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlHignWave", params, method)
 
 def getIndicatorTaCdlHikkake(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1427,14 +1085,8 @@ def getIndicatorTaCdlHikkake(type: int, code: str, ktype: int, fq: int, startDat
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlHikkake"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlHikkake", params, method)
 
 def getIndicatorTaCdlHikkakeMod(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1451,14 +1103,8 @@ def getIndicatorTaCdlHikkakeMod(type: int, code: str, ktype: int, fq: int, start
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlHikkakeMod"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlHikkakeMod", params, method)
 
 def getIndicatorTaCdlHomingPigeon(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1475,14 +1121,8 @@ def getIndicatorTaCdlHomingPigeon(type: int, code: str, ktype: int, fq: int, sta
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlHomingPigeon"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlHomingPigeon", params, method)
 
 def getIndicatorTaCdlIdentical3Crows(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1499,14 +1139,8 @@ def getIndicatorTaCdlIdentical3Crows(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlIdentical3Crows"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlIdentical3Crows", params, method)
 
 def getIndicatorTaCdlInNeck(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1523,14 +1157,8 @@ def getIndicatorTaCdlInNeck(type: int, code: str, ktype: int, fq: int, startDate
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlInNeck"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlInNeck", params, method)
 
 def getIndicatorTaCdlInvertedHammer(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1547,14 +1175,8 @@ def getIndicatorTaCdlInvertedHammer(type: int, code: str, ktype: int, fq: int, s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlInvertedHammer"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlInvertedHammer", params, method)
 
 def getIndicatorTaCdlKicking(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1571,14 +1193,8 @@ def getIndicatorTaCdlKicking(type: int, code: str, ktype: int, fq: int, startDat
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlKicking"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlKicking", params, method)
 
 def getIndicatorTaCdlKickingByLength(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1595,14 +1211,8 @@ def getIndicatorTaCdlKickingByLength(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlKickingByLength"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlKickingByLength", params, method)
 
 def getIndicatorTaCdlLadderBottom(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1619,14 +1229,8 @@ def getIndicatorTaCdlLadderBottom(type: int, code: str, ktype: int, fq: int, sta
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlLadderBottom"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlLadderBottom", params, method)
 
 def getIndicatorTaCdlLongLeggedDoji(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1643,14 +1247,8 @@ def getIndicatorTaCdlLongLeggedDoji(type: int, code: str, ktype: int, fq: int, s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlLongLeggedDoji"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlLongLeggedDoji", params, method)
 
 def getIndicatorTaCdlLongLine(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1667,14 +1265,8 @@ def getIndicatorTaCdlLongLine(type: int, code: str, ktype: int, fq: int, startDa
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlLongLine"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlLongLine", params, method)
 
 def getIndicatorTaCdlMarubozu(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1691,14 +1283,8 @@ def getIndicatorTaCdlMarubozu(type: int, code: str, ktype: int, fq: int, startDa
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlMarubozu"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlMarubozu", params, method)
 
 def getIndicatorTaCdlMatHold(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1716,14 +1302,8 @@ def getIndicatorTaCdlMatHold(type: int, code: str, ktype: int, fq: int, startDat
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlMatHold"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlMatHold", params, method)
 
 def getIndicatorTaCdlMatchingLow(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1740,14 +1320,8 @@ def getIndicatorTaCdlMatchingLow(type: int, code: str, ktype: int, fq: int, star
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlMatchingLow"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlMatchingLow", params, method)
 
 def getIndicatorTaCdlMorningDojiStar(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1765,14 +1339,8 @@ def getIndicatorTaCdlMorningDojiStar(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlMorningDojiStar"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlMorningDojiStar", params, method)
 
 def getIndicatorTaCdlMorningStar(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1790,14 +1358,8 @@ def getIndicatorTaCdlMorningStar(type: int, code: str, ktype: int, fq: int, star
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlMorningStar"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlMorningStar", params, method)
 
 def getIndicatorTaCdlOnNeck(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1814,14 +1376,8 @@ def getIndicatorTaCdlOnNeck(type: int, code: str, ktype: int, fq: int, startDate
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlOnNeck"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlOnNeck", params, method)
 
 def getIndicatorTaCdlPiercing(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1838,14 +1394,8 @@ def getIndicatorTaCdlPiercing(type: int, code: str, ktype: int, fq: int, startDa
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlPiercing"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlPiercing", params, method)
 
 def getIndicatorTaCdlRickshawMan(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1862,14 +1412,8 @@ def getIndicatorTaCdlRickshawMan(type: int, code: str, ktype: int, fq: int, star
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlRickshawMan"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlRickshawMan", params, method)
 
 def getIndicatorTaCdlRiseFall3Methods(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1886,14 +1430,8 @@ def getIndicatorTaCdlRiseFall3Methods(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlRiseFall3Methods"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlRiseFall3Methods", params, method)
 
 def getIndicatorTaCdlSeperatingLines(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1910,14 +1448,8 @@ def getIndicatorTaCdlSeperatingLines(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlSeperatingLines"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlSeperatingLines", params, method)
 
 def getIndicatorTaCdlShootingStar(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1934,14 +1466,8 @@ def getIndicatorTaCdlShootingStar(type: int, code: str, ktype: int, fq: int, sta
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlShootingStar"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlShootingStar", params, method)
 
 def getIndicatorTaCdlShortLine(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1958,14 +1484,8 @@ def getIndicatorTaCdlShortLine(type: int, code: str, ktype: int, fq: int, startD
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlShortLine"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlShortLine", params, method)
 
 def getIndicatorTaCdlSpinningTop(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -1982,14 +1502,8 @@ def getIndicatorTaCdlSpinningTop(type: int, code: str, ktype: int, fq: int, star
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlSpinningTop"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlSpinningTop", params, method)
 
 def getIndicatorTaCdlStalledPattern(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2006,14 +1520,8 @@ def getIndicatorTaCdlStalledPattern(type: int, code: str, ktype: int, fq: int, s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlStalledPattern"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlStalledPattern", params, method)
 
 def getIndicatorTaCdlStickSandwhich(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2030,14 +1538,8 @@ def getIndicatorTaCdlStickSandwhich(type: int, code: str, ktype: int, fq: int, s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlStickSandwhich"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlStickSandwhich", params, method)
 
 def getIndicatorTaCdlTakuri(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2054,14 +1556,8 @@ def getIndicatorTaCdlTakuri(type: int, code: str, ktype: int, fq: int, startDate
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlTakuri"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlTakuri", params, method)
 
 def getIndicatorTaCdlTasukiGap(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2078,14 +1574,8 @@ def getIndicatorTaCdlTasukiGap(type: int, code: str, ktype: int, fq: int, startD
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlTasukiGap"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlTasukiGap", params, method)
 
 def getIndicatorTaCdlThrusting(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2102,14 +1592,8 @@ def getIndicatorTaCdlThrusting(type: int, code: str, ktype: int, fq: int, startD
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlThrusting"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlThrusting", params, method)
 
 def getIndicatorTaCdlTristar(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2126,14 +1610,8 @@ def getIndicatorTaCdlTristar(type: int, code: str, ktype: int, fq: int, startDat
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlTristar"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlTristar", params, method)
 
 def getIndicatorTaCdlUnique3River(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2150,14 +1628,8 @@ def getIndicatorTaCdlUnique3River(type: int, code: str, ktype: int, fq: int, sta
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlUnique3River"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlUnique3River", params, method)
 
 def getIndicatorTaCdlUpsideGap2Crows(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2174,14 +1646,8 @@ def getIndicatorTaCdlUpsideGap2Crows(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlUpsideGap2Crows"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlUpsideGap2Crows", params, method)
 
 def getIndicatorTaCdlXSideGap3Methods(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2198,14 +1664,8 @@ def getIndicatorTaCdlXSideGap3Methods(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCdlXSideGap3Methods"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCdlXSideGap3Methods", params, method)
 
 def getIndicatorTaCeil(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2223,14 +1683,8 @@ def getIndicatorTaCeil(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCeil"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCeil", params, method)
 
 def getIndicatorTaCmo(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2249,14 +1703,8 @@ def getIndicatorTaCmo(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCmo"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCmo", params, method)
 
 def getIndicatorTaCorrel(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2276,14 +1724,8 @@ def getIndicatorTaCorrel(type: int, code: str, ktype: int, fq: int, startDate: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCorrel"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCorrel", params, method)
 
 def getIndicatorTaCos(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2301,14 +1743,8 @@ def getIndicatorTaCos(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCos"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCos", params, method)
 
 def getIndicatorTaCosh(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2326,14 +1762,8 @@ def getIndicatorTaCosh(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaCosh"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaCosh", params, method)
 
 def getIndicatorTaDema(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2352,14 +1782,8 @@ def getIndicatorTaDema(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaDema"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaDema", params, method)
 
 def getIndicatorTaDiv(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2378,14 +1802,8 @@ def getIndicatorTaDiv(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaDiv"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaDiv", params, method)
 
 def getIndicatorTaDx(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2403,14 +1821,8 @@ def getIndicatorTaDx(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaDx"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaDx", params, method)
 
 def getIndicatorTaEma(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2429,14 +1841,8 @@ def getIndicatorTaEma(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaEma"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaEma", params, method)
 
 def getIndicatorTaExp(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2454,14 +1860,8 @@ def getIndicatorTaExp(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaExp"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaExp", params, method)
 
 def getIndicatorTaFloor(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2479,14 +1879,8 @@ def getIndicatorTaFloor(type: int, code: str, ktype: int, fq: int, startDate: st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaFloor"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaFloor", params, method)
 
 def getIndicatorTaHtDcPeriod(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2504,14 +1898,8 @@ def getIndicatorTaHtDcPeriod(type: int, code: str, ktype: int, fq: int, startDat
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaHtDcPeriod"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaHtDcPeriod", params, method)
 
 def getIndicatorTaHtDcPhase(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2529,14 +1917,8 @@ def getIndicatorTaHtDcPhase(type: int, code: str, ktype: int, fq: int, startDate
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaHtDcPhase"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaHtDcPhase", params, method)
 
 def getIndicatorTaHtPhasor(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2554,14 +1936,8 @@ def getIndicatorTaHtPhasor(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaHtPhasor"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaHtPhasor", params, method)
 
 def getIndicatorTaHtSine(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2579,14 +1955,8 @@ def getIndicatorTaHtSine(type: int, code: str, ktype: int, fq: int, startDate: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaHtSine"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaHtSine", params, method)
 
 def getIndicatorTaHtTrendMode(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2604,14 +1974,8 @@ def getIndicatorTaHtTrendMode(type: int, code: str, ktype: int, fq: int, startDa
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaHtTrendMode"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaHtTrendMode", params, method)
 
 def getIndicatorTaHtTrendline(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2629,14 +1993,8 @@ def getIndicatorTaHtTrendline(type: int, code: str, ktype: int, fq: int, startDa
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaHtTrendline"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaHtTrendline", params, method)
 
 def getIndicatorTaKama(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2655,14 +2013,8 @@ def getIndicatorTaKama(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaKama"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaKama", params, method)
 
 def getIndicatorTaLinearReg(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2681,14 +2033,8 @@ def getIndicatorTaLinearReg(type: int, code: str, ktype: int, fq: int, startDate
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaLinearReg"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaLinearReg", params, method)
 
 def getIndicatorTaLinearRegAngle(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2707,14 +2053,8 @@ def getIndicatorTaLinearRegAngle(type: int, code: str, ktype: int, fq: int, star
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaLinearRegAngle"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaLinearRegAngle", params, method)
 
 def getIndicatorTaLinearRegIntercept(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2733,14 +2073,8 @@ def getIndicatorTaLinearRegIntercept(type: int, code: str, ktype: int, fq: int,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaLinearRegIntercept"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaLinearRegIntercept", params, method)
 
 def getIndicatorTaLinearRegSlope(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2759,14 +2093,8 @@ def getIndicatorTaLinearRegSlope(type: int, code: str, ktype: int, fq: int, star
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaLinearRegSlope"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaLinearRegSlope", params, method)
 
 def getIndicatorTaLn(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2784,14 +2112,8 @@ def getIndicatorTaLn(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaLn"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaLn", params, method)
 
 def getIndicatorTaLog10(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2809,14 +2131,8 @@ def getIndicatorTaLog10(type: int, code: str, ktype: int, fq: int, startDate: st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaLog10"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaLog10", params, method)
 
 def getIndicatorTaMacd(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, input4: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2837,14 +2153,8 @@ def getIndicatorTaMacd(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMacd"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"input4": input4,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMacd", params, method)
 
 def getIndicatorTaMacdExt(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, input4: str, input5: str, input6: str, input7: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2868,14 +2178,8 @@ def getIndicatorTaMacdExt(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMacdExt"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"input4": input4,"input5": input5,"input6": input6,"input7": input7,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMacdExt", params, method)
 
 def getIndicatorTaMacdFix(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2894,14 +2198,8 @@ def getIndicatorTaMacdFix(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMacdFix"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMacdFix", params, method)
 
 def getIndicatorTaMama(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2921,14 +2219,8 @@ def getIndicatorTaMama(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMama"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMama", params, method)
 
 def getIndicatorTaMax(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2947,14 +2239,8 @@ def getIndicatorTaMax(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMax"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMax", params, method)
 
 def getIndicatorTaMaxIndex(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2973,14 +2259,8 @@ def getIndicatorTaMaxIndex(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMaxIndex"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMaxIndex", params, method)
 
 def getIndicatorTaMedPrice(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -2997,14 +2277,8 @@ def getIndicatorTaMedPrice(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMedPrice"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMedPrice", params, method)
 
 def getIndicatorTaMfi(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3022,14 +2296,8 @@ def getIndicatorTaMfi(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMfi"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMfi", params, method)
 
 def getIndicatorTaMidPoint(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3048,14 +2316,8 @@ def getIndicatorTaMidPoint(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMidPoint"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMidPoint", params, method)
 
 def getIndicatorTaMidPrice(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3073,14 +2335,8 @@ def getIndicatorTaMidPrice(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMidPrice"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMidPrice", params, method)
 
 def getIndicatorTaMin(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3099,14 +2355,8 @@ def getIndicatorTaMin(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMin"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMin", params, method)
 
 def getIndicatorTaMinIndex(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3125,14 +2375,8 @@ def getIndicatorTaMinIndex(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMinIndex"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMinIndex", params, method)
 
 def getIndicatorTaMinMax(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3151,14 +2395,8 @@ def getIndicatorTaMinMax(type: int, code: str, ktype: int, fq: int, startDate: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMinMax"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMinMax", params, method)
 
 def getIndicatorTaMinMaxIndex(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3177,14 +2415,8 @@ def getIndicatorTaMinMaxIndex(type: int, code: str, ktype: int, fq: int, startDa
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMinMaxIndex"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMinMaxIndex", params, method)
 
 def getIndicatorTaMinusDI(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3202,14 +2434,8 @@ def getIndicatorTaMinusDI(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMinusDI"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMinusDI", params, method)
 
 def getIndicatorTaMinusDM(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3227,14 +2453,8 @@ def getIndicatorTaMinusDM(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMinusDM"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMinusDM", params, method)
 
 def getIndicatorTaMom(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3253,14 +2473,8 @@ def getIndicatorTaMom(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMom"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMom", params, method)
 
 def getIndicatorTaMovingAverage(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3280,14 +2494,8 @@ def getIndicatorTaMovingAverage(type: int, code: str, ktype: int, fq: int, start
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMovingAverage"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMovingAverage", params, method)
 
 def getIndicatorTaMult(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3306,14 +2514,8 @@ def getIndicatorTaMult(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaMult"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaMult", params, method)
 
 def getIndicatorTaNatr(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3331,14 +2533,8 @@ def getIndicatorTaNatr(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaNatr"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaNatr", params, method)
 
 def getIndicatorTaObv(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3356,14 +2552,8 @@ def getIndicatorTaObv(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaObv"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaObv", params, method)
 
 def getIndicatorTaPlusDI(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3381,14 +2571,8 @@ def getIndicatorTaPlusDI(type: int, code: str, ktype: int, fq: int, startDate: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaPlusDI"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaPlusDI", params, method)
 
 def getIndicatorTaPlusDM(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3406,14 +2590,8 @@ def getIndicatorTaPlusDM(type: int, code: str, ktype: int, fq: int, startDate: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaPlusDM"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaPlusDM", params, method)
 
 def getIndicatorTaPpo(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, input4: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3434,14 +2612,8 @@ def getIndicatorTaPpo(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaPpo"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"input4": input4,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaPpo", params, method)
 
 def getIndicatorTaRoc(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3460,14 +2632,8 @@ def getIndicatorTaRoc(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaRoc"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaRoc", params, method)
 
 def getIndicatorTaRocP(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3486,14 +2652,8 @@ def getIndicatorTaRocP(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaRocP"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaRocP", params, method)
 
 def getIndicatorTaRocR(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3512,14 +2672,8 @@ def getIndicatorTaRocR(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaRocR"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaRocR", params, method)
 
 def getIndicatorTaRocR100(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3538,14 +2692,8 @@ def getIndicatorTaRocR100(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaRocR100"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaRocR100", params, method)
 
 def getIndicatorTaRsi(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3564,14 +2712,8 @@ def getIndicatorTaRsi(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaRsi"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaRsi", params, method)
 
 def getIndicatorTaSar(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3590,14 +2732,8 @@ def getIndicatorTaSar(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaSar"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaSar", params, method)
 
 def getIndicatorTaSarExt(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, input4: str, input5: str, input6: str, input7: str, input8: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3622,14 +2758,8 @@ def getIndicatorTaSarExt(type: int, code: str, ktype: int, fq: int, startDate: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaSarExt"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"input4": input4,"input5": input5,"input6": input6,"input7": input7,"input8": input8,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaSarExt", params, method)
 
 def getIndicatorTaSin(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3647,14 +2777,8 @@ def getIndicatorTaSin(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaSin"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaSin", params, method)
 
 def getIndicatorTaSinh(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3672,14 +2796,8 @@ def getIndicatorTaSinh(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaSinh"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaSinh", params, method)
 
 def getIndicatorTaSma(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3698,14 +2816,8 @@ def getIndicatorTaSma(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaSma"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaSma", params, method)
 
 def getIndicatorTaSqrt(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3723,14 +2835,8 @@ def getIndicatorTaSqrt(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaSqrt"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaSqrt", params, method)
 
 def getIndicatorTaStdDev(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3750,14 +2856,8 @@ def getIndicatorTaStdDev(type: int, code: str, ktype: int, fq: int, startDate: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaStdDev"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaStdDev", params, method)
 
 def getIndicatorTaStoch(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, input4: str, input5: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3779,14 +2879,8 @@ def getIndicatorTaStoch(type: int, code: str, ktype: int, fq: int, startDate: st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaStoch"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"input4": input4,"input5": input5,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaStoch", params, method)
 
 def getIndicatorTaStochF(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3806,14 +2900,8 @@ def getIndicatorTaStochF(type: int, code: str, ktype: int, fq: int, startDate: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaStochF"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaStochF", params, method)
 
 def getIndicatorTaStochRsi(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, input4: str, input5: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3835,14 +2923,8 @@ def getIndicatorTaStochRsi(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaStochRsi"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"input4": input4,"input5": input5,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaStochRsi", params, method)
 
 def getIndicatorTaSub(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3861,14 +2943,8 @@ def getIndicatorTaSub(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaSub"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaSub", params, method)
 
 def getIndicatorTaSum(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3887,14 +2963,8 @@ def getIndicatorTaSum(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaSum"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaSum", params, method)
 
 def getIndicatorTaT3(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3914,14 +2984,8 @@ def getIndicatorTaT3(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaT3"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaT3", params, method)
 
 def getIndicatorTaTan(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3939,14 +3003,8 @@ def getIndicatorTaTan(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaTan"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaTan", params, method)
 
 def getIndicatorTaTanh(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3964,14 +3022,8 @@ def getIndicatorTaTanh(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaTanh"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaTanh", params, method)
 
 def getIndicatorTaTema(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -3990,14 +3042,8 @@ def getIndicatorTaTema(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaTema"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaTema", params, method)
 
 def getIndicatorTaTrima(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4016,14 +3062,8 @@ def getIndicatorTaTrima(type: int, code: str, ktype: int, fq: int, startDate: st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaTrima"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaTrima", params, method)
 
 def getIndicatorTaTrix(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4042,14 +3082,8 @@ def getIndicatorTaTrix(type: int, code: str, ktype: int, fq: int, startDate: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaTrix"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaTrix", params, method)
 
 def getIndicatorTaTrueRange(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4066,14 +3100,8 @@ def getIndicatorTaTrueRange(type: int, code: str, ktype: int, fq: int, startDate
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaTrueRange"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaTrueRange", params, method)
 
 def getIndicatorTaTsf(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4092,14 +3120,8 @@ def getIndicatorTaTsf(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaTsf"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaTsf", params, method)
 
 def getIndicatorTaTypPrice(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4116,14 +3138,8 @@ def getIndicatorTaTypPrice(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaTypPrice"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaTypPrice", params, method)
 
 def getIndicatorTaUltOsc(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4143,14 +3159,8 @@ def getIndicatorTaUltOsc(type: int, code: str, ktype: int, fq: int, startDate: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaUltOsc"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaUltOsc", params, method)
 
 def getIndicatorTaVariance(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, input3: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4170,14 +3180,8 @@ def getIndicatorTaVariance(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaVariance"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"input3": input3,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaVariance", params, method)
 
 def getIndicatorTaWclPrice(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4194,14 +3198,8 @@ def getIndicatorTaWclPrice(type: int, code: str, ktype: int, fq: int, startDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaWclPrice"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaWclPrice", params, method)
 
 def getIndicatorTaWillR(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4219,14 +3217,8 @@ def getIndicatorTaWillR(type: int, code: str, ktype: int, fq: int, startDate: st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaWillR"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input": input,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaWillR", params, method)
 
 def getIndicatorTaWma(type: int, code: str, ktype: int, fq: int, startDate: str, endDate: str, input1: str, input2: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4245,14 +3237,8 @@ def getIndicatorTaWma(type: int, code: str, ktype: int, fq: int, startDate: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndicatorTaWma"
     params = {"type": type,"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"input1": input1,"input2": input2,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndicatorTaWma", params, method)
 
 def getStockHSABaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4264,14 +3250,8 @@ def getStockHSABaseInfo(code: str, fields: str, export: int, token: str, filter:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHSABaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHSABaseInfo", params, method)
 
 def getStockHSADailyMarket(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4285,14 +3265,8 @@ def getStockHSADailyMarket(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHSADailyMarket"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHSADailyMarket", params, method)
 
 def getStockHSAMinuteKLine(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4306,14 +3280,8 @@ def getStockHSAMinuteKLine(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHSAMinuteKLine"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHSAMinuteKLine", params, method)
 
 def getStockHSAHourKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4328,14 +3296,8 @@ def getStockHSAHourKLine(code: str, ktype: int, startDate: str, endDate: str, fi
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHSAHourKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHSAHourKLine", params, method)
 
 def getStockHSADayKLine(code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4351,14 +3313,8 @@ def getStockHSADayKLine(code: str, ktype: int, fq: int, startDate: str, endDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHSADayKLine"
     params = {"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHSADayKLine", params, method)
 
 def getStockHSBBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4370,14 +3326,8 @@ def getStockHSBBaseInfo(code: str, fields: str, export: int, token: str, filter:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHSBBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHSBBaseInfo", params, method)
 
 def getStockHSBDailyMarket(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4391,14 +3341,8 @@ def getStockHSBDailyMarket(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHSBDailyMarket"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHSBDailyMarket", params, method)
 
 def getStockHSBMinuteKLine(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4412,14 +3356,8 @@ def getStockHSBMinuteKLine(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHSBMinuteKLine"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHSBMinuteKLine", params, method)
 
 def getStockHSBHourKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4434,14 +3372,8 @@ def getStockHSBHourKLine(code: str, ktype: int, startDate: str, endDate: str, fi
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHSBHourKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHSBHourKLine", params, method)
 
 def getStockHSBDayKLine(code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4457,14 +3389,8 @@ def getStockHSBDayKLine(code: str, ktype: int, fq: int, startDate: str, endDate:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHSBDayKLine"
     params = {"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHSBDayKLine", params, method)
 
 def getStockReName(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4478,14 +3404,8 @@ def getStockReName(code: str, startDate: str, endDate: str, fields: str, export:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockReName"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockReName", params, method)
 
 def getCompanyInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4497,14 +3417,8 @@ def getCompanyInfo(code: str, fields: str, export: int, token: str, filter: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getCompanyInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getCompanyInfo", params, method)
 
 def getStockAccount(fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4515,14 +3429,8 @@ def getStockAccount(fields: str, export: int, token: str, filter: str,  method:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockAccount"
     params = {"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockAccount", params, method)
 
 def getStockTradeDate(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4535,14 +3443,8 @@ def getStockTradeDate(startDate: str, endDate: str, fields: str, export: int, to
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockTradeDate"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockTradeDate", params, method)
 
 def getChuQuanChuXi(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4556,14 +3458,8 @@ def getChuQuanChuXi(code: str, startDate: str, endDate: str, fields: str, export
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getChuQuanChuXi"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getChuQuanChuXi", params, method)
 
 def getFuQuanYinZi(code: str, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4578,14 +3474,8 @@ def getFuQuanYinZi(code: str, fq: int, startDate: str, endDate: str, fields: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getFuQuanYinZi"
     params = {"code": code,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getFuQuanYinZi", params, method)
 
 def getJiGouDiaoYanTongJi(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4599,14 +3489,8 @@ def getJiGouDiaoYanTongJi(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getJiGouDiaoYanTongJi"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getJiGouDiaoYanTongJi", params, method)
 
 def getJiGouDiaoYanXiangXi(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4620,14 +3504,8 @@ def getJiGouDiaoYanXiangXi(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getJiGouDiaoYanXiangXi"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getJiGouDiaoYanXiangXi", params, method)
 
 def getJiGouDiaoYanJiLv(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4639,14 +3517,8 @@ def getJiGouDiaoYanJiLv(code: str, fields: str, export: int, token: str, filter:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getJiGouDiaoYanJiLv"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getJiGouDiaoYanJiLv", params, method)
 
 def getLonghbDetail(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4660,14 +3532,8 @@ def getLonghbDetail(code: str, startDate: str, endDate: str, fields: str, export
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getLonghbDetail"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getLonghbDetail", params, method)
 
 def getLonghbActive(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4680,14 +3546,8 @@ def getLonghbActive(startDate: str, endDate: str, fields: str, export: int, toke
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getLonghbActive"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getLonghbActive", params, method)
 
 def getLonghbJigou(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4701,14 +3561,8 @@ def getLonghbJigou(code: str, startDate: str, endDate: str, fields: str, export:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getLonghbJigou"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getLonghbJigou", params, method)
 
 def getRzRjMarket(mtype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4722,14 +3576,8 @@ def getRzRjMarket(mtype: int, startDate: str, endDate: str, fields: str, export:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getRzRjMarket"
     params = {"mtype": mtype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getRzRjMarket", params, method)
 
 def getRzRjHangye(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4743,14 +3591,8 @@ def getRzRjHangye(code: str, startDate: str, endDate: str, fields: str, export:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getRzRjHangye"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getRzRjHangye", params, method)
 
 def getStockRzRj(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4764,14 +3606,8 @@ def getStockRzRj(code: str, startDate: str, endDate: str, fields: str, export: i
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockRzRj"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockRzRj", params, method)
 
 def getRzRjAccount(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4784,14 +3620,8 @@ def getRzRjAccount(startDate: str, endDate: str, fields: str, export: int, token
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getRzRjAccount"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getRzRjAccount", params, method)
 
 def getStockXQHSADayKLine(code: str, ktype: int, fq: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4807,14 +3637,8 @@ def getStockXQHSADayKLine(code: str, ktype: int, fq: int, startDate: str, endDat
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockXQHSADayKLine"
     params = {"code": code,"ktype": ktype,"fq": fq,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockXQHSADayKLine", params, method)
 
 def getYanBaoStock(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4828,14 +3652,8 @@ def getYanBaoStock(code: str, startDate: str, endDate: str, fields: str, export:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getYanBaoStock"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getYanBaoStock", params, method)
 
 def getYanBaoXinGu(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4848,14 +3666,8 @@ def getYanBaoXinGu(startDate: str, endDate: str, fields: str, export: int, token
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getYanBaoXinGu"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getYanBaoXinGu", params, method)
 
 def getYanBaoHangYe(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4868,14 +3680,8 @@ def getYanBaoHangYe(startDate: str, endDate: str, fields: str, export: int, toke
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getYanBaoHangYe"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getYanBaoHangYe", params, method)
 
 def getYanbaoCelue(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4888,14 +3694,8 @@ def getYanbaoCelue(startDate: str, endDate: str, fields: str, export: int, token
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getYanbaoCelue"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getYanbaoCelue", params, method)
 
 def getYanBaoChenBao(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4908,14 +3708,8 @@ def getYanBaoChenBao(startDate: str, endDate: str, fields: str, export: int, tok
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getYanBaoChenBao"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getYanBaoChenBao", params, method)
 
 def getYanBaoHongGuan(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4928,14 +3722,8 @@ def getYanBaoHongGuan(startDate: str, endDate: str, fields: str, export: int, to
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getYanBaoHongGuan"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getYanBaoHongGuan", params, method)
 
 def getYanBaoYingLi(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4947,14 +3735,8 @@ def getYanBaoYingLi(code: str, fields: str, export: int, token: str, filter: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getYanBaoYingLi"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getYanBaoYingLi", params, method)
 
 def getReportNianBao(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4968,14 +3750,8 @@ def getReportNianBao(code: str, startDate: str, endDate: str, fields: str, expor
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getReportNianBao"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getReportNianBao", params, method)
 
 def getReportKuaiBao(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -4989,14 +3765,8 @@ def getReportKuaiBao(code: str, startDate: str, endDate: str, fields: str, expor
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getReportKuaiBao"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getReportKuaiBao", params, method)
 
 def getReportYugao(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5010,14 +3780,8 @@ def getReportYugao(code: str, startDate: str, endDate: str, fields: str, export:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getReportYugao"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getReportYugao", params, method)
 
 def getReportYuyueTime(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5031,14 +3795,8 @@ def getReportYuyueTime(code: str, startDate: str, endDate: str, fields: str, exp
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getReportYuyueTime"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getReportYuyueTime", params, method)
 
 def getReportFuzhai(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5052,14 +3810,8 @@ def getReportFuzhai(code: str, startDate: str, endDate: str, fields: str, export
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getReportFuzhai"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getReportFuzhai", params, method)
 
 def getReportLirun(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5073,14 +3825,8 @@ def getReportLirun(code: str, startDate: str, endDate: str, fields: str, export:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getReportLirun"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getReportLirun", params, method)
 
 def getReportXianjin(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5094,14 +3840,8 @@ def getReportXianjin(code: str, startDate: str, endDate: str, fields: str, expor
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getReportXianjin"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getReportXianjin", params, method)
 
 def getReportFenhong(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5115,14 +3855,8 @@ def getReportFenhong(code: str, startDate: str, endDate: str, fields: str, expor
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getReportFenhong"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getReportFenhong", params, method)
 
 def getHSGTMoney(mtype: int, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5137,14 +3871,8 @@ def getHSGTMoney(mtype: int, ktype: int, startDate: str, endDate: str, fields: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getHSGTMoney"
     params = {"mtype": mtype,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getHSGTMoney", params, method)
 
 def getHSGTBlockRank(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5158,14 +3886,8 @@ def getHSGTBlockRank(code: str, startDate: str, endDate: str, fields: str, expor
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getHSGTBlockRank"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getHSGTBlockRank", params, method)
 
 def getHSGTStockRank(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5179,14 +3901,8 @@ def getHSGTStockRank(code: str, startDate: str, endDate: str, fields: str, expor
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getHSGTStockRank"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getHSGTStockRank", params, method)
 
 def getHSGTHistory(mtype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5200,14 +3916,8 @@ def getHSGTHistory(mtype: int, startDate: str, endDate: str, fields: str, export
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getHSGTHistory"
     params = {"mtype": mtype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getHSGTHistory", params, method)
 
 def getHsgtStockTop10(code: str, mtype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5222,14 +3932,8 @@ def getHsgtStockTop10(code: str, mtype: int, startDate: str, endDate: str, field
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getHsgtStockTop10"
     params = {"code": code,"mtype": mtype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getHsgtStockTop10", params, method)
 
 def getCaiWuZYZBReportHSA(code: str, mtype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5244,14 +3948,8 @@ def getCaiWuZYZBReportHSA(code: str, mtype: int, startDate: str, endDate: str, f
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getCaiWuZYZBReportHSA"
     params = {"code": code,"mtype": mtype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getCaiWuZYZBReportHSA", params, method)
 
 def getCaiWuZYZBQuarterHSA(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5265,14 +3963,8 @@ def getCaiWuZYZBQuarterHSA(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getCaiWuZYZBQuarterHSA"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getCaiWuZYZBQuarterHSA", params, method)
 
 def getFinanceHSDebt(code: str, mtype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5287,14 +3979,8 @@ def getFinanceHSDebt(code: str, mtype: int, startDate: str, endDate: str, fields
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getFinanceHSDebt"
     params = {"code": code,"mtype": mtype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getFinanceHSDebt", params, method)
 
 def getPoolZT(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5307,14 +3993,8 @@ def getPoolZT(startDate: str, endDate: str, fields: str, export: int, token: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getPoolZT"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getPoolZT", params, method)
 
 def getPoolQS(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5327,14 +4007,8 @@ def getPoolQS(startDate: str, endDate: str, fields: str, export: int, token: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getPoolQS"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getPoolQS", params, method)
 
 def getPoolCX(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5346,14 +4020,8 @@ def getPoolCX(code: str, fields: str, export: int, token: str, filter: str,  met
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getPoolCX"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getPoolCX", params, method)
 
 def getPoolZB(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5366,14 +4034,8 @@ def getPoolZB(startDate: str, endDate: str, fields: str, export: int, token: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getPoolZB"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getPoolZB", params, method)
 
 def getPoolDT(startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5386,14 +4048,8 @@ def getPoolDT(startDate: str, endDate: str, fields: str, export: int, token: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getPoolDT"
     params = {"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getPoolDT", params, method)
 
 def getCnFundBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5405,14 +4061,8 @@ def getCnFundBaseInfo(code: str, fields: str, export: int, token: str, filter: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getCnFundBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getCnFundBaseInfo", params, method)
 
 def getCnFundDailyMarket(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5426,14 +4076,8 @@ def getCnFundDailyMarket(code: str, startDate: str, endDate: str, fields: str, e
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getCnFundDailyMarket"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getCnFundDailyMarket", params, method)
 
 def getCnFundMinuteKLine(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5447,14 +4091,8 @@ def getCnFundMinuteKLine(code: str, startDate: str, endDate: str, fields: str, e
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getCnFundMinuteKLine"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getCnFundMinuteKLine", params, method)
 
 def getCnFundHourKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5469,14 +4107,8 @@ def getCnFundHourKLine(code: str, ktype: int, startDate: str, endDate: str, fiel
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getCnFundHourKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getCnFundHourKLine", params, method)
 
 def getCnFundADayKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5491,14 +4123,8 @@ def getCnFundADayKLine(code: str, ktype: int, startDate: str, endDate: str, fiel
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getCnFundADayKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getCnFundADayKLine", params, method)
 
 def getFundBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5510,14 +4136,8 @@ def getFundBaseInfo(code: str, fields: str, export: int, token: str, filter: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getFundBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getFundBaseInfo", params, method)
 
 def getFundRank(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5531,14 +4151,8 @@ def getFundRank(code: str, startDate: str, endDate: str, fields: str, export: in
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getFundRank"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getFundRank", params, method)
 
 def getFundNav(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5552,14 +4166,8 @@ def getFundNav(code: str, startDate: str, endDate: str, fields: str, export: int
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getFundNav"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getFundNav", params, method)
 
 def getFundMaxBack(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5571,14 +4179,8 @@ def getFundMaxBack(code: str, fields: str, export: int, token: str, filter: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getFundMaxBack"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getFundMaxBack", params, method)
 
 def getFundPosition(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5592,14 +4194,8 @@ def getFundPosition(code: str, startDate: str, endDate: str, fields: str, export
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getFundPosition"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getFundPosition", params, method)
 
 def getStockPosition(scode: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5613,14 +4209,8 @@ def getStockPosition(scode: str, startDate: str, endDate: str, fields: str, expo
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockPosition"
     params = {"scode": scode,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockPosition", params, method)
 
 def getStockHyBKBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5632,14 +4222,8 @@ def getStockHyBKBaseInfo(code: str, fields: str, export: int, token: str, filter
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHyBKBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHyBKBaseInfo", params, method)
 
 def getStockGnBKBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5651,14 +4235,8 @@ def getStockGnBKBaseInfo(code: str, fields: str, export: int, token: str, filter
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockGnBKBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockGnBKBaseInfo", params, method)
 
 def getStockDyBKBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5670,14 +4248,8 @@ def getStockDyBKBaseInfo(code: str, fields: str, export: int, token: str, filter
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockDyBKBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockDyBKBaseInfo", params, method)
 
 def getStockHYADailyMarket(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5691,14 +4263,8 @@ def getStockHYADailyMarket(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHYADailyMarket"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHYADailyMarket", params, method)
 
 def getStockBKDayKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5713,14 +4279,8 @@ def getStockBKDayKLine(code: str, ktype: int, startDate: str, endDate: str, fiel
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockBKDayKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockBKDayKLine", params, method)
 
 def getGZMarket(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5734,14 +4294,8 @@ def getGZMarket(code: str, startDate: str, endDate: str, fields: str, export: in
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getGZMarket"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getGZMarket", params, method)
 
 def getGZHangYe(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5755,14 +4309,8 @@ def getGZHangYe(code: str, startDate: str, endDate: str, fields: str, export: in
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getGZHangYe"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getGZHangYe", params, method)
 
 def getHSGZStock(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5776,14 +4324,8 @@ def getHSGZStock(code: str, startDate: str, endDate: str, fields: str, export: i
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getHSGZStock"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getHSGZStock", params, method)
 
 def getBaseInfoPlatB(type: int, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5795,14 +4337,8 @@ def getBaseInfoPlatB(type: int, fields: str, export: int, token: str, filter: st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getBaseInfoPlatB"
     params = {"type": type,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getBaseInfoPlatB", params, method)
 
 def getHangyeCfgPlatB(bkcode: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5814,14 +4350,8 @@ def getHangyeCfgPlatB(bkcode: str, fields: str, export: int, token: str, filter:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getHangyeCfgPlatB"
     params = {"bkcode": bkcode,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getHangyeCfgPlatB", params, method)
 
 def getStockHKBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5833,14 +4363,8 @@ def getStockHKBaseInfo(code: str, fields: str, export: int, token: str, filter:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHKBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHKBaseInfo", params, method)
 
 def getStockHKDailyMarket(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5854,14 +4378,8 @@ def getStockHKDailyMarket(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHKDailyMarket"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHKDailyMarket", params, method)
 
 def getStockHKMinuteKLine(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5875,14 +4393,8 @@ def getStockHKMinuteKLine(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHKMinuteKLine"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHKMinuteKLine", params, method)
 
 def getStockHKHourKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5897,14 +4409,8 @@ def getStockHKHourKLine(code: str, ktype: int, startDate: str, endDate: str, fie
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHKHourKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHKHourKLine", params, method)
 
 def getStockHKDayKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5919,14 +4425,8 @@ def getStockHKDayKLine(code: str, ktype: int, startDate: str, endDate: str, fiel
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockHKDayKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockHKDayKLine", params, method)
 
 def getStockUSABaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5938,14 +4438,8 @@ def getStockUSABaseInfo(code: str, fields: str, export: int, token: str, filter:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockUSABaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockUSABaseInfo", params, method)
 
 def getStockUSADailyMarket(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5959,14 +4453,8 @@ def getStockUSADailyMarket(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockUSADailyMarket"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockUSADailyMarket", params, method)
 
 def getStockUSAMinuteKLine(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -5980,14 +4468,8 @@ def getStockUSAMinuteKLine(code: str, startDate: str, endDate: str, fields: str,
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockUSAMinuteKLine"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockUSAMinuteKLine", params, method)
 
 def getStockUSAHourKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6002,14 +4484,8 @@ def getStockUSAHourKLine(code: str, ktype: int, startDate: str, endDate: str, fi
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockUSAHourKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockUSAHourKLine", params, method)
 
 def getStockUSADayKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6024,14 +4500,8 @@ def getStockUSADayKLine(code: str, ktype: int, startDate: str, endDate: str, fie
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getStockUSADayKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getStockUSADayKLine", params, method)
 
 def getIndexHSBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6043,14 +4513,8 @@ def getIndexHSBaseInfo(code: str, fields: str, export: int, token: str, filter:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndexHSBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndexHSBaseInfo", params, method)
 
 def getIndexHKBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6062,14 +4526,8 @@ def getIndexHKBaseInfo(code: str, fields: str, export: int, token: str, filter:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndexHKBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndexHKBaseInfo", params, method)
 
 def getIndexQQBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6081,14 +4539,8 @@ def getIndexQQBaseInfo(code: str, fields: str, export: int, token: str, filter:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndexQQBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndexQQBaseInfo", params, method)
 
 def getIndexBondBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6100,14 +4552,8 @@ def getIndexBondBaseInfo(code: str, fields: str, export: int, token: str, filter
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndexBondBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndexBondBaseInfo", params, method)
 
 def getIndexDailyMarket(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6121,14 +4567,8 @@ def getIndexDailyMarket(code: str, startDate: str, endDate: str, fields: str, ex
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndexDailyMarket"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndexDailyMarket", params, method)
 
 def getIndexHourKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6143,14 +4583,8 @@ def getIndexHourKLine(code: str, ktype: int, startDate: str, endDate: str, field
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndexHourKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndexHourKLine", params, method)
 
 def getIndexDayKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6165,14 +4599,8 @@ def getIndexDayKLine(code: str, ktype: int, startDate: str, endDate: str, fields
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getIndexDayKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getIndexDayKLine", params, method)
 
 def getBondHSBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6184,14 +4612,8 @@ def getBondHSBaseInfo(code: str, fields: str, export: int, token: str, filter: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getBondHSBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getBondHSBaseInfo", params, method)
 
 def getBondHSDetailInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6203,14 +4625,8 @@ def getBondHSDetailInfo(code: str, fields: str, export: int, token: str, filter:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getBondHSDetailInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getBondHSDetailInfo", params, method)
 
 def getBondHSDailyMarket(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6224,14 +4640,8 @@ def getBondHSDailyMarket(code: str, startDate: str, endDate: str, fields: str, e
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getBondHSDailyMarket"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getBondHSDailyMarket", params, method)
 
 def getBondMinuteKLine(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6245,14 +4655,8 @@ def getBondMinuteKLine(code: str, startDate: str, endDate: str, fields: str, exp
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getBondMinuteKLine"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getBondMinuteKLine", params, method)
 
 def getBondHSHourKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6267,14 +4671,8 @@ def getBondHSHourKLine(code: str, ktype: int, startDate: str, endDate: str, fiel
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getBondHSHourKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getBondHSHourKLine", params, method)
 
 def getBondHSDayKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6289,14 +4687,8 @@ def getBondHSDayKLine(code: str, ktype: int, startDate: str, endDate: str, field
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getBondHSDayKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getBondHSDayKLine", params, method)
 
 def getGoldBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6308,14 +4700,8 @@ def getGoldBaseInfo(code: str, fields: str, export: int, token: str, filter: str
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getGoldBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getGoldBaseInfo", params, method)
 
 def getGoldDayKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6330,14 +4716,8 @@ def getGoldDayKLine(code: str, ktype: int, startDate: str, endDate: str, fields:
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getGoldDayKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getGoldDayKLine", params, method)
 
 def getWaihuiBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6349,14 +4729,8 @@ def getWaihuiBaseInfo(code: str, fields: str, export: int, token: str, filter: s
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getWaihuiBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getWaihuiBaseInfo", params, method)
 
 def getWaihuiDayKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6371,14 +4745,8 @@ def getWaihuiDayKLine(code: str, ktype: int, startDate: str, endDate: str, field
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getWaihuiDayKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getWaihuiDayKLine", params, method)
 
 def getReitsBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6390,14 +4758,8 @@ def getReitsBaseInfo(code: str, fields: str, export: int, token: str, filter: st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getReitsBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getReitsBaseInfo", params, method)
 
 def getReitsDayKLine(code: str, ktype: int, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6412,14 +4774,8 @@ def getReitsDayKLine(code: str, ktype: int, startDate: str, endDate: str, fields
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getReitsDayKLine"
     params = {"code": code,"ktype": ktype,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getReitsDayKLine", params, method)
 
 def getQihuoBaseInfo(code: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6431,14 +4787,8 @@ def getQihuoBaseInfo(code: str, fields: str, export: int, token: str, filter: st
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getQihuoBaseInfo"
     params = {"code": code,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getQihuoBaseInfo", params, method)
 
 def getQihuoDailyMarket(code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6452,14 +4802,8 @@ def getQihuoDailyMarket(code: str, startDate: str, endDate: str, fields: str, ex
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getQihuoDailyMarket"
     params = {"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getQihuoDailyMarket", params, method)
 
 def getTSStockPosition(type: int, code: str, startDate: str, endDate: str, fields: str, export: int, token: str, filter: str,  method: str = "post") -> str:
     """
@@ -6474,14 +4818,8 @@ def getTSStockPosition(type: int, code: str, startDate: str, endDate: str, field
      :param filter    : 过滤参数，例如filter=open>=15。建议选择左上角菜单栏【浏览模式】操作数据
      :return: pandas.DataFrame
     """
-    url = "http://api.waizaowang.com/doc/getTSStockPosition"
     params = {"type": type,"code": code,"startDate": startDate,"endDate": endDate,"fields": fields,"export": export,"token": token,"filter": filter}
-    if method == 'post':
-        response = requests.post(url, params=params)
-        return response.text
-    else:
-        response = requests.get(url, params=params)
-        return response.text
+    return http_client.request("getTSStockPosition", params, method)
 
 
 if __name__ == "__main__":
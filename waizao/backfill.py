@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，可断点续传的批量回补工具。按 (股票代码分组 × 日期窗口) 拆分任务并发请求，每个任务的结果写入独立文件，
+      任务进度记录在本地SQLite日志中，任务被中断后使用同一个日志文件重新运行即可从中断处继续
+      命令行：waizao-backfill getMinuteKLine --token xxx --type 1 --codes 600000,000001
+                             --start 2015-01-01 --end 2024-12-31 --output ./minute
+http://www.waizaowang.com/
+"""
+
+import argparse
+import datetime
+import inspect
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from waizao import batch_tool
+from waizao import export_tool
+from waizao import range_tool
+from waizao.api import rate_limit
+from waizao.api import stock_api
+
+# 任务状态
+PENDING = 0
+DONE = 1
+FAILED = 2
+
+# 各接口默认的日期窗口天数，数据量越大窗口越小；未列出的接口不拆分日期
+DEFAULT_WINDOWS = {
+    "getMinuteKLine": 30,
+    "getHourKLine": 180,
+    "getLevel2TimeDeal": 5,
+    "getDayKLine": 3660,
+}
+
+# 导出类型对应的文件扩展名
+EXTENSIONS = {1: "json", 4: "csv"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS task (
+    id INTEGER PRIMARY KEY,
+    code TEXT,
+    startDate TEXT,
+    endDate TEXT,
+    status INTEGER NOT NULL DEFAULT 0,
+    file TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS task_status ON task (status);
+"""
+
+
+def dateWindows(startDate: str, endDate: str, days: int = None) -> list:
+    """
+    将日期范围按days天拆分为首尾相接且不重叠的窗口
+    :param startDate : 开始日期，yyyy-MM-dd格式
+    :param endDate   : 结束日期，yyyy-MM-dd格式
+    :param days      : 窗口天数，为空时不拆分
+    :return: list，[(开始日期, 结束日期), ...]
+    """
+    start = datetime.date.fromisoformat(str(startDate)[:10])
+    end = datetime.date.fromisoformat(str(endDate)[:10])
+    if start > end:
+        raise ValueError("开始日期%s晚于结束日期%s" % (startDate, endDate))
+    if not days:
+        return [(start.isoformat(), end.isoformat())]
+    windows = []
+    while start <= end:
+        stop = min(start + datetime.timedelta(days=days - 1), end)
+        windows.append((start.isoformat(), stop.isoformat()))
+        start = stop + datetime.timedelta(days=1)
+    return windows
+
+
+def universe(type: int, token: str) -> list:
+    """
+    获取某一资产类型的全部股票代码
+    :param type  : 资产类型，取值范围同getBaseInfo
+    :param token : 令牌，登录后可获取
+    :return: list
+    """
+    df = export_tool.toDataFrame(stock_api.getBaseInfo(type, "all", "code", 1, token, ""))
+    return df["code"].astype(str).tolist()
+
+
+class BackfillJob:
+    """
+    批量回补任务。任务配置和每个子任务的状态保存在SQLite日志中，子任务结果保存在output目录下，
+    文件名为 <子任务编号>.<json|csv>
+    """
+
+    def __init__(self, journal: str):
+        """
+        :param journal : SQLite日志文件，文件已存在时读取其中的任务配置和进度
+        """
+        self.journal = journal
+        folder = os.path.dirname(os.path.abspath(journal))
+        os.makedirs(folder, exist_ok=True)
+        self.db = sqlite3.connect(journal)
+        self.db.executescript(_SCHEMA)
+        self.config = {name: json.loads(value) for name, value in self.db.execute("SELECT name, value FROM job")}
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def planned(self) -> bool:
+        return "endpoint" in self.config
+
+    def plan(self, endpoint: str, codes, startDate: str, endDate: str, output: str, params: dict = None,
+             export: int = 1, chunk_size: int = batch_tool.MAX_CODES, window: int = None, dates: list = None) -> int:
+        """
+        拆分任务并写入日志，日志中已有任务时直接返回，不重复拆分
+        :param endpoint   : 接口名称，例如：getDayKLine、getMinuteKLine、getLevel2TimeDeal、getReportLirun
+        :param codes      : 股票代码，列表或逗号分隔的字符串；若为all，则不拆分股票代码，日期按单日拆分，
+                            接口不支持all时抛出ValueError
+        :param startDate  : 开始日期，yyyy-MM-dd格式
+        :param endDate    : 结束日期，yyyy-MM-dd格式
+        :param output     : 结果文件目录
+        :param params     : 接口的其余参数，例如{"type": 1, "ktype": 101, "fq": 1}，不含token
+        :param export     : 数据导出类型，取值范围：1|Json字符串；4|Csv文件
+        :param chunk_size : 每组股票数量，默认50
+        :param window     : 日期窗口天数，为空时按DEFAULT_WINDOWS；指定dates时为每个窗口的交易日数量
+        :param dates      : 交易日列表，不为空时按交易日拆分窗口，窗口大小默认按range_tool.windowDays计算
+        :return: int，子任务数量
+        """
+        if self.planned:
+            return self.db.execute("SELECT COUNT(*) FROM task").fetchone()[0]
+        func = getattr(stock_api, endpoint, None)
+        if func is None:
+            raise ValueError("接口%s不存在" % endpoint)
+        if export not in EXTENSIONS:
+            raise ValueError("数据导出类型%s不支持，请使用1|Json字符串；4|Csv文件" % export)
+        names = batch_tool.endpointKwargs(func, code=1, startDate=1, endDate=1)
+        chunks = range_tool.planChunks(func, codes, chunk_size) if "code" in names else [None]
+        if "all" in chunks:
+            # code为all时接口只接受开始日期与结束日期为同一天的请求
+            window = 1
+        if "startDate" in names and dates is not None:
+            start, end = str(startDate)[:10], str(endDate)[:10]
+            codes_per_request = 1 if chunks == [None] else range_tool.chunkCount(chunks)
+            window = window or range_tool.windowDays(endpoint, (params or {}).get("ktype"), codes_per_request)
+            windows = range_tool.planWindows([date for date in dates if start <= date <= end], window)
+        elif "startDate" in names:
+            windows = dateWindows(startDate, endDate, window or DEFAULT_WINDOWS.get(endpoint))
+        else:
+            windows = [(None, None)]
+        config = {"endpoint": endpoint, "output": os.path.abspath(output), "params": params or {}, "export": export}
+        with self.db:
+            self.db.executemany("INSERT INTO job (name, value) VALUES (?, ?)",
+                                [(name, json.dumps(value, ensure_ascii=False)) for name, value in config.items()])
+            self.db.executemany("INSERT INTO task (code, startDate, endDate) VALUES (?, ?, ?)",
+                                [(chunk, start, end) for chunk in chunks for start, end in windows])
+        self.config = config
+        return len(chunks) * len(windows)
+
+    def progress(self) -> dict:
+        """
+        任务进度
+        :return: dict，{"pending": 未完成数量, "done": 已完成数量, "failed": 失败数量}
+        """
+        counts = dict(self.db.execute("SELECT status, COUNT(*) FROM task GROUP BY status"))
+        return {"pending": counts.get(PENDING, 0), "done": counts.get(DONE, 0), "failed": counts.get(FAILED, 0)}
+
+    def _fetch(self, func, token: str, task: tuple) -> str:
+        task_id, code, start, end = task
+        kwargs = dict(self.config["params"], fields=self.config["params"].get("fields", "all"),
+                      export=self.config["export"], token=token, filter=self.config["params"].get("filter", ""))
+        if code is not None:
+            kwargs["code"] = code
+        if start is not None:
+            kwargs["startDate"] = batch_tool.formatDate(func, start)
+            kwargs["endDate"] = batch_tool.formatDate(func, end, True)
+        with rate_limit.priority(rate_limit.PRIORITY_BULK):
+            data = func(**batch_tool.endpointKwargs(func, **kwargs))
+        file = os.path.join(self.config["output"], "%08d.%s" % (task_id, EXTENSIONS[self.config["export"]]))
+        fd, temp = tempfile.mkstemp(prefix=".backfill-", dir=self.config["output"])
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(data)
+        os.replace(temp, file)
+        return file
+
+    def run(self, token: str, max_workers: int = 8, retry_failed: bool = True, callback=None) -> dict:
+        """
+        执行未完成的子任务，每个子任务完成后立即记录到日志。子任务失败不影响其他子任务，失败信息记录在日志中
+        :param token        : 令牌，登录后可获取
+        :param max_workers  : 并发线程数
+        :param retry_failed : 是否重新执行上次失败的子任务
+        :param callback     : 每个子任务结束后调用callback(progress)
+        :return: dict，任务进度
+        """
+        if not self.planned:
+            raise ValueError("日志%s中没有任务，请先调用plan" % self.journal)
+        func = getattr(stock_api, self.config["endpoint"])
+        os.makedirs(self.config["output"], exist_ok=True)
+        statuses = (PENDING, FAILED) if retry_failed else (PENDING,)
+        tasks = self.db.execute("SELECT id, code, startDate, endDate FROM task WHERE status IN (%s) ORDER BY id"
+                                % ",".join("?" * len(statuses)), statuses).fetchall()
+        if not tasks:
+            return self.progress()
+        # 只在当前线程写日志，工作线程只负责请求和写结果文件
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(tasks)))
+        futures = {executor.submit(self._fetch, func, token, task): task[0] for task in tasks}
+        try:
+            for future in as_completed(futures):
+                try:
+                    file = future.result()
+                except Exception as e:
+                    status, file, error = FAILED, None, "%s: %s" % (type(e).__name__, e)
+                else:
+                    status, error = DONE, None
+                with self.db:
+                    self.db.execute("UPDATE task SET status = ?, file = ?, error = ?, attempts = attempts + 1, "
+                                    "updated = ? WHERE id = ?", (status, file, error, time.time(), futures[future]))
+                if callback is not None:
+                    callback(self.progress())
+        finally:
+            # 被中断时取消排队中的子任务，只等待正在执行的子任务结束
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
+        return self.progress()
+
+    def files(self) -> list:
+        """
+        已完成子任务的结果文件，按子任务编号（即股票代码分组、日期窗口的顺序）排列
+        """
+        return [row[0] for row in self.db.execute("SELECT file FROM task WHERE status = ? ORDER BY id", (DONE,))]
+
+    def errors(self) -> list:
+        """
+        失败的子任务
+        :return: list，[(子任务编号, 股票代码, 开始日期, 结束日期, 错误信息), ...]
+        """
+        return self.db.execute("SELECT id, code, startDate, endDate, error FROM task WHERE status = ? ORDER BY id",
+                               (FAILED,)).fetchall()
+
+
+def _parseParam(text: str, func=None):
+    # 按接口签名中的类型转换取值，只有int类型的参数转换为整数，code=000001等字符串参数保留前导0
+    name, _, value = text.partition("=")
+    parameter = inspect.signature(func).parameters.get(name) if func is not None else None
+    if parameter is not None and parameter.annotation is int:
+        try:
+            return name, int(value)
+        except ValueError:
+            pass
+    return name, value
+
+
+def _readCodes(text: str):
+    # @file表示从文件读取股票代码，每行一个或逗号分隔
+    if text.startswith("@"):
+        with open(text[1:], "r", encoding="utf-8") as f:
+            return f.read().replace("\n", ",")
+    return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="waizao-backfill", description="歪枣网，可断点续传的批量回补工具")
+    parser.add_argument("endpoint", nargs="?", help="接口名称，例如：getDayKLine；续传时可省略")
+    parser.add_argument("--token", required=True, help="令牌，登录后可获取")
+    parser.add_argument("--codes", help="股票代码，逗号分隔；@文件名表示从文件读取；all表示全部（默认，按单日拆分）")
+    parser.add_argument("--universe", type=int, help="资产类型，获取该类型的全部股票代码作为回补范围")
+    parser.add_argument("--type", type=int, help="资产类型，接口的type参数")
+    parser.add_argument("--start", default="2000-01-01", help="开始日期，yyyy-MM-dd格式")
+    parser.add_argument("--end", default=datetime.date.today().isoformat(), help="结束日期，yyyy-MM-dd格式")
+    parser.add_argument("--param", action="append", default=[], help="接口的其余参数，例如：--param ktype=101")
+    parser.add_argument("--export", type=int, default=1, choices=sorted(EXTENSIONS), help="1|Json；4|Csv")
+    parser.add_argument("--window", type=int, help="日期窗口天数，使用--calendar时为交易日数量")
+    parser.add_argument("--calendar", action="store_true", help="按getTradeDate交易日历拆分日期窗口")
+    parser.add_argument("--chunk-size", type=int, default=batch_tool.MAX_CODES, help="每组股票数量")
+    parser.add_argument("--workers", type=int, default=8, help="并发线程数")
+    parser.add_argument("--output", default=".", help="结果文件目录")
+    parser.add_argument("--journal", help="SQLite日志文件，默认为<output>/backfill.db")
+    args = parser.parse_args(argv)
+
+    journal = args.journal or os.path.join(args.output, "backfill.db")
+    with BackfillJob(journal) as job:
+        if job.planned:
+            if args.endpoint and args.endpoint != job.config["endpoint"]:
+                parser.error("日志%s属于接口%s的任务" % (journal, job.config["endpoint"]))
+        else:
+            if not args.endpoint:
+                parser.error("请指定接口名称")
+            func = getattr(stock_api, args.endpoint, None)
+            if args.universe is not None:
+                codes = universe(args.universe, args.token)
+            else:
+                codes = _readCodes(args.codes) if args.codes else "all"
+            if codes == "all" and func is not None and not range_tool.supportsAll(func):
+                parser.error("接口%s不支持all参数查询，请使用--codes或--universe指定股票代码" % args.endpoint)
+            params = dict(_parseParam(text, func) for text in args.param)
+            if args.type is not None:
+                params["type"] = args.type
+            dates = None
+            # code为all时按交易日逐日拆分，不请求非交易日
+            if args.calendar or codes == "all":
+                dates = range_tool.tradeDates(args.start, args.end, args.token, range_tool.MTYPES.get(args.type, 1))
+            count = job.plan(args.endpoint, codes, args.start, args.end, args.output, params, args.export,
+                             args.chunk_size, args.window, dates)
+            print("任务已拆分为%d个子任务，日志文件：%s" % (count, journal))
+
+        def report(progress):
+            total = sum(progress.values())
+            sys.stdout.write("\r已完成 %d/%d，失败 %d" % (progress["done"], total, progress["failed"]))
+            sys.stdout.flush()
+
+        progress = job.run(args.token, args.workers, callback=report)
+        print()
+        for task_id, code, start, end, error in job.errors():
+            print("子任务%d失败 [%s %s~%s]：%s" % (task_id, code, start, end, error))
+    return 0 if progress["failed"] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
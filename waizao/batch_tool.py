@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，批量请求工具。接口的code参数每次最多50个，本模块将任意长度的股票代码列表按50个一组拆分，
+      使用线程池并发请求，并将结果合并为一个Json字符串、Csv字符串或DataFrame
+http://www.waizaowang.com/
+"""
+
+import inspect
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from waizao import export_tool
+from waizao.api import http_client
+
+# 接口code参数每次最多支持的股票数量
+MAX_CODES = 50
+
+# Csv文件前两行为英文标题和中文标题
+CSV_HEADER_LINES = 2
+
+# Csv格式的数据导出类型，与http_client.JSON_EXPORTS一样按字符串比较
+CSV_EXPORTS = ("4",)
+
+
+def chunkCodes(codes, size: int = MAX_CODES) -> list:
+    """
+    将股票代码按size个一组拆分为多个逗号分隔的字符串
+    :param codes : 股票代码，列表或逗号分隔的字符串
+    :param size  : 每组股票数量，默认50
+    :return: list
+    """
+    if isinstance(codes, str):
+        codes = codes.split(",")
+    codes = [code.strip() for code in codes if code and code.strip()]
+    return [",".join(codes[i:i + size]) for i in range(0, len(codes), size)]
+
+
+def endpointKwargs(func, **kwargs) -> dict:
+    """
+    只保留接口签名中存在的参数，例如getHourKLine没有fq参数、getMinuteKLine没有ktype参数
+    :param func   : stock_api中的接口函数
+    :param kwargs : 接口参数
+    :return: dict
+    """
+    names = inspect.signature(func).parameters
+    return {key: value for key, value in kwargs.items() if key in names}
+
+
+def isDateTimeEndpoint(func) -> bool:
+    """
+    判断接口的日期参数是否为yyyy-MM-dd HH:mm:ss格式，例如getMinuteKLine、getHourKLine、getLevel2TimeDeal
+    :param func : stock_api中的接口函数
+    """
+    return "yyyy-MM-dd HH:mm:ss" in (func.__doc__ or "")
+
+
+def formatDate(func, date: str, end: bool = False) -> str:
+    """
+    按接口要求的格式转换日期，yyyy-MM-dd HH:mm:ss格式的接口补全时间，yyyy-MM-dd格式的接口截去时间
+    :param func : stock_api中的接口函数
+    :param date : 日期，yyyy-MM-dd或yyyy-MM-dd HH:mm:ss格式
+    :param end  : 是否为结束日期，结束日期补全为23:59:59
+    """
+    date = str(date).strip()
+    if isDateTimeEndpoint(func):
+        return date if len(date) > 10 else date + (" 23:59:59" if end else " 00:00:00")
+    return date[:10]
+
+
+def checkExport(export) -> str:
+    """
+    检查数据导出类型是否支持合并，不支持时抛出ValueError；export可以是整数或字符串
+    :param export : 数据导出类型，支持1|Json字符串；3|Json文件；4|Csv文件；5|DataFrame格式
+    :return: str，转换为字符串的数据导出类型
+    """
+    export = str(export).strip()
+    if export not in http_client.JSON_EXPORTS + CSV_EXPORTS:
+        raise ValueError("数据导出类型%s不支持合并，请使用1|Json字符串；4|Csv文件；5|DataFrame格式" % export)
+    return export
+
+
+def mergeResponses(responses: list, export) -> str:
+    """
+    合并多次请求返回的字符串数据
+    :param responses : 各组请求返回的字符串，按请求顺序排列
+    :param export    : 数据导出类型，支持1|Json字符串；3|Json文件；4|Csv文件；5|DataFrame格式
+    :return: str
+    """
+    export = checkExport(export)
+    if len(responses) == 1:
+        return responses[0]
+    if export in http_client.JSON_EXPORTS:
+        merged = None
+        for response in responses:
+            payload = json.loads(response)
+            if "data" not in payload:
+                raise ValueError("请求失败：%s" % payload.get("message", response[:200]))
+            if merged is None:
+                merged = payload
+            else:
+                merged["data"].extend(payload["data"])
+        return json.dumps(merged, ensure_ascii=False)
+    parts = [responses[0].rstrip("\r\n")]
+    for response in responses[1:]:
+        lines = response.lstrip("\ufeff").split("\n", CSV_HEADER_LINES)
+        if len(lines) > CSV_HEADER_LINES and lines[CSV_HEADER_LINES].strip():
+            parts.append(lines[CSV_HEADER_LINES].rstrip("\r\n"))
+    return "\n".join(parts) + "\n"
+
+
+def batchRequest(func, codes, max_workers: int = 8, chunk_size: int = MAX_CODES, **kwargs) -> str:
+    """
+    批量请求任意数量的股票代码，按chunk_size个一组并发请求，返回合并后的字符串
+    例如：batchRequest(stock_api.getDayKLine, codes, type=1, ktype=101, fq=1, startDate="2024-01-01",
+                       endDate="2024-12-31", fields="all", export=1, token=token, filter="")
+    :param func        : stock_api中带code参数的接口函数，例如：stock_api.getDayKLine
+    :param codes       : 股票代码，列表或逗号分隔的字符串；若为all，则直接请求一次
+    :param max_workers : 并发线程数
+    :param chunk_size  : 每组股票数量，默认50
+    :param kwargs      : 接口的其余参数，按参数名传入
+    :return: str
+    """
+    if isinstance(codes, str) and codes.strip() == "all":
+        return func(code="all", **kwargs)
+    chunks = chunkCodes(codes, chunk_size)
+    if not chunks:
+        raise ValueError("股票代码不能为空")
+    if len(chunks) == 1:
+        return func(code=chunks[0], **kwargs)
+    # 在并发请求之前检查，避免下载全部数据后才发现无法合并
+    export = checkExport(kwargs.get("export", 1))
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        responses = list(executor.map(lambda chunk: func(code=chunk, **kwargs), chunks))
+    return mergeResponses(responses, export)
+
+
+def batchDataFrame(func, codes, max_workers: int = 8, chunk_size: int = MAX_CODES, **kwargs) -> pd.DataFrame:
+    """
+    批量请求任意数量的股票代码，返回合并后的DataFrame，export参数固定为1|Json字符串，字段按schema_tool中注册的类型转换
+    :param func        : stock_api中带code参数的接口函数，例如：stock_api.getDayKLine
+    :param codes       : 股票代码，列表或逗号分隔的字符串；若为all，则直接请求一次
+    :param max_workers : 并发线程数
+    :param chunk_size  : 每组股票数量，默认50
+    :param kwargs      : 接口的其余参数，按参数名传入
+    :return: pandas.DataFrame
+    """
+    kwargs["export"] = 1
+    return export_tool.toDataFrame(batchRequest(func, codes, max_workers, chunk_size, **kwargs), func.__name__)
@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，交易日历索引。将getTradeDate（mtype为1--4）或getStockTradeDate返回的交易日保存为按日期排序的int32日序数组，
+      并为日历范围内的每一个自然日预先计算其前面的交易日数量，下一交易日、上一交易日、区间交易日数量和
+      按交易日平移均为O(1)的数组下标运算，支持标量和数组；每个市场的日历在进程内只请求和解析一次
+http://www.waizaowang.com/
+"""
+
+import datetime
+import threading
+
+import numpy as np
+import pandas as pd
+
+from waizao import export_tool
+from waizao.api import stock_api
+
+# 市场类型，取值范围：1|沪深京A股；2|港股；3|沪深港通-北向；4|沪深港通-南向；0|沪深股票市场（getStockTradeDate）
+MTYPE_STOCK = 0
+
+# 默认加载的日历范围
+DEFAULT_START = "1990-01-01"
+DEFAULT_YEARS_AHEAD = 1
+
+_EPOCH = np.datetime64("1970-01-01", "D")
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def toOrdinal(dates) -> np.ndarray:
+    """
+    将日期转换为日序（1970-01-01起的天数）
+    :param dates : 日期，字符串、datetime、numpy.datetime64或它们的数组
+    :return: numpy.ndarray，int32
+    """
+    if isinstance(dates, str):
+        # 标量字符串是最常见的调用方式，直接构造datetime64，避免pandas解析的开销
+        return (np.datetime64(dates.strip()[:10], "D") - _EPOCH).astype("int32")
+    if isinstance(dates, (datetime.date, np.datetime64)):
+        return (np.datetime64(dates, "D") - _EPOCH).astype("int32")
+    if isinstance(dates, np.ndarray) and dates.dtype.kind == "M":
+        days = dates.astype("datetime64[D]")
+    else:
+        days = np.asarray(pd.to_datetime(dates)).astype("datetime64[D]")
+    return (days - _EPOCH).astype("int32")
+
+
+def _scalarOrdinal(date):
+    # 标量日期的日序，数组返回None
+    if isinstance(date, str):
+        return datetime.date.fromisoformat(date.strip()[:10]).toordinal() - _EPOCH_ORDINAL
+    if isinstance(date, datetime.date):
+        return date.toordinal() - _EPOCH_ORDINAL
+    if isinstance(date, np.datetime64):
+        return int(date.astype("datetime64[D]").astype("int64"))
+    return None
+
+
+def fromOrdinal(ordinals) -> np.ndarray:
+    """
+    将日序转换为datetime64[D]
+    :param ordinals : 日序
+    """
+    return _EPOCH + np.asarray(ordinals).astype("timedelta64[D]")
+
+
+class TradeCalendar:
+    """
+    交易日历。days为按日期排序的交易日日序，rank[d - first]为日序d之前（不含d）的交易日数量，
+    日历覆盖 [first, last] 的自然日，超出范围的日期抛出ValueError
+    """
+
+    def __init__(self, dates, start=None, end=None):
+        """
+        :param dates : 交易日，yyyy-MM-dd格式的字符串或日期
+        :param start : 日历覆盖的开始日期，为空时为第一个交易日
+        :param end   : 日历覆盖的结束日期，为空时为最后一个交易日
+        """
+        dates = list(dates)
+        days = np.unique(toOrdinal(dates)) if dates else np.empty(0, dtype="int32")
+        if not len(days) and (start is None or end is None):
+            raise ValueError("交易日历为空")
+        self.days = days.astype("int32")
+        self.first = int(toOrdinal(start)) if start is not None else int(days[0])
+        self.last = int(toOrdinal(end)) if end is not None else int(days[-1])
+        if len(days):
+            self.first = min(self.first, int(days[0]))
+            self.last = max(self.last, int(days[-1]))
+        # 多一个位置，使last + 1也可以查询
+        self.rank = np.searchsorted(self.days, np.arange(self.first, self.last + 2), side="left").astype("int32")
+        self._days = self.days.tolist()
+        self._ranks = self.rank.tolist()
+
+    def __len__(self):
+        return len(self.days)
+
+    def _rank(self, ordinals) -> np.ndarray:
+        offset = np.asarray(ordinals, dtype="int64") - self.first
+        if np.any(offset < 0) or np.any(offset > self.last + 1 - self.first):
+            raise ValueError("日期超出交易日历范围：%s--%s" % (fromOrdinal(self.first), fromOrdinal(self.last)))
+        return self.rank[offset]
+
+    def _rankOf(self, ordinal: int) -> int:
+        # 标量版本的_rank，使用Python列表下标，避免NumPy的调用开销
+        offset = ordinal - self.first
+        if offset < 0 or offset > self.last + 1 - self.first:
+            raise ValueError("日期超出交易日历范围：%s--%s" % (fromOrdinal(self.first), fromOrdinal(self.last)))
+        return self._ranks[offset]
+
+    def _isTrading(self, ordinals, index) -> np.ndarray:
+        if not len(self.days):
+            return np.zeros(np.shape(index), dtype=bool)
+        return (index < len(self.days)) & (self.days[np.minimum(index, len(self.days) - 1)] == ordinals)
+
+    def _result(self, indexes, asString: bool):
+        indexes = np.asarray(indexes)
+        if np.any(indexes < 0) or np.any(indexes >= len(self.days)):
+            raise ValueError("结果超出交易日历范围：%s--%s" % (fromOrdinal(self.first), fromOrdinal(self.last)))
+        dates = fromOrdinal(self.days[indexes])
+        return dates.astype(str) if asString else dates
+
+    def _resultOf(self, index: int, asString: bool):
+        if index < 0 or index >= len(self._days):
+            raise ValueError("结果超出交易日历范围：%s--%s" % (fromOrdinal(self.first), fromOrdinal(self.last)))
+        date = datetime.date.fromordinal(self._days[index] + _EPOCH_ORDINAL)
+        return date.isoformat() if asString else np.datetime64(date, "D")
+
+    def isTradingDay(self, dates):
+        """
+        判断是否为交易日
+        :param dates : 日期或日期数组
+        :return: bool或numpy.ndarray
+        """
+        ordinal = _scalarOrdinal(dates)
+        if ordinal is not None:
+            index = self._rankOf(ordinal)
+            return index < len(self._days) and self._days[index] == ordinal
+        ordinals = toOrdinal(dates)
+        return self._isTrading(ordinals, self._rank(ordinals))
+
+    def nextTradingDay(self, dates, asString: bool = True):
+        """
+        下一交易日（不含当天）
+        :param dates    : 日期或日期数组
+        :param asString : 是否返回yyyy-MM-dd格式的字符串，否则返回datetime64[D]
+        """
+        ordinal = _scalarOrdinal(dates)
+        if ordinal is not None:
+            return self._resultOf(self._rankOf(ordinal + 1), asString)
+        return self._result(self._rank(toOrdinal(dates) + 1), asString)
+
+    def prevTradingDay(self, dates, asString: bool = True):
+        """
+        上一交易日（不含当天）
+        :param dates    : 日期或日期数组
+        :param asString : 是否返回yyyy-MM-dd格式的字符串，否则返回datetime64[D]
+        """
+        ordinal = _scalarOrdinal(dates)
+        if ordinal is not None:
+            return self._resultOf(self._rankOf(ordinal) - 1, asString)
+        return self._result(self._rank(toOrdinal(dates)) - 1, asString)
+
+    def tradingDaysBetween(self, startDate, endDate):
+        """
+        [startDate, endDate] 内的交易日数量，包含两端
+        :param startDate : 开始日期或日期数组
+        :param endDate   : 结束日期或日期数组
+        :return: int或numpy.ndarray
+        """
+        start, end = _scalarOrdinal(startDate), _scalarOrdinal(endDate)
+        if start is not None and end is not None:
+            return max(self._rankOf(end + 1) - self._rankOf(start), 0)
+        return np.maximum(self._rank(toOrdinal(endDate) + 1) - self._rank(toOrdinal(startDate)), 0)
+
+    def shift(self, dates, n, asString: bool = True):
+        """
+        按交易日平移n天，n为0时非交易日滚动到下一交易日；非交易日向后平移时从上一交易日开始计算，
+        向前平移时从下一交易日开始计算，例如周六shift(1)为下周一
+        :param dates    : 日期或日期数组
+        :param n        : 平移的交易日数量，可以为负数或数组
+        :param asString : 是否返回yyyy-MM-dd格式的字符串，否则返回datetime64[D]
+        """
+        ordinal = _scalarOrdinal(dates)
+        if ordinal is not None and isinstance(n, (int, np.integer)):
+            index = self._rankOf(ordinal)
+            trading = index < len(self._days) and self._days[index] == ordinal
+            return self._resultOf((index if trading or n <= 0 else index - 1) + int(n), asString)
+        ordinals = toOrdinal(dates)
+        index = self._rank(ordinals)
+        trading = self._isTrading(ordinals, index)
+        n = np.asarray(n)
+        base = np.where(trading | (n <= 0), index, index - 1)
+        return self._result(base + n, asString)
+
+    def tradingDays(self, startDate=None, endDate=None) -> list:
+        """
+        [startDate, endDate] 内的交易日
+        :param startDate : 开始日期，为空时不限制
+        :param endDate   : 结束日期，为空时不限制
+        :return: list，yyyy-MM-dd格式，按日期排序
+        """
+        lo = 0 if startDate is None else int(self._rank(toOrdinal(startDate)))
+        hi = len(self.days) if endDate is None else int(self._rank(toOrdinal(endDate) + 1))
+        return fromOrdinal(self.days[lo:hi]).astype(str).tolist()
+
+    def covers(self, startDate, endDate) -> bool:
+        """
+        判断日历是否覆盖 [startDate, endDate]
+        """
+        return self.first <= int(toOrdinal(startDate)) and int(toOrdinal(endDate)) <= self.last
+
+
+def fetchDates(mtype: int, startDate: str, endDate: str, token: str) -> list:
+    """
+    请求交易日，mtype为MTYPE_STOCK时使用getStockTradeDate，否则使用getTradeDate
+    :param mtype     : 市场类型，取值范围：0|沪深股票市场；1|沪深京A股；2|港股；3|沪深港通-北向；4|沪深港通-南向
+    :param startDate : 开始日期，yyyy-MM-dd格式
+    :param endDate   : 结束日期，yyyy-MM-dd格式
+    :param token     : 令牌，登录后可获取
+    :return: list，yyyy-MM-dd格式
+    """
+    if mtype == MTYPE_STOCK:
+        data = stock_api.getStockTradeDate(str(startDate)[:10], str(endDate)[:10], "all", 1, token, "")
+    else:
+        data = stock_api.getTradeDate(mtype, str(startDate)[:10], str(endDate)[:10], "all", 1, token, "")
+    df = export_tool.toDataFrame(data)
+    if df.empty:
+        return []
+    field = "tdate" if "tdate" in df.columns else df.columns[0]
+    return sorted(set(df[field].astype(str).str[:10]))
+
+
+_calendars = {}
+_lock = threading.Lock()
+
+
+def getCalendar(mtype: int, token: str, startDate: str = None, endDate: str = None) -> TradeCalendar:
+    """
+    获取市场的交易日历，进程内缓存；缓存的日历不覆盖 [startDate, endDate] 时重新请求更大的范围
+    :param mtype     : 市场类型，取值范围：0|沪深股票市场；1|沪深京A股；2|港股；3|沪深港通-北向；4|沪深港通-南向
+    :param token     : 令牌，登录后可获取
+    :param startDate : 需要覆盖的开始日期，为空时为DEFAULT_START
+    :param endDate   : 需要覆盖的结束日期，为空时为今天起DEFAULT_YEARS_AHEAD年后
+    :return: TradeCalendar
+    """
+    today = datetime.date.today()
+    startDate = str(startDate or DEFAULT_START)[:10]
+    endDate = str(endDate or (today + datetime.timedelta(days=366 * DEFAULT_YEARS_AHEAD)).isoformat())[:10]
+    with _lock:
+        calendar = _calendars.get(mtype)
+        if calendar is not None and calendar.covers(startDate, endDate):
+            return calendar
+        if calendar is not None:
+            startDate = min(startDate, str(fromOrdinal(calendar.first)))
+            endDate = max(endDate, str(fromOrdinal(calendar.last)))
+        else:
+            startDate = min(startDate, DEFAULT_START)
+        calendar = TradeCalendar(fetchDates(mtype, startDate, endDate, token), startDate, endDate)
+        _calendars[mtype] = calendar
+        return calendar
+
+
+def setCalendar(mtype: int, calendar: TradeCalendar):
+    """
+    设置市场的交易日历，例如由本地文件加载的日历，为None时清除缓存
+    :param mtype    : 市场类型
+    :param calendar : TradeCalendar
+    """
+    with _lock:
+        if calendar is None:
+            _calendars.pop(mtype, None)
+        else:
+            _calendars[mtype] = calendar
@@ -1,7 +1,20 @@
 import json
+import re
+from operator import itemgetter
 
+import numpy as np
 import pandas as pd
 
+from waizao import schema_tool
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 日期字段的取值格式，例如：2024-01-02、2024-01-02 15:00:00
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2})?)?$")
+
 
 def toFile(file: str, data: str):
     """
@@ -13,24 +26,116 @@ def toFile(file: str, data: str):
         file.write(data)
 
 
-def toDataFrame(data: str) -> pd.DataFrame:
+def toDataFrame(data: str, endpoint: str = None) -> pd.DataFrame:
     """
     将请求返回的Json格式数据转换为DataFrame格式
     :param data: Json格式数据
+    :param endpoint: 接口名称，不为空时按schema_tool中注册的字段类型转换
     """
-    return pd.DataFrame(json.loads(data)["data"])
+    df = pd.DataFrame(loads(data)["data"])
+    return df if endpoint is None else schema_tool.applySchema(df, endpoint)
 
 
-def dataFrame(data: str) -> pd.DataFrame:
+def dataFrame(data: str, endpoint: str = None) -> pd.DataFrame:
     """
     将请求返回的DataFrame格式数据重新转换为DataFrame格式
     :param data: DataFrame格式数据（数据中zh为中文标题，en为英文标题）
+    :param endpoint: 接口名称，不为空时按schema_tool中注册的字段类型转换
     """
-    json_data = json.loads(data)
+    json_data = loads(data)
     temp_df = pd.DataFrame(json_data["data"])
+    if json_data.get("en") and len(json_data["en"]) == len(temp_df.columns):
+        # 行为列表时列名为0..n，先按英文标题命名，字段类型才能按名称匹配
+        temp_df.columns = json_data["en"]
+    if endpoint is not None:
+        temp_df = schema_tool.applySchema(temp_df, endpoint)
     temp_df.columns = json_data["zh"]  # 请求数据对应的字段名称
     return temp_df
 
 
+def loads(data):
+    """
+    解析Json字符串，安装了orjson时使用orjson，否则使用标准库json
+    :param data: Json格式数据，字符串或bytes
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _column(values, dtype=None) -> np.ndarray:
+    # 按指定类型或第一个非空值推断类型，将一列取值转换为NumPy数组
+    if dtype is None:
+        first = next((value for value in values if value is not None), None)
+        if isinstance(first, bool):
+            dtype = "bool" if None not in values else "object"
+        elif isinstance(first, int):
+            array = np.array(values)
+            if array.dtype.kind in "if":
+                return array
+            dtype = "float64"
+        elif isinstance(first, float):
+            dtype = "float64"
+        elif isinstance(first, str) and _DATE.match(first):
+            dtype = "datetime64[s]"
+        else:
+            dtype = "object"
+    if dtype == "category":
+        return pd.Categorical(values)
+    if dtype in ("str", "object"):
+        return np.array(values, dtype=object)
+    try:
+        if np.dtype(dtype).kind in "iu":
+            # 整数列超出范围时使用int64，存在空值时使用float64，空值为NaN
+            return schema_tool.toInt(values, dtype)
+        if np.dtype(dtype).kind == "b" and None in values:
+            return np.array(values, dtype="float64")
+        return np.array(values, dtype=dtype)
+    except (TypeError, ValueError):
+        return np.array(values, dtype=object)
+
+
+def _pick(rows: list, name) -> list:
+    # 按列取值，map(itemgetter)在C层面循环，比逐行构造dict再交给DataFrame推断类型快得多
+    try:
+        return list(map(itemgetter(name), rows))
+    except KeyError:
+        return [row.get(name) for row in rows]
+
+
+def toColumns(data, schema: dict = None) -> dict:
+    """
+    将请求返回的Json格式数据直接解析为按列存储的NumPy数组，不经过逐行的dict和DataFrame类型推断
+    :param data  : Json格式数据（export为1）或DataFrame格式数据（export为5），字符串或bytes
+    :param schema: 字段类型，例如{"close": "float64", "cjl": "int64", "tdate": "datetime64[s]", "code": "category"}，
+                   未指定的字段按第一个非空值推断：整数为int64，小数为float64，日期为datetime64[s]，其他为object
+    :return: dict，{字段名称: numpy.ndarray}
+    """
+    payload = loads(data)
+    rows = payload["data"]
+    if not rows:
+        return {}
+    if isinstance(rows[0], dict):
+        names = list(rows[0])
+        values = [_pick(rows, name) for name in names]
+    else:
+        names = payload.get("en") or list(range(len(rows[0])))
+        values = [list(map(itemgetter(index), rows)) for index in range(len(names))]
+    schema = schema or {}
+    return {name: _column(column, schema.get(name)) for name, column in zip(names, values)}
+
+
+def toFrame(data, schema: dict = None, endpoint: str = None) -> pd.DataFrame:
+    """
+    将请求返回的Json格式数据快速转换为DataFrame，各字段为带类型的列，日期字段为datetime64
+    :param data    : Json格式数据（export为1）或DataFrame格式数据（export为5），字符串或bytes
+    :param schema  : 字段类型，同toColumns
+    :param endpoint: 接口名称，schema为空时使用schema_tool中注册的字段类型
+    """
+    if schema is None and endpoint is not None:
+        schema = schema_tool.getSchema(endpoint)
+    return pd.DataFrame(toColumns(data, schema), copy=False)
+
+
 if __name__ == '__main__':
     print("StockApiDemo")
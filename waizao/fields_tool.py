@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，字段投影工具。接口的fields参数为逗号分隔的字段或all，字段是已缓存响应字段子集的请求可以在本地按列投影得到，
+      不必重新请求；FieldPlanner在同一数据被多次以不同字段请求时，将请求放宽为all，之后的请求都由缓存投影得到
+http://www.waizaowang.com/
+"""
+
+import json
+import threading
+
+from waizao import export_tool
+
+ALL_FIELDS = "all"
+
+
+def parseFields(fields) -> list:
+    """
+    解析fields参数，all或空返回None，否则返回去重后的字段列表
+    :param fields : 逗号分隔的字段或all
+    """
+    if fields is None:
+        return None
+    names = []
+    for name in str(fields).split(","):
+        name = name.strip()
+        if name.lower() == ALL_FIELDS:
+            return None
+        if name and name not in names:
+            names.append(name)
+    return names or None
+
+
+def covers(fields, superset) -> bool:
+    """
+    判断superset的字段是否包含fields的所有字段
+    :param fields   : 请求的字段，逗号分隔的字段或all
+    :param superset : 已缓存的字段，逗号分隔的字段或all
+    """
+    wanted, available = parseFields(fields), parseFields(superset)
+    if available is None:
+        return True
+    return wanted is not None and set(wanted) <= set(available)
+
+
+def project(data: str, fields) -> str:
+    """
+    按字段投影接口返回的Json格式数据（export为1、3或5），字段按fields中的顺序排列；
+    数据中缺少请求的字段时返回None，调用方应改为请求接口
+    :param data   : Json格式数据
+    :param fields : 逗号分隔的字段或all
+    :return: str
+    """
+    names = parseFields(fields)
+    if names is None:
+        return data
+    payload = export_tool.loads(data)
+    rows = payload.get("data") or []
+    columns = payload.get("en")
+    if columns is not None:
+        # DataFrame格式：data为二维列表，en、zh为英文和中文标题
+        if not set(names) <= set(columns):
+            return None
+        indexes = [columns.index(name) for name in names]
+        payload["data"] = [[row[index] for index in indexes] for row in rows]
+        payload["en"] = names
+        if payload.get("zh") is not None:
+            payload["zh"] = [payload["zh"][index] for index in indexes]
+    elif rows:
+        if not set(names) <= set(rows[0]):
+            return None
+        payload["data"] = [{name: row[name] for name in names} for row in rows]
+    return json.dumps(payload, ensure_ascii=False)
+
+
+class FieldPlanner:
+    """
+    字段放宽策略：同一请求（不含fields）出现widen_after种不同的字段组合后，之后的请求按all请求并缓存，
+    endpoints中的接口始终按all请求。只有客户端启用了缓存时放宽才有意义
+    """
+
+    def __init__(self, widen_after: int = 2, endpoints=(), max_entries: int = 10000):
+        """
+        :param widen_after : 出现多少种不同的字段组合后放宽为all，为0时不按次数放宽
+        :param endpoints   : 始终放宽为all的接口名称
+        :param max_entries : 最多记录的请求数量，超出后清空重新统计
+        """
+        self.widen_after = widen_after
+        self.endpoints = set(endpoints or ())
+        self.max_entries = max_entries
+        self._seen = {}
+        self._lock = threading.Lock()
+
+    def plan(self, endpoint: str, params: dict) -> dict:
+        """
+        返回实际请求的参数，放宽时fields为all，否则返回原参数
+        :param endpoint : 接口名称
+        :param params   : 请求参数
+        """
+        names = parseFields(params.get("fields"))
+        if names is None:
+            return params
+        if endpoint in self.endpoints:
+            return dict(params, fields=ALL_FIELDS)
+        if not self.widen_after:
+            return params
+        key = json.dumps([endpoint, {key: str(value) for key, value in sorted(params.items())
+                                     if key != "fields" and value is not None}], ensure_ascii=False)
+        with self._lock:
+            if len(self._seen) >= self.max_entries:
+                self._seen.clear()
+            seen = self._seen.setdefault(key, set())
+            seen.add(",".join(sorted(names)))
+            widen = len(seen) >= self.widen_after
+        return dict(params, fields=ALL_FIELDS) if widen else params
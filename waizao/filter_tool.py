@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，本地过滤表达式。将接口filter参数的表达式（例如open>=15、close>10 and hsl<5、(zdf>9 or zdf<-9)）
+      编译为向量化的布尔掩码，对缓存的DataFrame、列字典或Arrow表在本地重新过滤，不必为每个筛选条件重新请求接口
+http://www.waizaowang.com/
+"""
+
+import functools
+import json
+import re
+
+import numpy as np
+import pandas as pd
+
+from waizao import export_tool
+
+# 逻辑运算符
+AND_TOKENS = ("and", "&&", "&")
+OR_TOKENS = ("or", "||", "|")
+
+_TOKEN = re.compile(r"""\s*(?:
+    (?P<string>'[^']*'|"[^"]*")|
+    (?P<op>>=|<=|!=|<>|==|=|>|<)|
+    (?P<logic>&&|\|\||&|\|)|
+    (?P<paren>[()])|
+    (?P<word>[^\s()<>=!&|'"]+)
+)""", re.VERBOSE)
+
+
+class FilterError(ValueError):
+    """
+    过滤表达式无法解析，或引用了数据中不存在的字段
+    """
+
+
+def tokenize(expr: str) -> list:
+    """
+    将过滤表达式拆分为 (类型, 取值) 列表，类型为string、op、logic、paren、word
+    :param expr : 过滤表达式
+    """
+    tokens = []
+    position = 0
+    expr = expr.strip()
+    while position < len(expr):
+        match = _TOKEN.match(expr, position)
+        if match is None or match.end() == position:
+            raise FilterError("过滤表达式无法解析：%s" % expr[position:])
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "word" and value.lower() in ("and", "or"):
+            kind, value = "logic", value.lower()
+        tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+
+def _compare(values, op: str, value):
+    if op in ("=", "=="):
+        return values == value
+    if op in ("!=", "<>"):
+        return values != value
+    if op == ">=":
+        return values >= value
+    if op == "<=":
+        return values <= value
+    if op == ">":
+        return values > value
+    return values < value
+
+
+class Filter:
+    """
+    编译后的过滤表达式，mask(data)返回布尔数组，空表达式匹配所有数据
+    """
+
+    def __init__(self, expr: str):
+        """
+        :param expr : 过滤表达式，例如：open>=15
+        """
+        self.expr = (expr or "").strip()
+        self.fields = set()
+        self._tokens = tokenize(self.expr) if self.expr else []
+        self._position = 0
+        self._tree = self._parseOr() if self._tokens else None
+        if self._position < len(self._tokens):
+            raise FilterError("过滤表达式无法解析：%s" % self.expr)
+
+    def _peek(self):
+        return self._tokens[self._position] if self._position < len(self._tokens) else (None, None)
+
+    def _next(self):
+        token = self._peek()
+        if token[0] is None:
+            raise FilterError("过滤表达式不完整：%s" % self.expr)
+        self._position += 1
+        return token
+
+    def _parseOr(self):
+        nodes = [self._parseAnd()]
+        while self._peek()[0] == "logic" and self._peek()[1] in OR_TOKENS:
+            self._position += 1
+            nodes.append(self._parseAnd())
+        return nodes[0] if len(nodes) == 1 else ("or", nodes)
+
+    def _parseAnd(self):
+        nodes = [self._parseFactor()]
+        while self._peek()[0] == "logic" and self._peek()[1] in AND_TOKENS:
+            self._position += 1
+            nodes.append(self._parseFactor())
+        return nodes[0] if len(nodes) == 1 else ("and", nodes)
+
+    def _parseFactor(self):
+        kind, value = self._next()
+        if (kind, value) == ("paren", "("):
+            node = self._parseOr()
+            if self._next() != ("paren", ")"):
+                raise FilterError("过滤表达式括号不匹配：%s" % self.expr)
+            return node
+        if kind != "word":
+            raise FilterError("过滤表达式无法解析：%s" % self.expr)
+        op_kind, op = self._next()
+        if op_kind != "op":
+            raise FilterError("缺少比较运算符：%s" % self.expr)
+        value_kind, operand = self._next()
+        if value_kind == "string":
+            operand, quoted = operand[1:-1], True
+        elif value_kind == "word":
+            quoted = False
+        else:
+            raise FilterError("缺少比较值：%s" % self.expr)
+        self.fields.add(value)
+        return ("cmp", value, op, operand, quoted)
+
+    def mask(self, data) -> np.ndarray:
+        """
+        计算布尔掩码，空值不满足任何比较条件
+        :param data : pandas.DataFrame、{字段名称: numpy数组}或pyarrow.Table
+        :return: numpy.ndarray，bool类型
+        """
+        rows = _length(data)
+        if self._tree is None:
+            return np.ones(rows, dtype=bool)
+        return self._evaluate(self._tree, data, rows)
+
+    def _evaluate(self, node, data, rows: int) -> np.ndarray:
+        if node[0] == "and":
+            result = self._evaluate(node[1][0], data, rows)
+            for child in node[1][1:]:
+                result = result & self._evaluate(child, data, rows)
+            return result
+        if node[0] == "or":
+            result = self._evaluate(node[1][0], data, rows)
+            for child in node[1][1:]:
+                result = result | self._evaluate(child, data, rows)
+            return result
+        _, field, op, operand, quoted = node
+        values = _columnValues(data, field)
+        if values.dtype.kind in "iufb" and not quoted:
+            try:
+                operand = float(operand)
+            except ValueError:
+                raise FilterError("字段%s为数值类型，比较值%s无效" % (field, operand)) from None
+        elif values.dtype.kind == "M":
+            operand = np.datetime64(pd.Timestamp(operand)).astype(values.dtype)
+        else:
+            values = pd.Series(values, dtype=object)
+            notna = values.notna().to_numpy()
+            values = values.astype(str).to_numpy(dtype=object)
+            return np.asarray(_compare(values, op, operand), dtype=bool) & notna
+        with np.errstate(invalid="ignore"):
+            return np.asarray(_compare(values, op, operand), dtype=bool)
+
+
+def _length(data) -> int:
+    if isinstance(data, dict):
+        return len(next(iter(data.values()))) if data else 0
+    if hasattr(data, "num_rows"):
+        return data.num_rows
+    return len(data)
+
+
+def _columnValues(data, field: str) -> np.ndarray:
+    try:
+        if hasattr(data, "column_names") and not isinstance(data, pd.DataFrame):
+            values = data.column(field).to_numpy(zero_copy_only=False)
+        else:
+            values = data[field]
+    except KeyError:
+        raise FilterError("数据中没有字段%s" % field) from None
+    if isinstance(values, pd.Series):
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            return values.astype(object).to_numpy()
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            return values.to_numpy(dtype="float64", na_value=np.nan)
+        return values.to_numpy()
+    return np.asarray(values)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(expr: str) -> Filter:
+    return Filter(expr)
+
+
+def compileFilter(expr: str) -> Filter:
+    """
+    编译过滤表达式，最近使用的表达式只编译一次
+    :param expr : 过滤表达式，例如：open>=15
+    """
+    return _compile((expr or "").strip())
+
+
+def applyFilter(data, expr: str):
+    """
+    按过滤表达式筛选数据，返回与输入相同类型的数据
+    :param data : pandas.DataFrame、{字段名称: numpy数组}或pyarrow.Table
+    :param expr : 过滤表达式，例如：open>=15
+    """
+    mask = compileFilter(expr).mask(data)
+    if isinstance(data, pd.DataFrame):
+        return data[mask]
+    if isinstance(data, dict):
+        return {name: values[mask] for name, values in data.items()}
+    import pyarrow
+    return data.filter(pyarrow.array(mask))
+
+
+def filterResponse(data: str, expr: str) -> str:
+    """
+    按过滤表达式筛选接口返回的Json格式数据（export为1、3或5），返回格式相同的Json字符串
+    :param data : Json格式数据
+    :param expr : 过滤表达式，例如：open>=15
+    """
+    payload = export_tool.loads(data)
+    rows = payload.get("data") or []
+    if not rows or not (expr or "").strip():
+        return data if isinstance(data, str) else data.decode("utf-8")
+    mask = compileFilter(expr).mask(export_tool.toColumns(data))
+    payload["data"] = [rows[index] for index in np.flatnonzero(mask)]
+    return json.dumps(payload, ensure_ascii=False)
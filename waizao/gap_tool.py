@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，缺失K线检测与修复工具。将本地缓存的getDayKLine、getMinuteKLine数据按交易日历展开为 (股票数量 × 交易日数量)
+      的布尔矩阵，扣除上市前、退市后和停牌的交易日后向量化找出缺失的连续区间，合并相近的区间，
+      并将相同区间的股票按50个一组，生成最少的补数请求，只重新下载缺失的部分
+http://www.waizaowang.com/
+"""
+
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from waizao import batch_tool
+from waizao import calendar_tool
+from waizao import export_tool
+from waizao import range_tool
+
+
+def _codes(values) -> np.ndarray:
+    return np.asarray(pd.Series(values).astype(str).to_numpy(dtype=object))
+
+
+def detectGaps(bars: pd.DataFrame, calendar, startDate: str = None, endDate: str = None,
+               listings: pd.DataFrame = None, suspended: pd.DataFrame = None, bars_per_day: int = None,
+               merge_days: int = 0) -> pd.DataFrame:
+    """
+    检测缺失的交易日。股票的应有区间为 [上市日期, 退市日期] 与 [startDate, endDate] 的交集，
+    未提供上市日期时从该股票的第一根K线开始；停牌的交易日不计为缺失
+    例如：detectGaps(store.readFrame(1, 101, 0), calendar_tool.getCalendar(1, token), "2020-01-01", "2024-12-31")
+    :param bars         : K线数据，包含code、tdate字段，例如KLineStore.readFrame的返回值；没有这两个字段时视为没有K线
+    :param calendar     : calendar_tool.TradeCalendar
+    :param startDate    : 检测的开始日期，为空时为最早的K线日期或上市日期
+    :param endDate      : 检测的结束日期，为空时为最晚的K线日期；没有K线时为今天（不超过交易日历的范围）
+    :param listings     : 上市和退市日期，包含code、start、end字段，end为空表示未退市
+    :param suspended    : 停牌（或其他无交易）的日期，包含code、tdate字段，每个停牌交易日一行
+    :param bars_per_day : 每个交易日应有的K线数量，例如1分钟K线为241；为空时有一根K线即视为完整
+    :param merge_days   : 同一股票相隔不超过merge_days个交易日的缺失区间合并为一个区间
+    :return: pandas.DataFrame，字段为code、startDate、endDate（yyyy-MM-dd格式）和days（缺失的交易日数量）
+    """
+    columns = ["code", "startDate", "endDate", "days"]
+    if "code" not in bars.columns or "tdate" not in bars.columns:
+        # 空的KLineStore.readFrame返回没有字段的DataFrame，按没有K线处理
+        bars = pd.DataFrame({"code": pd.Series(dtype=object), "tdate": pd.Series(dtype="datetime64[ns]")})
+    if bars.empty and listings is None:
+        return pd.DataFrame(columns=columns)
+    ordinals = calendar_tool.toOrdinal(np.asarray(pd.to_datetime(bars["tdate"])))
+    if startDate is None:
+        known = ordinals
+        if listings is not None:
+            starts = pd.to_datetime(listings["start"]).dropna()
+            known = np.concatenate([ordinals, calendar_tool.toOrdinal(np.asarray(starts))])
+        if not len(known):
+            raise ValueError("K线和上市日期均为空时必须指定startDate")
+        startDate = str(calendar_tool.fromOrdinal(known.min()))
+    if endDate is None:
+        if len(ordinals):
+            endDate = str(calendar_tool.fromOrdinal(ordinals.max()))
+        else:
+            today = int(calendar_tool.toOrdinal(datetime.date.today().isoformat()))
+            endDate = str(calendar_tool.fromOrdinal(min(today, calendar.last)))
+    days = calendar.days
+    lo = int(np.searchsorted(days, calendar_tool.toOrdinal(startDate), side="left"))
+    hi = int(np.searchsorted(days, calendar_tool.toOrdinal(endDate), side="right"))
+    width = hi - lo
+    bar_codes = _codes(bars["code"])
+    all_codes = bar_codes if listings is None else np.concatenate([bar_codes, _codes(listings["code"])])
+    codes, inverse = np.unique(all_codes, return_inverse=True)
+    if width <= 0 or not len(codes):
+        return pd.DataFrame(columns=columns)
+    row = inverse[:len(bar_codes)]
+
+    # 每只股票每个交易日的K线数量，非交易日和窗口外的K线忽略
+    index, trading = _locate(days, ordinals)
+    trading &= (index >= lo) & (index < hi)
+    flat = row[trading] * width + (index[trading] - lo)
+    counts = np.bincount(flat, minlength=len(codes) * width).reshape(len(codes), width)
+    present = counts >= (bars_per_day or 1)
+
+    # 应有区间，以交易日在窗口内的列号表示
+    first = np.full(len(codes), width, dtype="int64")
+    np.minimum.at(first, row[trading], index[trading] - lo)
+    last = np.full(len(codes), width - 1, dtype="int64")
+    if listings is not None:
+        position = np.searchsorted(codes, _codes(listings["code"]))
+        start = calendar_tool.toOrdinal(np.asarray(pd.to_datetime(listings["start"])))
+        first[position] = np.clip(np.searchsorted(days, start, side="left") - lo, 0, width)
+        if "end" in listings.columns:
+            end = pd.to_datetime(listings["end"])
+            ended = end.notna().to_numpy()
+            end_ordinals = calendar_tool.toOrdinal(np.asarray(end[ended]))
+            end_columns = np.searchsorted(days, end_ordinals, side="right") - lo - 1
+            last[position[ended]] = np.clip(end_columns, -1, width - 1)
+    cols = np.arange(width)
+    expected = (cols >= first[:, None]) & (cols <= last[:, None])
+    if suspended is not None and not suspended.empty:
+        suspended_codes = _codes(suspended["code"])
+        position = np.searchsorted(codes, suspended_codes)
+        known = (position < len(codes)) & (codes[np.minimum(position, len(codes) - 1)] == suspended_codes)
+        suspended_days = calendar_tool.toOrdinal(np.asarray(pd.to_datetime(suspended["tdate"])))
+        days_index, is_trading = _locate(days, suspended_days)
+        known &= is_trading & (days_index >= lo) & (days_index < hi)
+        expected[position[known], days_index[known] - lo] = False
+    missing = expected & ~present
+
+    # 按行找出连续的缺失区间，行优先的顺序保证开始和结束一一对应
+    padded = np.zeros((len(codes), width + 2), dtype="int8")
+    padded[:, 1:-1] = missing
+    change = np.diff(padded, axis=1)
+    run_rows, run_starts = np.nonzero(change == 1)
+    _, run_ends = np.nonzero(change == -1)
+    run_ends = run_ends - 1
+    if not len(run_rows):
+        return pd.DataFrame(columns=columns)
+    gap_days = run_ends - run_starts + 1
+    if merge_days and len(run_rows) > 1:
+        new = np.r_[True, (run_rows[1:] != run_rows[:-1]) | (run_starts[1:] - run_ends[:-1] - 1 > merge_days)]
+        group = np.cumsum(new) - 1
+        run_rows = run_rows[new]
+        run_starts = run_starts[new]
+        run_ends = np.maximum.reduceat(run_ends, np.flatnonzero(new))
+        gap_days = np.bincount(group, weights=gap_days).astype("int64")
+    return pd.DataFrame({
+        "code": codes[run_rows],
+        "startDate": calendar_tool.fromOrdinal(days[lo + run_starts]).astype(str),
+        "endDate": calendar_tool.fromOrdinal(days[lo + run_ends]).astype(str),
+        "days": gap_days,
+    })
+
+
+def _locate(days: np.ndarray, ordinals: np.ndarray) -> tuple:
+    # 日期在交易日数组中的位置，以及是否为交易日
+    index = np.searchsorted(days, ordinals, side="left")
+    trading = (index < len(days)) & (days[np.minimum(index, len(days) - 1)] == ordinals)
+    return index, trading
+
+
+def planRepairs(gaps: pd.DataFrame, calendar=None, days: int = None,
+                chunk_size: int = batch_tool.MAX_CODES) -> list:
+    """
+    由缺失区间生成补数请求：相同区间的股票按chunk_size个一组合并为一个请求，超过days个交易日的区间按交易日拆分
+    :param gaps       : detectGaps的返回值
+    :param calendar   : calendar_tool.TradeCalendar，拆分区间时需要
+    :param days       : 每个请求的最大交易日数量，为空时不拆分，例如range_tool.windowDays("getMinuteKLine", codes=chunk_size)
+    :param chunk_size : 每组股票数量，默认50
+    :return: list，[(股票代码分组, (开始日期, 结束日期)), ...]，与range_tool.planTasks的格式相同
+    """
+    tasks = []
+    if gaps.empty:
+        return tasks
+    for (start, end), group in gaps.groupby(["startDate", "endDate"], sort=True):
+        windows = [(start, end)]
+        if days and calendar is not None:
+            windows = range_tool.planWindows(calendar.tradingDays(start, end), days)
+        for chunk in batch_tool.chunkCodes(sorted(group["code"]), chunk_size):
+            tasks.extend((chunk, window) for window in windows)
+    return tasks
+
+
+def repair(func, tasks: list, token: str, store, type: int, ktype: int, fq: int = 0, max_workers: int = 4,
+           **kwargs) -> int:
+    """
+    执行补数请求并写入KLineStore
+    例如：repair(stock_api.getDayKLine, planRepairs(gaps), token, store, 1, 101, 0)
+    :param func        : 接口函数，例如：stock_api.getDayKLine、stock_api.getMinuteKLine
+    :param tasks       : planRepairs的返回值
+    :param token       : 令牌，登录后可获取
+    :param store       : waizao.store.KLineStore
+    :param type        : 资产类型
+    :param ktype       : K线类别，同时作为接口的ktype参数，getMinuteKLine取1
+    :param fq          : 复权信息，同时作为接口的fq参数
+    :param max_workers : 并发线程数
+    :param kwargs      : 接口的其余参数，按参数名传入
+    :return: int，写入的K线数量
+    """
+    if not tasks:
+        return 0
+    kwargs.update(type=type, ktype=ktype, fq=fq)
+
+    def fetch(task):
+        return range_tool.fetchTask(func, task, token, **kwargs)
+
+    rows = 0
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        for data in executor.map(fetch, tasks):
+            df = export_tool.toDataFrame(data)
+            if not df.empty:
+                store.write(df, type, ktype, fq)
+                rows += len(df)
+    return rows
@@ -0,0 +1,5 @@
+"""
+歪枣网，本地技术指标计算
+"""
+
+from waizao.indicator.panel import Panel
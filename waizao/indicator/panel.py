@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，K线面板数据。将多只股票的K线整理为 (股票数量 × K线数量) 的二维数组，供本地指标一次性向量化计算
+http://www.waizaowang.com/
+"""
+
+import numpy as np
+import pandas as pd
+
+# 指标接口中数据标签的取值：1|open-开盘价；2|close-收盘价；3|high-最高价；4|low-最低价；5|cjl-成交量；6|cje-成交额
+LABELS = {1: "open", 2: "close", 3: "high", 4: "low", 5: "cjl", 6: "cje"}
+
+FIELDS = ("open", "close", "high", "low", "cjl", "cje")
+
+
+class Panel:
+    """
+    K线面板数据，每行为一只股票，每列为一根K线。
+    每只股票的K线右对齐（最后一根K线位于最后一列），上市较晚或数据较短的股票左侧以NaN填充，
+    因此每行都是该股票连续的K线序列，与逐只股票调用指标接口的计算结果一致。
+    """
+
+    def __init__(self, codes, tdate: np.ndarray, fields: dict):
+        """
+        :param codes  : 股票代码，长度为股票数量
+        :param tdate  : 交易时间，二维datetime64数组，填充位置为NaT
+        :param fields : {字段名: 二维float64数组}，字段包括open、close、high、low、cjl、cje
+        """
+        self.codes = np.asarray(codes)
+        self.tdate = tdate
+        self.fields = fields
+
+    @property
+    def shape(self) -> tuple:
+        return self.tdate.shape
+
+    @classmethod
+    def fromDataFrame(cls, df: pd.DataFrame) -> "Panel":
+        """
+        由K线DataFrame构建面板，例如export_tool.toDataFrame(stock_api.getDayKLine(...))的返回值
+        :param df : K线数据，包含code、tdate及open、close、high、low、cjl、cje中的部分字段
+        :return: Panel
+        """
+        df = df.sort_values(["code", "tdate"], kind="stable")
+        codes, row = np.unique(df["code"].astype(str).to_numpy(), return_inverse=True)
+        counts = np.bincount(row, minlength=len(codes))
+        width = int(counts.max()) if len(counts) else 0
+        # 组内序号，按右对齐换算为列号
+        starts = np.r_[0, np.cumsum(counts)[:-1]]
+        rank = np.arange(len(row)) - starts[row]
+        col = width - counts[row] + rank
+        tdate = np.full((len(codes), width), np.datetime64("NaT"), dtype="datetime64[s]")
+        tdate[row, col] = pd.to_datetime(df["tdate"]).to_numpy().astype("datetime64[s]")
+        fields = {}
+        for name in FIELDS:
+            if name in df.columns:
+                values = np.full((len(codes), width), np.nan)
+                values[row, col] = pd.to_numeric(df[name], errors="coerce").to_numpy(dtype="float64")
+                fields[name] = values
+        return cls(codes, tdate, fields)
+
+    @classmethod
+    def fromStore(cls, store, type: int, ktype: int, fq: int, codes=None, startDate: str = None,
+                  endDate: str = None) -> "Panel":
+        """
+        由本地K线存储构建面板
+        :param store     : waizao.store.KLineStore
+        :param type      : 资产类型
+        :param ktype     : K线类别
+        :param fq        : 复权信息
+        :param codes     : 股票代码，列表或逗号分隔的字符串，为空时读取全部
+        :param startDate : 开始日期
+        :param endDate   : 结束日期
+        :return: Panel
+        """
+        return cls.fromDataFrame(store.readFrame(type, ktype, fq, codes, startDate, endDate))
+
+    def field(self, label) -> np.ndarray:
+        """
+        获取字段的二维数组
+        :param label : 数据标签，取值范围：1|open-开盘价；2|close-收盘价；3|high-最高价；4|low-最低价；5|cjl-成交量；6|cje-成交额；也可以直接传字段名
+        """
+        name = LABELS[int(label)] if str(label).isdigit() else label
+        if name not in self.fields:
+            raise KeyError("面板数据中缺少字段：%s" % name)
+        return self.fields[name]
+
+    def toDataFrame(self, result, name: str = "value") -> pd.DataFrame:
+        """
+        将指标计算结果转换为长表DataFrame，包含code、tdate及指标字段，只保留有K线的位置
+        :param result : 二维数组，或 {指标字段: 二维数组}
+        :param name   : result为二维数组时的指标字段名
+        :return: pandas.DataFrame
+        """
+        if not isinstance(result, dict):
+            result = {name: result}
+        mask = ~np.isnat(self.tdate)
+        rows, _ = np.nonzero(mask)
+        df = pd.DataFrame({"code": self.codes[rows], "tdate": self.tdate[mask]})
+        for key, values in result.items():
+            df[key] = values[mask]
+        return df
@@ -0,0 +1,560 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，本地K线形态识别。函数名与stock_api.py中的getIndicatorTaCdl*接口保持一致，
+      scan一次性计算面板中所有股票的全部形态，实体、影线、振幅及其均值等中间结果在形态之间共享，
+      返回 (code, tdate, pattern, signal) 的稀疏命中表。signal取值：100|看涨；-100|看跌。
+      形态判定参照TA-Lib的默认K线参数：长实体、短实体、十字星等以前若干根K线的均值为基准。
+http://www.waizaowang.com/
+"""
+
+import numpy as np
+import pandas as pd
+
+from waizao.indicator.panel import Panel
+from waizao.indicator.ta import _shift, _sma
+
+# 形态名称 -> (计算函数, input默认值)
+PATTERNS = {}
+
+
+class Candle:
+    """
+    K线形态的共享中间结果，按 (名称, 向前偏移的K线数量) 缓存，k=0为当前K线，k=1为前一根K线
+    """
+
+    def __init__(self, panel: Panel):
+        self.panel = panel
+        self._cache = {}
+
+    def _get(self, key, factory):
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    def _series(self, name, k=0):
+        if k:
+            return self._get((name, k), lambda: _shift(self._series(name), k))
+        return self._get((name, 0), lambda: self._base(name))
+
+    def _base(self, name):
+        panel = self.panel
+        if name in ("open", "high", "low", "close"):
+            return panel.field(name)
+        o, h, l, c = self.o(), self.h(), self.l(), self.c()
+        if name == "body":
+            return np.abs(c - o)
+        if name == "range":
+            return h - l
+        if name == "top":
+            return np.fmax(o, c)
+        if name == "bottom":
+            return np.fmin(o, c)
+        if name == "upper":
+            return h - self.top()
+        if name == "lower":
+            return self.bottom() - l
+        if name == "shadows":
+            return (self.upper() + self.lower()) / 2
+        if name == "color":
+            return np.sign(c - o)
+        raise KeyError(name)
+
+    def o(self, k=0):
+        return self._series("open", k)
+
+    def h(self, k=0):
+        return self._series("high", k)
+
+    def l(self, k=0):
+        return self._series("low", k)
+
+    def c(self, k=0):
+        return self._series("close", k)
+
+    def body(self, k=0):
+        return self._series("body", k)
+
+    def range(self, k=0):
+        return self._series("range", k)
+
+    def top(self, k=0):
+        return self._series("top", k)
+
+    def bottom(self, k=0):
+        return self._series("bottom", k)
+
+    def upper(self, k=0):
+        return self._series("upper", k)
+
+    def lower(self, k=0):
+        return self._series("lower", k)
+
+    def white(self, k=0):
+        return self._series("color", k) == 1
+
+    def black(self, k=0):
+        return self._series("color", k) == -1
+
+    def color(self, k=0):
+        return self._series("color", k)
+
+    def average(self, name, period, k=0):
+        """
+        第k根K线之前period根K线的均值，不含第k根K线本身
+        """
+        return self._get(("average", name, period, k),
+                         lambda: _shift(_sma(self._series(name), period), k + 1))
+
+    # TA-Lib默认K线参数
+    def bodyLong(self, k=0):
+        return self.body(k) > self.average("body", 10, k)
+
+    def bodyVeryLong(self, k=0):
+        return self.body(k) > 3 * self.average("body", 10, k)
+
+    def bodyShort(self, k=0):
+        return self.body(k) < self.average("body", 10, k)
+
+    def doji(self, k=0):
+        return self.body(k) <= 0.1 * self.average("range", 10, k)
+
+    def veryShort(self, shadow, k=0):
+        return shadow < 0.1 * self.average("range", 10, k)
+
+    def short(self, shadow, k=0):
+        return shadow < self.average("shadows", 10, k)
+
+    def near(self, k=0):
+        return 0.2 * self.average("range", 5, k)
+
+    def far(self, k=0):
+        return 0.6 * self.average("range", 5, k)
+
+    def equal(self, k=0):
+        return 0.05 * self.average("range", 5, k)
+
+    def marubozu(self, k=0):
+        return self.bodyLong(k) & self.veryShort(self.upper(k), k) & self.veryShort(self.lower(k), k)
+
+    def gapUp(self, k=0):
+        # 第k根K线的实体跳空高于第k+1根K线的实体
+        return self.bottom(k) > self.top(k + 1)
+
+    def gapDown(self, k=0):
+        return self.top(k) < self.bottom(k + 1)
+
+
+def _signal(bull=None, bear=None) -> np.ndarray:
+    signal = 0
+    if bull is not None:
+        signal = np.where(bull, 100, signal)
+    if bear is not None:
+        signal = np.where(bear, -100, signal)
+    return np.asarray(signal, dtype=np.int16)
+
+
+def _colored(condition, candle: Candle, k=0) -> np.ndarray:
+    # 按K线颜色给出看涨或看跌信号
+    return _signal(condition & candle.white(k), condition & candle.black(k))
+
+
+def _pattern(name, default=None):
+    def register(func):
+        PATTERNS[name] = (func, default)
+        return func
+
+    return register
+
+
+# ---------------------------------------------------------------- 单日形态
+
+@_pattern("CdlDoji")
+def _doji(c: Candle, _):
+    return _signal(c.doji())
+
+
+@_pattern("CdlDragonflyDoji")
+def _dragonflyDoji(c: Candle, _):
+    return _signal(c.doji() & c.veryShort(c.upper()) & ~c.veryShort(c.lower()))
+
+
+@_pattern("CdlGravestoneDoji")
+def _gravestoneDoji(c: Candle, _):
+    return _signal(c.doji() & c.veryShort(c.lower()) & ~c.veryShort(c.upper()))
+
+
+@_pattern("CdlLongLeggedDoji")
+def _longLeggedDoji(c: Candle, _):
+    return _signal(c.doji() & ((c.lower() > c.body()) | (c.upper() > c.body())))
+
+
+@_pattern("CdlRickshawMan")
+def _rickshawMan(c: Candle, _):
+    middle = c.l() + c.range() / 2
+    return _signal(c.doji() & (c.lower() > c.body()) & (c.upper() > c.body())
+                   & (c.bottom() <= middle + c.near()) & (c.top() >= middle - c.near()))
+
+
+@_pattern("CdlTakuri")
+def _takuri(c: Candle, _):
+    return _signal(c.doji() & c.veryShort(c.upper()) & (c.lower() > 2 * c.body()) & ~c.veryShort(c.lower()))
+
+
+@_pattern("CdlSpinningTop")
+def _spinningTop(c: Candle, _):
+    return _colored(c.bodyShort() & (c.upper() > c.body()) & (c.lower() > c.body()), c)
+
+
+@_pattern("CdlHignWave")
+def _highWave(c: Candle, _):
+    return _colored(c.bodyShort() & (c.upper() > 2 * c.body()) & (c.lower() > 2 * c.body()), c)
+
+
+@_pattern("CdlLongLine")
+def _longLine(c: Candle, _):
+    return _colored(c.bodyLong() & c.short(c.upper()) & c.short(c.lower()), c)
+
+
+@_pattern("CdlShortLine")
+def _shortLine(c: Candle, _):
+    return _colored(c.bodyShort() & c.short(c.upper()) & c.short(c.lower()), c)
+
+
+@_pattern("CdlMarubozu")
+def _marubozu(c: Candle, _):
+    return _colored(c.marubozu(), c)
+
+
+@_pattern("CdlClosingMarubozu")
+def _closingMarubozu(c: Candle, _):
+    return _signal(c.bodyLong() & c.white() & c.veryShort(c.upper()),
+                   c.bodyLong() & c.black() & c.veryShort(c.lower()))
+
+
+@_pattern("CdlBeltHold")
+def _beltHold(c: Candle, _):
+    return _signal(c.bodyLong() & c.white() & c.veryShort(c.lower()),
+                   c.bodyLong() & c.black() & c.veryShort(c.upper()))
+
+
+@_pattern("CdlHammer")
+def _hammer(c: Candle, _):
+    return _signal(c.bodyShort() & (c.lower() > c.body()) & c.veryShort(c.upper())
+                   & (c.bottom() <= c.l(1) + c.near(1)))
+
+
+@_pattern("CdlHangingMan")
+def _hangingMan(c: Candle, _):
+    return _signal(bear=c.bodyShort() & (c.lower() > c.body()) & c.veryShort(c.upper())
+                   & (c.bottom() >= c.h(1) - c.near(1)))
+
+
+@_pattern("CdlInvertedHammer")
+def _invertedHammer(c: Candle, _):
+    return _signal(c.bodyShort() & (c.upper() > c.body()) & c.veryShort(c.lower()) & c.gapDown())
+
+
+@_pattern("CdlShootingStar")
+def _shootingStar(c: Candle, _):
+    return _signal(bear=c.bodyShort() & (c.upper() > c.body()) & c.veryShort(c.lower()) & c.gapUp())
+
+
+# ---------------------------------------------------------------- 两日形态
+
+@_pattern("CdlEngulfing")
+def _engulfing(c: Candle, _):
+    bull = c.white() & c.black(1) & (c.c() >= c.o(1)) & (c.o() <= c.c(1)) & ((c.c() > c.o(1)) | (c.o() < c.c(1)))
+    bear = c.black() & c.white(1) & (c.o() >= c.c(1)) & (c.c() <= c.o(1)) & ((c.o() > c.c(1)) | (c.c() < c.o(1)))
+    return _signal(bull, bear)
+
+
+def _inside(c: Candle, k=0):
+    # 第k根K线的实体位于第k+1根K线的实体之内
+    return (c.top(k) < c.top(k + 1)) & (c.bottom(k) > c.bottom(k + 1))
+
+
+@_pattern("CdlHarami")
+def _harami(c: Candle, _):
+    condition = c.bodyLong(1) & c.bodyShort() & _inside(c)
+    return _signal(condition & c.black(1), condition & c.white(1))
+
+
+@_pattern("CdlHaramiCross")
+def _haramiCross(c: Candle, _):
+    condition = c.bodyLong(1) & c.doji() & _inside(c)
+    return _signal(condition & c.black(1), condition & c.white(1))
+
+
+@_pattern("CdlDarkCloudCover", 0.5)
+def _darkCloudCover(c: Candle, penetration):
+    return _signal(bear=c.white(1) & c.bodyLong(1) & c.black() & (c.o() > c.h(1))
+                   & (c.c() > c.o(1)) & (c.c() < c.c(1) - c.body(1) * penetration))
+
+
+@_pattern("CdlPiercing")
+def _piercing(c: Candle, _):
+    return _signal(c.black(1) & c.bodyLong(1) & c.white() & c.bodyLong() & (c.o() < c.l(1))
+                   & (c.c() < c.o(1)) & (c.c() > c.c(1) + c.body(1) * 0.5))
+
+
+@_pattern("CdlDojiStar")
+def _dojiStar(c: Candle, _):
+    return _signal(c.bodyLong(1) & c.black(1) & c.doji() & c.gapDown(),
+                   c.bodyLong(1) & c.white(1) & c.doji() & c.gapUp())
+
+
+@_pattern("CdlKicking")
+def _kicking(c: Candle, _):
+    condition = c.marubozu(1) & c.marubozu()
+    return _signal(condition & c.black(1) & c.white() & (c.l() > c.h(1)),
+                   condition & c.white(1) & c.black() & (c.h() < c.l(1)))
+
+
+@_pattern("CdlKickingByLength")
+def _kickingByLength(c: Candle, _):
+    condition = c.marubozu(1) & c.marubozu() & (c.color(1) == -c.color()) \
+        & (((c.l() > c.h(1)) & c.white()) | ((c.h() < c.l(1)) & c.black()))
+    longer = np.where(c.body() >= c.body(1), c.color(), c.color(1))
+    return _signal(condition & (longer == 1), condition & (longer == -1))
+
+
+@_pattern("CdlCounterAttack")
+def _counterAttack(c: Candle, _):
+    condition = (c.color(1) == -c.color()) & c.bodyLong(1) & c.bodyLong() & (np.abs(c.c() - c.c(1)) <= c.equal(1))
+    return _colored(condition, c)
+
+
+@_pattern("CdlHomingPigeon")
+def _homingPigeon(c: Candle, _):
+    return _signal(c.black(1) & c.black() & c.bodyLong(1) & c.bodyShort() & (c.o() < c.o(1)) & (c.c() > c.c(1)))
+
+
+@_pattern("CdlMatchingLow")
+def _matchingLow(c: Candle, _):
+    return _signal(c.black(1) & c.black() & (np.abs(c.c() - c.c(1)) <= c.equal(1)))
+
+
+@_pattern("CdlInNeck")
+def _inNeck(c: Candle, _):
+    return _signal(bear=c.black(1) & c.bodyLong(1) & c.white() & (c.o() < c.l(1))
+                   & (c.c() <= c.c(1) + c.equal(1)) & (c.c() >= c.c(1)))
+
+
+@_pattern("CdlOnNeck")
+def _onNeck(c: Candle, _):
+    return _signal(bear=c.black(1) & c.bodyLong(1) & c.white() & (c.o() < c.l(1))
+                   & (np.abs(c.c() - c.l(1)) <= c.equal(1)))
+
+
+@_pattern("CdlThrusting")
+def _thrusting(c: Candle, _):
+    return _signal(bear=c.black(1) & c.bodyLong(1) & c.white() & (c.o() < c.l(1))
+                   & (c.c() > c.c(1) + c.equal(1)) & (c.c() <= c.c(1) + c.body(1) * 0.5))
+
+
+@_pattern("CdlSeperatingLines")
+def _separatingLines(c: Candle, _):
+    condition = (c.color(1) == -c.color()) & (np.abs(c.o() - c.o(1)) <= c.equal(1)) & c.bodyLong()
+    return _signal(condition & c.white() & c.veryShort(c.lower()),
+                   condition & c.black() & c.veryShort(c.upper()))
+
+
+@_pattern("CdlHikkake")
+def _hikkake(c: Candle, _):
+    inside = (c.h(1) < c.h(2)) & (c.l(1) > c.l(2))
+    return _signal(inside & (c.h() < c.h(1)) & (c.l() < c.l(1)),
+                   inside & (c.h() > c.h(1)) & (c.l() > c.l(1)))
+
+
+# ---------------------------------------------------------------- 三日及以上形态
+
+def _star(c: Candle, penetration, middle):
+    bull = c.black(2) & c.bodyLong(2) & middle & c.gapDown(1) & c.white() \
+        & (c.c() > c.c(2) + c.body(2) * penetration)
+    bear = c.white(2) & c.bodyLong(2) & middle & c.gapUp(1) & c.black() \
+        & (c.c() < c.c(2) - c.body(2) * penetration)
+    return bull, bear
+
+
+@_pattern("CdlMorningStar", 0.3)
+def _morningStar(c: Candle, penetration):
+    return _signal(bull=_star(c, penetration, c.bodyShort(1))[0])
+
+
+@_pattern("CdlEveningStar", 0.3)
+def _eveningStar(c: Candle, penetration):
+    return _signal(bear=_star(c, penetration, c.bodyShort(1))[1])
+
+
+@_pattern("CdlMorningDojiStar", 0.3)
+def _morningDojiStar(c: Candle, penetration):
+    return _signal(bull=_star(c, penetration, c.doji(1))[0])
+
+
+@_pattern("CdlEveningDojiStar", 0.3)
+def _eveningDojiStar(c: Candle, penetration):
+    return _signal(bear=_star(c, penetration, c.doji(1))[1])
+
+
+@_pattern("CdlAbandonedBaby", 0.3)
+def _abandonedBaby(c: Candle, penetration):
+    condition = c.bodyLong(2) & c.doji(1)
+    bull = condition & c.black(2) & c.white() & (c.h(1) < c.l(2)) & (c.l() > c.h(1)) \
+        & (c.c() > c.c(2) + c.body(2) * penetration)
+    bear = condition & c.white(2) & c.black() & (c.l(1) > c.h(2)) & (c.h() < c.l(1)) \
+        & (c.c() < c.c(2) - c.body(2) * penetration)
+    return _signal(bull, bear)
+
+
+@_pattern("Cdl3WhiteSoldiers")
+def _threeWhiteSoldiers(c: Candle, _):
+    condition = c.white(2) & c.white(1) & c.white()
+    for k in (2, 1, 0):
+        condition = condition & c.veryShort(c.upper(k), k)
+    condition = condition & (c.c(1) > c.c(2)) & (c.c() > c.c(1)) \
+        & (c.o(1) > c.o(2)) & (c.o(1) <= c.c(2)) & (c.o() > c.o(1)) & (c.o() <= c.c(1))
+    return _signal(condition)
+
+
+@_pattern("Cdl3BlackCrows")
+def _threeBlackCrows(c: Candle, _):
+    condition = c.white(3) & c.black(2) & c.black(1) & c.black()
+    for k in (2, 1, 0):
+        condition = condition & c.veryShort(c.lower(k), k)
+    condition = condition & (c.c(2) < c.h(3)) & (c.c(1) < c.c(2)) & (c.c() < c.c(1)) \
+        & (c.o(1) < c.o(2)) & (c.o(1) > c.c(2)) & (c.o() < c.o(1)) & (c.o() > c.c(1))
+    return _signal(bear=condition)
+
+
+@_pattern("CdlIdentical3Crows")
+def _identicalThreeCrows(c: Candle, _):
+    condition = c.black(2) & c.black(1) & c.black()
+    for k in (2, 1, 0):
+        condition = condition & c.veryShort(c.lower(k), k)
+    condition = condition & (c.c(1) < c.c(2)) & (c.c() < c.c(1)) \
+        & (np.abs(c.o(1) - c.c(2)) <= c.equal(2)) & (np.abs(c.o() - c.c(1)) <= c.equal(1))
+    return _signal(bear=condition)
+
+
+@_pattern("Cdl3Inside")
+def _threeInside(c: Candle, _):
+    condition = c.bodyLong(2) & c.bodyShort(1) & _inside(c, 1)
+    return _signal(condition & c.black(2) & c.white() & (c.c() > c.o(2)),
+                   condition & c.white(2) & c.black() & (c.c() < c.o(2)))
+
+
+@_pattern("Cdl3Outside")
+def _threeOutside(c: Candle, _):
+    bull = c.white(1) & c.black(2) & (c.c(1) > c.o(2)) & (c.o(1) < c.c(2)) & (c.c() > c.c(1))
+    bear = c.black(1) & c.white(2) & (c.o(1) > c.c(2)) & (c.c(1) < c.o(2)) & (c.c() < c.c(1))
+    return _signal(bull, bear)
+
+
+@_pattern("Cdl2Crows")
+def _twoCrows(c: Candle, _):
+    return _signal(bear=c.white(2) & c.bodyLong(2) & c.black(1) & c.gapUp(1) & c.black()
+                   & (c.o() < c.o(1)) & (c.o() > c.c(1)) & (c.c() > c.o(2)) & (c.c() < c.c(2)))
+
+
+@_pattern("CdlUpsideGap2Crows")
+def _upsideGapTwoCrows(c: Candle, _):
+    return _signal(bear=c.white(2) & c.bodyLong(2) & c.black(1) & c.bodyShort(1) & c.gapUp(1) & c.black()
+                   & (c.o() > c.o(1)) & (c.c() < c.c(1)) & (c.c() > c.c(2)))
+
+
+@_pattern("CdlTristar")
+def _tristar(c: Candle, _):
+    condition = c.doji(2) & c.doji(1) & c.doji()
+    return _signal(condition & (c.top(1) < c.bottom(2)) & (c.bottom() > c.bottom(1)),
+                   condition & (c.bottom(1) > c.top(2)) & (c.top() < c.top(1)))
+
+
+@_pattern("CdlStickSandwhich")
+def _stickSandwich(c: Candle, _):
+    return _signal(c.black(2) & c.white(1) & c.black() & (c.l(1) > c.c(2))
+                   & (np.abs(c.c() - c.c(2)) <= c.equal(2)))
+
+
+@_pattern("CdlTasukiGap")
+def _tasukiGap(c: Candle, _):
+    similar = np.abs(c.body(1) - c.body()) < c.near(1)
+    bull = c.gapUp(1) & c.white(1) & c.black() & (c.o() < c.c(1)) & (c.o() > c.o(1)) \
+        & (c.c() < c.o(1)) & (c.c() > c.top(2)) & similar
+    bear = c.gapDown(1) & c.black(1) & c.white() & (c.o() < c.o(1)) & (c.o() > c.c(1)) \
+        & (c.c() > c.o(1)) & (c.c() < c.bottom(2)) & similar
+    return _signal(bull, bear)
+
+
+@_pattern("CdlXSideGap3Methods")
+def _sideGapThreeMethods(c: Candle, _):
+    bull = c.white(2) & c.white(1) & c.black() & c.gapUp(1) \
+        & (c.o() < c.c(1)) & (c.o() > c.o(1)) & (c.c() < c.c(2)) & (c.c() > c.o(2))
+    bear = c.black(2) & c.black(1) & c.white() & c.gapDown(1) \
+        & (c.o() < c.o(1)) & (c.o() > c.c(1)) & (c.c() > c.c(2)) & (c.c() < c.o(2))
+    return _signal(bull, bear)
+
+
+@_pattern("CdlGapSideSideWhite")
+def _gapSideSideWhite(c: Candle, _):
+    condition = c.white(1) & c.white() & (np.abs(c.body() - c.body(1)) < c.near(1)) \
+        & (np.abs(c.o() - c.o(1)) < c.equal(1))
+    return _signal(condition & (c.bottom(1) > c.top(2)) & (c.bottom() > c.top(2)),
+                   condition & (c.top(1) < c.bottom(2)) & (c.top() < c.bottom(2)))
+
+
+@_pattern("Cdl3LineStrike")
+def _threeLineStrike(c: Candle, _):
+    rising = c.white(3) & c.white(2) & c.white(1) & (c.c(2) > c.c(3)) & (c.c(1) > c.c(2))
+    falling = c.black(3) & c.black(2) & c.black(1) & (c.c(2) < c.c(3)) & (c.c(1) < c.c(2))
+    bull = rising & c.black() & (c.o() > c.c(1)) & (c.c() < c.o(3))
+    bear = falling & c.white() & (c.o() < c.c(1)) & (c.c() > c.o(3))
+    return _signal(bull, bear)
+
+
+def scan(panel: Panel, patterns=None, inputs: dict = None) -> pd.DataFrame:
+    """
+    一次性识别面板中所有股票的K线形态，返回稀疏命中表
+    :param panel    : Panel面板数据，需包含open、high、low、close字段
+    :param patterns : 形态名称列表，例如["CdlDoji", "CdlEngulfing"]，为空时识别全部已支持的形态
+    :param inputs   : 形态的input参数（穿透率），例如{"CdlMorningStar": 0.3}，为空时使用默认值
+    :return: pandas.DataFrame，字段包括code、tdate、pattern、signal
+    """
+    candle = Candle(panel)
+    inputs = inputs or {}
+    frames = []
+    for name in patterns or PATTERNS:
+        if name.startswith("getIndicatorTa"):
+            name = name[len("getIndicatorTa"):]
+        if name not in PATTERNS:
+            raise ValueError("形态%s暂不支持本地识别" % name)
+        func, default = PATTERNS[name]
+        signal = func(candle, float(inputs.get(name, default or 0)))
+        rows, cols = np.nonzero(signal)
+        if len(rows):
+            frames.append(pd.DataFrame({"code": panel.codes[rows], "tdate": panel.tdate[rows, cols],
+                                        "pattern": name, "signal": signal[rows, cols]}))
+    if not frames:
+        return pd.DataFrame({"code": [], "tdate": [], "pattern": [], "signal": []})
+    return pd.concat(frames, ignore_index=True).sort_values(["code", "tdate", "pattern"], ignore_index=True)
+
+
+def _endpoint(name, func, default):
+    if default is None:
+        def endpoint(panel: Panel):
+            return func(Candle(panel), 0.0)
+    else:
+        def endpoint(panel: Panel, input=default):
+            return func(Candle(panel), float(input))
+    endpoint.__name__ = endpoint.__qualname__ = "getIndicatorTa" + name
+    endpoint.__doc__ = """
+    形态识别-%s，返回 (股票数量 × K线数量) 的信号数组，100|看涨；-100|看跌；0|未出现%s
+    """ % (name, "" if default is None else "\n    :param input : 穿透率，默认%s" % default)
+    return endpoint
+
+
+for _name, (_func, _default) in PATTERNS.items():
+    globals()["getIndicatorTa" + _name] = _endpoint(_name, _func, _default)
+
+del _name, _func, _default
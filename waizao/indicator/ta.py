@@ -0,0 +1,986 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，本地技术指标。函数名及input1~inputN参数含义与stock_api.py中的getIndicatorTa*接口保持一致，
+      第一个参数为Panel面板数据，对所有股票的K线一次性向量化计算，返回 (股票数量 × K线数量) 的二维数组，
+      多个输出的指标返回 {指标字段: 二维数组}。可通过Panel.toDataFrame转换为长表DataFrame。
+      希尔伯特变换（getIndicatorTaHt*）、MAMA、SAR等迭代型指标暂未提供本地实现，请继续使用接口获取。
+http://www.waizaowang.com/
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from waizao.indicator.panel import Panel
+
+# 移动平均线类型，取值范围：1|SMA；2|EMA；3|WMA；4|DEMA；5|TEMA；6|TRIMA；7|KAMA；8|MAMA；9|T3
+MA_TYPES = {1: "SMA", 2: "EMA", 3: "WMA", 4: "DEMA", 5: "TEMA", 6: "TRIMA", 7: "KAMA", 8: "MAMA", 9: "T3"}
+
+
+def _empty(x: np.ndarray) -> np.ndarray:
+    return np.full(x.shape, np.nan)
+
+
+def _shift(x: np.ndarray, n: int) -> np.ndarray:
+    # 向右平移n根K线，即每个位置取n根K线之前的值
+    out = _empty(x)
+    if n < x.shape[1]:
+        out[:, n:] = x[:, :x.shape[1] - n]
+    return out
+
+
+def _rollingSum(x: np.ndarray, n: int) -> np.ndarray:
+    # 基于累加和的滑动求和，窗口内包含NaN时结果为NaN
+    out = _empty(x)
+    if n > x.shape[1]:
+        return out
+    valid = np.isfinite(x)
+    total = np.pad(np.cumsum(np.where(valid, x, 0.0), axis=1), ((0, 0), (1, 0)))
+    count = np.pad(np.cumsum(valid, axis=1), ((0, 0), (1, 0)))
+    window = total[:, n:] - total[:, :-n]
+    out[:, n - 1:] = np.where(count[:, n:] - count[:, :-n] == n, window, np.nan)
+    return out
+
+
+def _rolling(x: np.ndarray, n: int, reducer) -> np.ndarray:
+    # 基于滑动窗口视图的通用滑动计算，用于最大值、最小值等无法用累加和计算的场景
+    out = _empty(x)
+    if n <= x.shape[1]:
+        out[:, n - 1:] = reducer(sliding_window_view(x, n, axis=1), axis=-1)
+    return out
+
+
+def _recursive(x: np.ndarray, n: int, alpha: float) -> np.ndarray:
+    # 指数平滑，以前n个值的简单平均作为初始值，之后 s = alpha * x + (1 - alpha) * s，在股票维度上向量化
+    seed = _rollingSum(x, n) / n
+    out = _empty(x)
+    state = np.full(x.shape[0], np.nan)
+    for t in range(x.shape[1]):
+        state = np.where(np.isfinite(state), alpha * x[:, t] + (1 - alpha) * state, seed[:, t])
+        out[:, t] = state
+    return out
+
+
+def _sma(x, n):
+    return _rollingSum(x, n) / n
+
+
+def _ema(x, n):
+    return _recursive(x, n, 2.0 / (n + 1))
+
+
+def _wilder(x, n):
+    return _recursive(x, n, 1.0 / n)
+
+
+def _wma(x, n):
+    out = _empty(x)
+    if n <= x.shape[1]:
+        weights = np.arange(1, n + 1, dtype="float64")
+        out[:, n - 1:] = sliding_window_view(x, n, axis=1) @ weights / weights.sum()
+    return out
+
+
+def _dema(x, n):
+    e1 = _ema(x, n)
+    return 2 * e1 - _ema(e1, n)
+
+
+def _tema(x, n):
+    e1 = _ema(x, n)
+    e2 = _ema(e1, n)
+    return 3 * e1 - 3 * e2 + _ema(e2, n)
+
+
+def _trima(x, n):
+    first = (n + 1) // 2 if n % 2 else n // 2 + 1
+    second = (n + 1) // 2 if n % 2 else n // 2
+    return _sma(_sma(x, first), second)
+
+
+def _kama(x, n):
+    fast, slow = 2.0 / 3, 2.0 / 31
+    change = np.abs(x - _shift(x, n))
+    volatility = _rollingSum(np.abs(x - _shift(x, 1)), n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        er = np.where(volatility > 0, change / volatility, 0.0)
+    sc = (er * (fast - slow) + slow) ** 2
+    sc[~np.isfinite(change) | ~np.isfinite(volatility)] = np.nan
+    previous = _shift(x, 1)
+    out = _empty(x)
+    state = np.full(x.shape[0], np.nan)
+    for t in range(x.shape[1]):
+        base = np.where(np.isfinite(state), state, previous[:, t])
+        state = base + sc[:, t] * (x[:, t] - base)
+        out[:, t] = state
+    return out
+
+
+def _t3(x, n, v):
+    e1 = _ema(x, n)
+    e2 = _ema(e1, n)
+    e3 = _ema(e2, n)
+    e4 = _ema(e3, n)
+    e5 = _ema(e4, n)
+    e6 = _ema(e5, n)
+    c1 = -v ** 3
+    c2 = 3 * v ** 2 + 3 * v ** 3
+    c3 = -6 * v ** 2 - 3 * v - 3 * v ** 3
+    c4 = 1 + 3 * v + v ** 3 + 3 * v ** 2
+    return c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+
+
+def _ma(x, n, matype):
+    matype = int(matype)
+    if matype == 1:
+        return _sma(x, n)
+    if matype == 2:
+        return _ema(x, n)
+    if matype == 3:
+        return _wma(x, n)
+    if matype == 4:
+        return _dema(x, n)
+    if matype == 5:
+        return _tema(x, n)
+    if matype == 6:
+        return _trima(x, n)
+    if matype == 7:
+        return _kama(x, n)
+    if matype == 9:
+        return _t3(x, n, 0.7)
+    raise ValueError("移动平均线类型%s暂不支持本地计算，取值范围：%s" % (matype, MA_TYPES))
+
+
+def _variance(x, n):
+    mean = _sma(x, n)
+    return np.maximum(_sma(x * x, n) - mean * mean, 0.0)
+
+
+def _trueRange(panel: Panel):
+    high, low = panel.field("high"), panel.field("low")
+    close = _shift(panel.field("close"), 1)
+    return np.fmax(high - low, np.fmax(np.abs(high - close), np.abs(low - close))) + 0 * close
+
+
+def _directional(panel: Panel):
+    high, low = panel.field("high"), panel.field("low")
+    up = high - _shift(high, 1)
+    down = _shift(low, 1) - low
+    plus = np.where((up > down) & (up > 0), up, 0.0)
+    minus = np.where((down > up) & (down > 0), down, 0.0)
+    plus[~np.isfinite(up)] = np.nan
+    minus[~np.isfinite(down)] = np.nan
+    return plus, minus
+
+
+def _directionalIndex(panel: Panel, n: int):
+    plus, minus = _directional(panel)
+    tr = _wilder(_trueRange(panel), n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = 100 * _wilder(plus, n) / tr
+        minus_di = 100 * _wilder(minus, n) / tr
+        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+    return plus_di, minus_di, dx
+
+
+def _linearRegression(x, n):
+    # 窗口内以0..n-1为横坐标做最小二乘回归，返回斜率和截距
+    index = np.arange(n, dtype="float64")
+    sum_x = index.sum()
+    sum_xx = (index * index).sum()
+    sum_y = _rollingSum(x, n)
+    sum_xy = _empty(x)
+    if n <= x.shape[1]:
+        sum_xy[:, n - 1:] = sliding_window_view(x, n, axis=1) @ index
+    slope = (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x * sum_x)
+    intercept = (sum_y - slope * sum_x) / n
+    return slope, intercept
+
+
+def _rsi(x, n):
+    change = x - _shift(x, 1)
+    gain = _wilder(np.where(change > 0, change, 0.0) + 0 * change, n)
+    loss = _wilder(np.where(change < 0, -change, 0.0) + 0 * change, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(gain + loss > 0, 100 * gain / (gain + loss), 0.0) + 0 * gain
+
+
+def _stochastic(close, high, low, n):
+    highest = _rolling(high, n, np.max)
+    lowest = _rolling(low, n, np.min)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(highest > lowest, 100 * (close - lowest) / (highest - lowest), 0.0) + 0 * highest
+
+
+# ---------------------------------------------------------------- 重叠研究
+
+def getIndicatorTaSma(panel: Panel, input1, input2):
+    """
+    SMA简单移动平均线
+    :param input1 : 数据标签，取值范围：1|open-开盘价；2|close-收盘价；3|high-最高价；4|low-最低价；5|cjl-成交量；6|cje-成交额
+    :param input2 : 移动平均线周期
+    """
+    return _sma(panel.field(input1), int(input2))
+
+
+def getIndicatorTaEma(panel: Panel, input1, input2):
+    """
+    EMA指数移动平均线
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _ema(panel.field(input1), int(input2))
+
+
+def getIndicatorTaWma(panel: Panel, input1, input2):
+    """
+    WMA加权移动平均线
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _wma(panel.field(input1), int(input2))
+
+
+def getIndicatorTaDema(panel: Panel, input1, input2):
+    """
+    DEMA双指数移动平均线
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _dema(panel.field(input1), int(input2))
+
+
+def getIndicatorTaTema(panel: Panel, input1, input2):
+    """
+    TEMA三重指数移动平均线
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _tema(panel.field(input1), int(input2))
+
+
+def getIndicatorTaTrima(panel: Panel, input1, input2):
+    """
+    TRIMA三角移动平均线
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _trima(panel.field(input1), int(input2))
+
+
+def getIndicatorTaKama(panel: Panel, input1, input2):
+    """
+    KAMA考夫曼自适应移动平均线
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _kama(panel.field(input1), int(input2))
+
+
+def getIndicatorTaT3(panel: Panel, input1, input2, input3):
+    """
+    T3三重移动平均线
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    :param input3 : va系数
+    """
+    return _t3(panel.field(input1), int(input2), float(input3))
+
+
+def getIndicatorTaMovingAverage(panel: Panel, input1, input2, input3):
+    """
+    MOVINGAVERAGE移动平均线
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    :param input3 : 移动平均线类型，取值范围：1|SMA；2|EMA；3|WMA；4|DEMA；5|TEMA；6|TRIMA；7|KAMA；9|T3
+    """
+    return _ma(panel.field(input1), int(input2), input3)
+
+
+def getIndicatorTaBbands(panel: Panel, input1, input2, input3, input4, input5):
+    """
+    BBANDS布林带，返回 {upperband, middleband, lowerband}
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    :param input3 : 上轨道线的标准偏差倍数
+    :param input4 : 下轨道线的标准偏差倍数
+    :param input5 : 移动平均线类型
+    """
+    x = panel.field(input1)
+    n = int(input2)
+    middle = _ma(x, n, input5)
+    std = np.sqrt(_variance(x, n))
+    return {"upperband": middle + float(input3) * std, "middleband": middle,
+            "lowerband": middle - float(input4) * std}
+
+
+def getIndicatorTaMidPoint(panel: Panel, input1, input2):
+    """
+    MIDPOINT周期内最大值和最小值的中点
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    x = panel.field(input1)
+    n = int(input2)
+    return (_rolling(x, n, np.max) + _rolling(x, n, np.min)) / 2
+
+
+def getIndicatorTaMidPrice(panel: Panel, input):
+    """
+    MIDPRICE周期内最高价和最低价的中点
+    :param input : 移动平均线周期
+    """
+    n = int(input)
+    return (_rolling(panel.field("high"), n, np.max) + _rolling(panel.field("low"), n, np.min)) / 2
+
+
+# ---------------------------------------------------------------- 动量指标
+
+def getIndicatorTaMacd(panel: Panel, input1, input2, input3, input4):
+    """
+    MACD指标，返回 {macd, macdsignal, macdhist}
+    :param input1 : 数据标签
+    :param input2 : 快速移动平均线周期
+    :param input3 : 慢速移动平均线周期
+    :param input4 : 信号移动平均线周期
+    """
+    x = panel.field(input1)
+    macd = _ema(x, int(input2)) - _ema(x, int(input3))
+    signal = _ema(macd, int(input4))
+    return {"macd": macd, "macdsignal": signal, "macdhist": macd - signal}
+
+
+def getIndicatorTaMacdExt(panel: Panel, input1, input2, input3, input4, input5, input6, input7):
+    """
+    MACDEXT可指定移动平均线类型的MACD指标，返回 {macd, macdsignal, macdhist}
+    :param input1 : 数据标签
+    :param input2 : 快速移动平均线周期
+    :param input3 : 快速移动平均线类型
+    :param input4 : 慢速移动平均线周期
+    :param input5 : 慢速移动平均线类型
+    :param input6 : 信号移动平均线周期
+    :param input7 : 信号移动平均线类型
+    """
+    x = panel.field(input1)
+    macd = _ma(x, int(input2), input3) - _ma(x, int(input4), input5)
+    signal = _ma(macd, int(input6), input7)
+    return {"macd": macd, "macdsignal": signal, "macdhist": macd - signal}
+
+
+def getIndicatorTaMacdFix(panel: Panel, input1, input2):
+    """
+    MACDFIX固定12/26周期的MACD指标，返回 {macd, macdsignal, macdhist}
+    :param input1 : 数据标签
+    :param input2 : 信号移动平均线周期
+    """
+    return getIndicatorTaMacd(panel, input1, 12, 26, input2)
+
+
+def getIndicatorTaRsi(panel: Panel, input1, input2):
+    """
+    RSI相对强弱指标
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _rsi(panel.field(input1), int(input2))
+
+
+def getIndicatorTaCmo(panel: Panel, input1, input2):
+    """
+    CMO钱德动量摆动指标
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    x = panel.field(input1)
+    n = int(input2)
+    change = x - _shift(x, 1)
+    gain = _wilder(np.where(change > 0, change, 0.0) + 0 * change, n)
+    loss = _wilder(np.where(change < 0, -change, 0.0) + 0 * change, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(gain + loss > 0, 100 * (gain - loss) / (gain + loss), 0.0) + 0 * gain
+
+
+def getIndicatorTaMom(panel: Panel, input1, input2):
+    """
+    MOM动量指标
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    x = panel.field(input1)
+    return x - _shift(x, int(input2))
+
+
+def getIndicatorTaRoc(panel: Panel, input1, input2):
+    """
+    ROC变动率，((price / prevPrice) - 1) * 100
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return (getIndicatorTaRocR(panel, input1, input2) - 1) * 100
+
+
+def getIndicatorTaRocP(panel: Panel, input1, input2):
+    """
+    ROCP变动百分比，(price - prevPrice) / prevPrice
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return getIndicatorTaRocR(panel, input1, input2) - 1
+
+
+def getIndicatorTaRocR(panel: Panel, input1, input2):
+    """
+    ROCR变动比率，price / prevPrice
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    x = panel.field(input1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return x / _shift(x, int(input2))
+
+
+def getIndicatorTaRocR100(panel: Panel, input1, input2):
+    """
+    ROCR100变动比率，(price / prevPrice) * 100
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return getIndicatorTaRocR(panel, input1, input2) * 100
+
+
+def getIndicatorTaApo(panel: Panel, input1, input2, input3, input4):
+    """
+    APO绝对价格振荡指标
+    :param input1 : 数据标签
+    :param input2 : 快速移动平均线周期
+    :param input3 : 慢速移动平均线周期
+    :param input4 : 移动平均线类型
+    """
+    x = panel.field(input1)
+    return _ma(x, int(input2), input4) - _ma(x, int(input3), input4)
+
+
+def getIndicatorTaPpo(panel: Panel, input1, input2, input3, input4):
+    """
+    PPO价格振荡百分比指标
+    :param input1 : 数据标签
+    :param input2 : 快速移动平均线周期
+    :param input3 : 慢速移动平均线周期
+    :param input4 : 移动平均线类型
+    """
+    x = panel.field(input1)
+    slow = _ma(x, int(input3), input4)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 * (_ma(x, int(input2), input4) - slow) / slow
+
+
+def getIndicatorTaTrix(panel: Panel, input1, input2):
+    """
+    TRIX三重指数平滑平均线的1日变动率
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    n = int(input2)
+    triple = _ema(_ema(_ema(panel.field(input1), n), n), n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 * (triple / _shift(triple, 1) - 1)
+
+
+def getIndicatorTaCci(panel: Panel, input):
+    """
+    CCI商品通道指数
+    :param input : 移动平均线周期
+    """
+    n = int(input)
+    tp = (panel.field("high") + panel.field("low") + panel.field("close")) / 3
+    mean = _sma(tp, n)
+    deviation = _empty(tp)
+    if n <= tp.shape[1]:
+        window = sliding_window_view(tp, n, axis=1)
+        deviation[:, n - 1:] = np.abs(window - mean[:, n - 1:, None]).mean(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(deviation > 0, (tp - mean) / (0.015 * deviation), 0.0) + 0 * deviation
+
+
+def getIndicatorTaWillR(panel: Panel, input):
+    """
+    WILLR威廉指标
+    :param input : 移动平均线周期
+    """
+    n = int(input)
+    highest = _rolling(panel.field("high"), n, np.max)
+    lowest = _rolling(panel.field("low"), n, np.min)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(highest > lowest, -100 * (highest - panel.field("close")) / (highest - lowest), 0.0) \
+            + 0 * highest
+
+
+def getIndicatorTaStoch(panel: Panel, input1, input2, input3, input4, input5):
+    """
+    STOCH随机指标（KDJ），返回 {slowk, slowd}
+    :param input1 : 快速移动平均线K周期
+    :param input2 : 慢速移动平均线K周期
+    :param input3 : 慢速移动平均线K类型
+    :param input4 : 慢速移动平均线D周期
+    :param input5 : 慢速移动平均线D类型
+    """
+    fastk = _stochastic(panel.field("close"), panel.field("high"), panel.field("low"), int(input1))
+    slowk = _ma(fastk, int(input2), input3)
+    return {"slowk": slowk, "slowd": _ma(slowk, int(input4), input5)}
+
+
+def getIndicatorTaStochF(panel: Panel, input1, input2, input3):
+    """
+    STOCHF快速随机指标，返回 {fastk, fastd}
+    :param input1 : 快速移动平均线K周期
+    :param input2 : 慢速移动平均线D周期
+    :param input3 : 慢速移动平均线D类型
+    """
+    fastk = _stochastic(panel.field("close"), panel.field("high"), panel.field("low"), int(input1))
+    return {"fastk": fastk, "fastd": _ma(fastk, int(input2), input3)}
+
+
+def getIndicatorTaStochRsi(panel: Panel, input1, input2, input3, input4, input5):
+    """
+    STOCHRSI随机相对强弱指标，返回 {fastk, fastd}
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    :param input3 : 快速移动平均线K周期
+    :param input4 : 慢速移动平均线D周期
+    :param input5 : 慢速移动平均线D类型
+    """
+    rsi = _rsi(panel.field(input1), int(input2))
+    fastk = _stochastic(rsi, rsi, rsi, int(input3))
+    return {"fastk": fastk, "fastd": _ma(fastk, int(input4), input5)}
+
+
+def getIndicatorTaMfi(panel: Panel, input):
+    """
+    MFI资金流量指标
+    :param input : 移动平均线周期
+    """
+    n = int(input)
+    tp = (panel.field("high") + panel.field("low") + panel.field("close")) / 3
+    flow = tp * panel.field("cjl")
+    change = tp - _shift(tp, 1)
+    positive = _rollingSum(np.where(change > 0, flow, 0.0) + 0 * change, n)
+    negative = _rollingSum(np.where(change < 0, flow, 0.0) + 0 * change, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(positive + negative > 0, 100 * positive / (positive + negative), 0.0) + 0 * positive
+
+
+def getIndicatorTaBop(panel: Panel):
+    """
+    BOP均势指标
+    """
+    high, low = panel.field("high"), panel.field("low")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(high > low, (panel.field("close") - panel.field("open")) / (high - low), 0.0) \
+            + 0 * high
+
+
+def getIndicatorTaAroon(panel: Panel, input):
+    """
+    AROON阿隆指标，返回 {aroondown, aroonup}
+    :param input : 移动平均线周期
+    """
+    n = int(input)
+    high, low = panel.field("high"), panel.field("low")
+    up, down = _empty(high), _empty(low)
+    if n < high.shape[1]:
+        # 窗口包含n+1根K线，逆序后argmax即为距离最近一次最高（低）价的K线数量
+        since_high = np.argmax(sliding_window_view(high, n + 1, axis=1)[..., ::-1], axis=-1)
+        since_low = np.argmin(sliding_window_view(low, n + 1, axis=1)[..., ::-1], axis=-1)
+        up[:, n:] = 100.0 * (n - since_high) / n
+        down[:, n:] = 100.0 * (n - since_low) / n
+        up += 0 * _shift(high, n)
+        down += 0 * _shift(low, n)
+    return {"aroondown": down, "aroonup": up}
+
+
+def getIndicatorTaAroonOsc(panel: Panel, input):
+    """
+    AROONOSC阿隆振荡器
+    :param input : 移动平均线周期
+    """
+    aroon = getIndicatorTaAroon(panel, input)
+    return aroon["aroonup"] - aroon["aroondown"]
+
+
+def getIndicatorTaUltOsc(panel: Panel, input1, input2, input3):
+    """
+    ULTOSC综合摆动指标
+    :param input1 : 移动平均线周期1
+    :param input2 : 移动平均线周期2
+    :param input3 : 移动平均线周期3
+    """
+    close = panel.field("close")
+    previous = _shift(close, 1)
+    low = np.fmin(panel.field("low"), previous) + 0 * previous
+    buying = close - low
+    tr = _trueRange(panel)
+    averages = []
+    for n in (int(input1), int(input2), int(input3)):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            averages.append(_rollingSum(buying, n) / _rollingSum(tr, n))
+    return 100 * (4 * averages[0] + 2 * averages[1] + averages[2]) / 7
+
+
+def getIndicatorTaPlusDM(panel: Panel, input):
+    """
+    PLUSDM正向动向变动指标
+    :param input : 移动平均线周期
+    """
+    n = int(input)
+    return _wilder(_directional(panel)[0], n) * n
+
+
+def getIndicatorTaMinusDM(panel: Panel, input):
+    """
+    MINUSDM负向动向变动指标
+    :param input : 移动平均线周期
+    """
+    n = int(input)
+    return _wilder(_directional(panel)[1], n) * n
+
+
+def getIndicatorTaPlusDI(panel: Panel, input):
+    """
+    PLUSDI正向指标
+    :param input : 移动平均线周期
+    """
+    return _directionalIndex(panel, int(input))[0]
+
+
+def getIndicatorTaMinusDI(panel: Panel, input):
+    """
+    MINUSDI负向指标
+    :param input : 移动平均线周期
+    """
+    return _directionalIndex(panel, int(input))[1]
+
+
+def getIndicatorTaDx(panel: Panel, input):
+    """
+    DX动向指标
+    :param input : 移动平均线周期
+    """
+    return _directionalIndex(panel, int(input))[2]
+
+
+def getIndicatorTaAdx(panel: Panel, input):
+    """
+    ADX平均趋向指标
+    :param input : 移动平均线周期
+    """
+    n = int(input)
+    return _wilder(_directionalIndex(panel, n)[2], n)
+
+
+def getIndicatorTaAdxr(panel: Panel, input):
+    """
+    ADXR平均趋向指标评估
+    :param input : 移动平均线周期
+    """
+    n = int(input)
+    adx = getIndicatorTaAdx(panel, n)
+    return (adx + _shift(adx, n - 1)) / 2
+
+
+# ---------------------------------------------------------------- 波动率与成交量
+
+def getIndicatorTaTrueRange(panel: Panel):
+    """
+    TRANGE真实波幅
+    """
+    return _trueRange(panel)
+
+
+def getIndicatorTaAtr(panel: Panel, input):
+    """
+    ATR真实波动幅度均值
+    :param input : 移动平均线周期
+    """
+    return _wilder(_trueRange(panel), int(input))
+
+
+def getIndicatorTaNatr(panel: Panel, input):
+    """
+    NATR归一化真实波动幅度均值
+    :param input : 移动平均线周期
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 * getIndicatorTaAtr(panel, input) / panel.field("close")
+
+
+def getIndicatorTaObv(panel: Panel, input):
+    """
+    OBV能量潮
+    :param input : 数据标签
+    """
+    x = panel.field(input)
+    volume = panel.field("cjl")
+    change = np.sign(x - _shift(x, 1))
+    signed = np.where(np.isfinite(change), change * volume, volume)
+    obv = np.cumsum(np.nan_to_num(signed), axis=1)
+    obv[~np.isfinite(x)] = np.nan
+    return obv
+
+
+def _ad(panel: Panel):
+    high, low, close = panel.field("high"), panel.field("low"), panel.field("close")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        clv = np.where(high > low, ((close - low) - (high - close)) / (high - low), 0.0)
+    ad = np.cumsum(np.nan_to_num(clv * panel.field("cjl")), axis=1)
+    ad[~np.isfinite(close)] = np.nan
+    return ad
+
+
+def getIndicatorTaAd(panel: Panel):
+    """
+    AD累积/派发线
+    """
+    return _ad(panel)
+
+
+def getIndicatorTaAdOsc(panel: Panel, input1, input2):
+    """
+    ADOSC累积/派发振荡指标
+    :param input1 : 快速移动平均线周期
+    :param input2 : 慢速移动平均线周期
+    """
+    ad = _ad(panel)
+    return _ema(ad, int(input1)) - _ema(ad, int(input2))
+
+
+# ---------------------------------------------------------------- 价格变换
+
+def getIndicatorTaAvgPrice(panel: Panel):
+    """
+    AVGPRICE平均价格，(open + high + low + close) / 4
+    """
+    return (panel.field("open") + panel.field("high") + panel.field("low") + panel.field("close")) / 4
+
+
+def getIndicatorTaMedPrice(panel: Panel):
+    """
+    MEDPRICE中位数价格，(high + low) / 2
+    """
+    return (panel.field("high") + panel.field("low")) / 2
+
+
+def getIndicatorTaTypPrice(panel: Panel):
+    """
+    TYPPRICE典型价格，(high + low + close) / 3
+    """
+    return (panel.field("high") + panel.field("low") + panel.field("close")) / 3
+
+
+def getIndicatorTaWclPrice(panel: Panel):
+    """
+    WCLPRICE加权收盘价，(high + low + close * 2) / 4
+    """
+    return (panel.field("high") + panel.field("low") + 2 * panel.field("close")) / 4
+
+
+# ---------------------------------------------------------------- 统计函数
+
+def getIndicatorTaMax(panel: Panel, input1, input2):
+    """
+    周期内最大值
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _rolling(panel.field(input1), int(input2), np.max)
+
+
+def getIndicatorTaMin(panel: Panel, input1, input2):
+    """
+    周期内最小值
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _rolling(panel.field(input1), int(input2), np.min)
+
+
+def getIndicatorTaMinMax(panel: Panel, input1, input2):
+    """
+    周期内最小值和最大值，返回 {min, max}
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return {"min": getIndicatorTaMin(panel, input1, input2), "max": getIndicatorTaMax(panel, input1, input2)}
+
+
+def getIndicatorTaSum(panel: Panel, input1, input2):
+    """
+    周期内求和
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _rollingSum(panel.field(input1), int(input2))
+
+
+def getIndicatorTaVariance(panel: Panel, input1, input2, input3):
+    """
+    方差
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    :param input3 : 标准差倍数，与接口保持一致，不参与方差计算
+    """
+    return _variance(panel.field(input1), int(input2))
+
+
+def getIndicatorTaStdDev(panel: Panel, input1, input2, input3):
+    """
+    标准差
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    :param input3 : 标准差倍数
+    """
+    return np.sqrt(_variance(panel.field(input1), int(input2))) * float(input3)
+
+
+def getIndicatorTaLinearReg(panel: Panel, input1, input2):
+    """
+    线性回归在窗口最后一根K线上的值
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    n = int(input2)
+    slope, intercept = _linearRegression(panel.field(input1), n)
+    return intercept + slope * (n - 1)
+
+
+def getIndicatorTaLinearRegSlope(panel: Panel, input1, input2):
+    """
+    线性回归斜率
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _linearRegression(panel.field(input1), int(input2))[0]
+
+
+def getIndicatorTaLinearRegIntercept(panel: Panel, input1, input2):
+    """
+    线性回归截距
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return _linearRegression(panel.field(input1), int(input2))[1]
+
+
+def getIndicatorTaLinearRegAngle(panel: Panel, input1, input2):
+    """
+    线性回归角度，单位为度
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    return np.degrees(np.arctan(getIndicatorTaLinearRegSlope(panel, input1, input2)))
+
+
+def getIndicatorTaTsf(panel: Panel, input1, input2):
+    """
+    时间序列预测，线性回归在下一根K线上的值
+    :param input1 : 数据标签
+    :param input2 : 移动平均线周期
+    """
+    n = int(input2)
+    slope, intercept = _linearRegression(panel.field(input1), n)
+    return intercept + slope * n
+
+
+def getIndicatorTaCorrel(panel: Panel, input1, input2, input3):
+    """
+    皮尔逊相关系数
+    :param input1 : 数据标签
+    :param input2 : 数据标签
+    :param input3 : 移动平均线周期
+    """
+    x, y = panel.field(input1), panel.field(input2)
+    n = int(input3)
+    cov = _sma(x * y, n) - _sma(x, n) * _sma(y, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return cov / np.sqrt(_variance(x, n) * _variance(y, n))
+
+
+def getIndicatorTaBeta(panel: Panel, input1, input2, input3):
+    """
+    Beta系数，以input1的收益率为自变量、input2的收益率为因变量
+    :param input1 : 数据标签
+    :param input2 : 数据标签
+    :param input3 : 移动平均线周期
+    """
+    x, y = panel.field(input1), panel.field(input2)
+    n = int(input3)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rx = x / _shift(x, 1) - 1
+        ry = y / _shift(y, 1) - 1
+        return (_sma(rx * ry, n) - _sma(rx, n) * _sma(ry, n)) / _variance(rx, n)
+
+
+# ---------------------------------------------------------------- 数学运算
+
+def getIndicatorTaAdd(panel: Panel, input1, input2):
+    """
+    向量加法运算
+    :param input1 : 数据标签
+    :param input2 : 数据标签
+    """
+    return panel.field(input1) + panel.field(input2)
+
+
+def getIndicatorTaSub(panel: Panel, input1, input2):
+    """
+    向量减法运算
+    :param input1 : 数据标签
+    :param input2 : 数据标签
+    """
+    return panel.field(input1) - panel.field(input2)
+
+
+def getIndicatorTaMult(panel: Panel, input1, input2):
+    """
+    向量乘法运算
+    :param input1 : 数据标签
+    :param input2 : 数据标签
+    """
+    return panel.field(input1) * panel.field(input2)
+
+
+def getIndicatorTaDiv(panel: Panel, input1, input2):
+    """
+    向量除法运算
+    :param input1 : 数据标签
+    :param input2 : 数据标签
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return panel.field(input1) / panel.field(input2)
+
+
+# 单个数据标签的数学变换，函数名与接口一致，例如getIndicatorTaSqrt(panel, input)
+_TRANSFORMS = {
+    "Acos": np.arccos, "Asin": np.arcsin, "Atan": np.arctan, "Ceil": np.ceil, "Cos": np.cos,
+    "Cosh": np.cosh, "Exp": np.exp, "Floor": np.floor, "Ln": np.log, "Log10": np.log10,
+    "Sin": np.sin, "Sinh": np.sinh, "Sqrt": np.sqrt, "Tan": np.tan, "Tanh": np.tanh,
+}
+
+
+def _transform(name, func):
+    def transform(panel: Panel, input):
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            return func(panel.field(input))
+
+    transform.__name__ = transform.__qualname__ = "getIndicatorTa" + name
+    transform.__doc__ = """
+    %s数学变换
+    :param input : 数据标签
+    """ % name.upper()
+    return transform
+
+
+for _name, _func in _TRANSFORMS.items():
+    globals()["getIndicatorTa" + _name] = _transform(_name, _func)
+
+del _name, _func
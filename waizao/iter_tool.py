@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，分块迭代工具。按 (股票代码分组, 交易日窗口) 逐块请求getDayKLine、getMinuteKLine、getLevel2TimeDeal等接口，
+      每块解析为一个DataFrame（或Arrow RecordBatch）后立即返回，内存中只保留少量预取的数据块，
+      适合全市场、多年份数据的流式处理，避免一次性物化完整的响应
+http://www.waizaowang.com/
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from waizao import batch_tool
+from waizao import export_tool
+from waizao import range_tool
+from waizao import schema_tool
+from waizao.api import stock_api
+
+# 每批返回的最大数据行数，超出时拆分为多批
+BATCH_ROWS = 250000
+
+
+def _toArrow(df):
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("返回Arrow数据需要安装pyarrow：pip install pyarrow") from e
+    return pyarrow.RecordBatch.from_pandas(df, preserve_index=False)
+
+
+# 任务拆分与range_tool共用，保留原有的函数名
+planTasks = range_tool.planTasks
+
+
+def iterRequest(func, codes, startDate: str, endDate: str, token: str, dates: list = None, days: int = None,
+                chunk_size: int = batch_tool.MAX_CODES, batch_rows: int = BATCH_ROWS, schema=True,
+                arrow: bool = False, prefetch: int = 2, **kwargs):
+    """
+    按 (股票代码分组, 交易日窗口) 逐块请求并返回数据，最多同时预取prefetch个数据块
+    例如：for df in iterRequest(stock_api.getDayKLine, codes, "2010-01-01", "2024-12-31", token, type=1,
+                               ktype=101, fq=1): ...
+    :param func       : stock_api中带code、startDate、endDate参数的接口函数
+    :param codes      : 股票代码，列表或逗号分隔的字符串；若为all，则按单个交易日逐块请求（接口支持all时）
+    :param startDate  : 开始日期，yyyy-MM-dd格式
+    :param endDate    : 结束日期，yyyy-MM-dd格式
+    :param token      : 令牌，登录后可获取
+    :param dates      : 交易日列表，为空时按资产类型通过getTradeDate获取
+    :param days       : 每个窗口的交易日数量，为空时按range_tool.windowDays计算
+    :param chunk_size : 每组股票数量，默认50
+    :param batch_rows : 每批返回的最大数据行数
+    :param schema     : 字段类型，True|按schema_tool中注册的字段类型转换；False|按取值推断；也可以传入字段类型dict
+    :param arrow      : 是否返回pyarrow.RecordBatch（需要安装pyarrow），默认返回pandas.DataFrame
+    :param prefetch   : 预取的数据块数量，为0时逐块串行请求
+    :param kwargs     : 接口的其余参数，按参数名传入，export固定为1|Json字符串
+    :return: generator，每次返回一个pandas.DataFrame或pyarrow.RecordBatch
+    """
+    tasks = range_tool.planTasks(func, codes, startDate, endDate, token, dates, days, chunk_size, **kwargs)
+    if schema is True:
+        schema = schema_tool.getSchema(func.__name__)
+    elif not schema:
+        schema = None
+
+    def fetch(task):
+        return range_tool.fetchTask(func, task, token, **kwargs)
+
+    def frames():
+        if prefetch <= 0:
+            for task in tasks:
+                yield export_tool.toFrame(fetch(task), schema)
+            return
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending = deque()
+            for task in tasks:
+                pending.append(executor.submit(fetch, task))
+                if len(pending) > prefetch:
+                    yield export_tool.toFrame(pending.popleft().result(), schema)
+            while pending:
+                yield export_tool.toFrame(pending.popleft().result(), schema)
+
+    for df in frames():
+        for start in range(0, len(df), batch_rows):
+            part = df.iloc[start:start + batch_rows] if len(df) > batch_rows else df
+            yield _toArrow(part) if arrow else part
+
+
+def iterDayKLine(type: int, codes, ktype: int, fq: int, startDate: str, endDate: str, token: str,
+                 fields: str = "all", filter: str = "", **kwargs):
+    """
+    分块迭代日线、周线、月线数据，参数同stock_api.getDayKLine，其余参数同iterRequest
+    例如：for df in iterDayKLine(1, codes, 101, 1, "2010-01-01", "2024-12-31", token): ...
+    :return: generator
+    """
+    return iterRequest(stock_api.getDayKLine, codes, startDate, endDate, token, type=type, ktype=ktype, fq=fq,
+                       fields=fields, filter=filter, **kwargs)
+
+
+def iterMinuteKLine(type: int, codes, startDate: str, endDate: str, token: str, fields: str = "all",
+                    filter: str = "", **kwargs):
+    """
+    分块迭代分线数据，参数同stock_api.getMinuteKLine，其余参数同iterRequest
+    :return: generator
+    """
+    return iterRequest(stock_api.getMinuteKLine, codes, startDate, endDate, token, type=type, fields=fields,
+                       filter=filter, **kwargs)
+
+
+def iterLevel2(type: int, codes, startDate: str, endDate: str, token: str, fields: str = "all", filter: str = "",
+               **kwargs):
+    """
+    分块迭代分时成交数据，参数同stock_api.getLevel2TimeDeal，其余参数同iterRequest
+    :return: generator
+    """
+    return iterRequest(stock_api.getLevel2TimeDeal, codes, startDate, endDate, token, type=type, fields=fields,
+                       filter=filter, **kwargs)
@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，本地缓存代理服务。提供与api.waizaowang.com相同的/doc/<接口名称>地址，未命中时向上游请求并写入磁盘缓存，
+      多人同时发起的相同请求只向上游请求一次，每个客户端（按token，无token时按IP）单独限流，整个团队共享一份上游额度
+      命令行：waizao-proxy --token xxx --port 8787
+      客户端：http_client.setBaseUrl("http://127.0.0.1:8787/doc/")，或设置环境变量WAIZAO_BASE_URL
+http://www.waizaowang.com/
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qsl
+from urllib.parse import urlsplit
+
+import requests
+
+from waizao.api import disk_cache
+from waizao.api import errors
+from waizao.api import http_client
+from waizao.api import rate_limit
+from waizao.api.single_flight import SingleFlight
+from waizao.api.single_flight import flightKey
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+
+# 接口地址前缀，与api.waizaowang.com保持一致
+PATH_PREFIX = "/doc/"
+
+# 统计信息地址
+STATS_PATH = "/stats"
+
+# 响应超过该大小且客户端支持时使用gzip压缩，单位字节
+GZIP_MIN_SIZE = 1024
+
+
+class ClientLimiter:
+    """
+    按客户端限流，每个客户端一个令牌桶，最多记录max_clients个客户端，超出后淘汰最久未访问的客户端
+    """
+
+    def __init__(self, rate: float = 5, burst: int = 20, max_clients: int = 10000):
+        """
+        :param rate        : 每个客户端每秒请求数
+        :param burst       : 每个客户端突发请求数
+        :param max_clients : 记录的最大客户端数量
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, client: str) -> float:
+        """
+        获取一个令牌，不等待
+        :param client : 客户端标识
+        :return: float，获取成功返回0，否则返回建议等待的秒数
+        """
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                bucket = self._buckets[client] = rate_limit.TokenBucket(self.rate, self.burst)
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client)
+        return bucket.tryAcquire()
+
+
+class ProxyServer(ThreadingHTTPServer):
+    """
+    缓存代理服务，每个请求一个线程。上游请求通过client发送，client应启用缓存（例如DiskCache(endpoints=None)）
+    和上游限流；相同的请求（token也相同）在途时合并为一次上游请求。
+    注意：缓存键不含token，缓存的数据会提供给所有能访问本服务的客户端，默认只监听本机地址
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple, client, token: str = None, limiter: ClientLimiter = None,
+                 quiet: bool = False):
+        """
+        :param address : 监听地址，(主机, 端口)
+        :param client  : 上游客户端，http_client.HttpClient或兼容的客户端对象
+        :param token   : 上游请求使用的令牌，为空时使用客户端请求中的token
+        :param limiter : 客户端限流，为空时不限流
+        :param quiet   : 是否不输出访问日志
+        """
+        super().__init__(address, ProxyHandler)
+        self.client = client
+        self.token = token
+        self.limiter = limiter
+        self.quiet = quiet
+        self.single_flight = SingleFlight()
+        self.requests = 0
+        self.throttled = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, endpoint: str, params: dict, method: str = "post") -> str:
+        """
+        获取接口响应，优先读取缓存，相同的在途请求只向上游请求一次
+        :param endpoint : 接口名称
+        :param params   : 请求参数
+        :param method   : 上游请求方式，post或get
+        """
+        if self.token:
+            params = dict(params, token=self.token)
+        # 合并键包含token：未指定上游令牌时各客户端使用自己的令牌，令牌错误等异常不会共享给其他客户端；
+        # 磁盘缓存仍按不含token的缓存键共享
+        key = flightKey(endpoint, params, method)
+        return self.single_flight.call(key, lambda: self.client.request(endpoint, params, method))
+
+    def count(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def stats(self) -> dict:
+        """
+        统计信息，包括请求次数、被限流次数、失败次数、请求合并和缓存的统计信息
+        """
+        result = {"requests": self.requests, "throttled": self.throttled, "failures": self.failures,
+                  "single_flight": self.single_flight.stats()}
+        cache = getattr(self.client, "cache", None)
+        if cache is not None:
+            result["cache"] = cache.stats()
+        return result
+
+
+class ProxyHandler(BaseHTTPRequestHandler):
+    """
+    处理GET和POST请求：/doc/<接口名称>?参数，POST请求也可以将参数放在表单中；/stats返回统计信息
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._handle("get")
+
+    def do_POST(self):
+        self._handle("post")
+
+    def _params(self, query: str) -> dict:
+        params = dict(parse_qsl(query, keep_blank_values=True))
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            body = self.rfile.read(length)
+            if "application/x-www-form-urlencoded" in (self.headers.get("Content-Type") or ""):
+                params.update(parse_qsl(body.decode("utf-8"), keep_blank_values=True))
+        return params
+
+    def _handle(self, method: str):
+        url = urlsplit(self.path)
+        params = self._params(url.query)
+        if url.path == STATS_PATH:
+            self._send(200, json.dumps(self.server.stats(), ensure_ascii=False))
+            return
+        endpoint = url.path[len(PATH_PREFIX):] if url.path.startswith(PATH_PREFIX) else ""
+        if not endpoint or "/" in endpoint:
+            self._sendError(404, 404, "接口不存在：%s" % url.path)
+            return
+        self.server.count("requests")
+        if self.server.limiter is not None:
+            wait = self.server.limiter.acquire(params.get("token") or self.client_address[0])
+            if wait:
+                self.server.count("throttled")
+                self._sendError(429, 429, "请求过于频繁，请稍后再试", {"Retry-After": str(max(int(wait + 0.999), 1))})
+                return
+        try:
+            text = self.server.fetch(endpoint, params, method)
+        except errors.HttpError as e:
+            self.server.count("failures")
+            self._sendError(502, e.code, e.message)
+            return
+        except errors.ThrottleError as e:
+            self.server.count("failures")
+            self._sendError(429, e.code, e.message)
+            return
+        except errors.WaizaoError as e:
+            # 令牌和参数错误按上游的格式原样返回，客户端的errors.checkResponse会抛出相同类型的异常
+            self.server.count("failures")
+            self._sendError(200, e.code, e.message)
+            return
+        except requests.RequestException as e:
+            self.server.count("failures")
+            self._sendError(502, 502, "上游请求失败：%s" % e)
+            return
+        self._send(200, text)
+
+    def _sendError(self, status: int, code: int, message: str, headers: dict = None):
+        body = json.dumps({"code": code or status, "message": message, "data": []}, ensure_ascii=False)
+        self._send(status, body, headers)
+
+    def _send(self, status: int, text: str, headers: dict = None):
+        body = text.encode("utf-8")
+        is_json = text[:1] in ("{", "[")
+        self.send_response(status)
+        self.send_header("Content-Type", "%s; charset=utf-8" % ("application/json" if is_json else "text/plain"))
+        if len(body) >= GZIP_MIN_SIZE and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body, compresslevel=5)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def createServer(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, upstream: str = http_client.BASE_URL,
+                 token: str = None, cache_path: str = disk_cache.DEFAULT_PATH, cache_size: int = 10 * 1024 ** 3,
+                 today_ttl: int = 60, rate: float = 20, burst: int = 40, client_rate: float = 5,
+                 client_burst: int = 20, quiet: bool = False) -> ProxyServer:
+    """
+    创建缓存代理服务，调用serve_forever()开始服务
+    :param host         : 监听主机
+    :param port         : 监听端口
+    :param upstream     : 上游接口根地址
+    :param token        : 上游请求使用的令牌，为空时使用客户端请求中的token
+    :param cache_path   : 缓存目录
+    :param cache_size   : 缓存总大小上限，单位字节
+    :param today_ttl    : 日期范围包含今天的数据（例如getDailyMarket行情快照）的缓存时间，单位秒
+    :param rate         : 上游每秒请求数
+    :param burst        : 上游突发请求数
+    :param client_rate  : 每个客户端每秒请求数，为0时不限流
+    :param client_burst : 每个客户端突发请求数
+    :param quiet        : 是否不输出访问日志
+    """
+    cache = disk_cache.DiskCache(cache_path, max_size=cache_size, today_ttl=today_ttl, endpoints=None)
+    client = http_client.HttpClient(base_url=upstream, cache=cache,
+                                    rate_limiter=rate_limit.RateLimiter(rate, burst), single_flight=False)
+    limiter = ClientLimiter(client_rate, client_burst) if client_rate else None
+    return ProxyServer((host, port), client, token=token, limiter=limiter, quiet=quiet)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="waizao-proxy", description="歪枣网，本地缓存代理服务")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="监听主机，0.0.0.0表示允许其他机器访问")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="监听端口")
+    parser.add_argument("--upstream", default=http_client.BASE_URL, help="上游接口根地址")
+    parser.add_argument("--token", help="上游请求使用的令牌，为空时使用客户端请求中的token")
+    parser.add_argument("--cache", default=disk_cache.DEFAULT_PATH, help="缓存目录")
+    parser.add_argument("--cache-size", type=float, default=10, help="缓存总大小上限，单位GB")
+    parser.add_argument("--today-ttl", type=int, default=60, help="包含今天的数据的缓存时间，单位秒")
+    parser.add_argument("--rate", type=float, default=20, help="上游每秒请求数")
+    parser.add_argument("--burst", type=int, default=40, help="上游突发请求数")
+    parser.add_argument("--client-rate", type=float, default=5, help="每个客户端每秒请求数，0表示不限流")
+    parser.add_argument("--client-burst", type=int, default=20, help="每个客户端突发请求数")
+    parser.add_argument("--quiet", action="store_true", help="不输出访问日志")
+    args = parser.parse_args(argv)
+
+    server = createServer(args.host, args.port, args.upstream, args.token, args.cache,
+                          int(args.cache_size * 1024 ** 3), args.today_ttl, args.rate, args.burst,
+                          args.client_rate, args.client_burst, args.quiet)
+    host, port = server.server_address[:2]
+    print("waizao-proxy：http://%s:%s%s，上游：%s" % (host, port, PATH_PREFIX, args.upstream), file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，日期范围拆分工具。分线、时线、分时成交等接口一次请求较长的日期范围时，返回的数据会被截断或过大，
+      本模块按交易日历将 [startDate, endDate] 拆分为若干个交易日数量相同的窗口，窗口大小按接口和K线类别计算，
+      并发请求各窗口后按 (股票代码分组, 窗口) 的顺序拼接。code为all时接口只支持单日查询，窗口固定为1个交易日
+http://www.waizaowang.com/
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from waizao import batch_tool
+from waizao import calendar_tool
+from waizao import export_tool
+
+# 每个请求（一组股票 × 一个窗口）的目标数据条数
+ROWS_PER_REQUEST = 50000
+
+# 每个交易日的K线数量，按K线类别
+BARS_PER_DAY = {1: 241, 5: 48, 15: 16, 30: 8, 60: 4, 101: 1, 102: 0.2, 103: 0.05}
+
+# 每个交易日的数据条数，按接口名称，用于没有ktype参数的接口
+ROWS_PER_DAY = {
+    "getMinuteKLine": 241,
+    "getLevel2TimeDeal": 4800,
+}
+
+# 资产类型对应的交易日历市场类型，未列出的资产类型使用沪深京A股交易日历
+MTYPES = {3: 2, 11: 2}
+
+# 接口文档中表示code参数不支持all的说明
+ALL_UNSUPPORTED = "不支持all参数查询"
+
+
+def supportsAll(func) -> bool:
+    """
+    判断接口的code参数是否支持all，例如getMinuteKLine、getLevel2TimeDeal不支持
+    :param func : stock_api中的接口函数
+    """
+    return ALL_UNSUPPORTED not in (func.__doc__ or "")
+
+
+def planChunks(func, codes, chunk_size: int = batch_tool.MAX_CODES) -> list:
+    """
+    拆分股票代码，all不拆分；接口不支持all时抛出ValueError，避免发出注定失败的请求
+    :param func       : stock_api中带code参数的接口函数
+    :param codes      : 股票代码，列表或逗号分隔的字符串；若为all，则表示全部
+    :param chunk_size : 每组股票数量，默认50
+    :return: list，batch_tool.chunkCodes的返回值，或["all"]
+    """
+    if isinstance(codes, str) and codes.strip() == "all":
+        if not supportsAll(func):
+            raise ValueError("接口%s不支持all参数查询，请指定股票代码" % func.__name__)
+        return ["all"]
+    chunks = batch_tool.chunkCodes(codes, chunk_size)
+    if not chunks:
+        raise ValueError("股票代码不能为空")
+    return chunks
+
+
+def windowDays(endpoint: str, ktype: int = None, codes: int = 1) -> int:
+    """
+    计算每个窗口包含的交易日数量，使每个请求约ROWS_PER_REQUEST条数据，单个交易日已超出时为1
+    :param endpoint : 接口名称
+    :param ktype    : K线类别，没有ktype参数的接口为空
+    :param codes    : 每个请求的股票数量，例如chunkCount(chunks)
+    """
+    per_day = BARS_PER_DAY.get(ktype) if ktype is not None else None
+    per_day = (per_day or ROWS_PER_DAY.get(endpoint, 1)) * max(int(codes), 1)
+    return max(1, int(ROWS_PER_REQUEST // per_day))
+
+
+def chunkCount(chunks: list) -> int:
+    """
+    股票代码分组中最大的股票数量，用于windowDays
+    :param chunks : batch_tool.chunkCodes的返回值
+    """
+    return max((len(chunk.split(",")) for chunk in chunks), default=1)
+
+
+def chunkDays(endpoint: str, ktype: int, chunks: list, days: int = None) -> int:
+    """
+    计算每个窗口包含的交易日数量。code为all时接口只接受开始日期与结束日期为同一天的请求，固定为1
+    :param endpoint : 接口名称
+    :param ktype    : K线类别，没有ktype参数的接口为空
+    :param chunks   : planChunks的返回值
+    :param days     : 指定的交易日数量，为空时按windowDays计算
+    """
+    if "all" in chunks:
+        return 1
+    return days or windowDays(endpoint, ktype, chunkCount(chunks))
+
+
+def tradeDates(startDate: str, endDate: str, token: str, mtype: int = 1) -> list:
+    """
+    获取日期范围内的交易日，交易日历通过calendar_tool在进程内缓存，同一市场只请求一次
+    :param startDate : 开始日期，yyyy-MM-dd格式
+    :param endDate   : 结束日期，yyyy-MM-dd格式
+    :param token     : 令牌，登录后可获取
+    :param mtype     : 市场类型，取值范围：1|沪深京A股；2|港股；3|沪深港通-北向；4|沪深港通-南向
+    :return: list，yyyy-MM-dd格式的交易日，按日期排序
+    """
+    calendar = calendar_tool.getCalendar(mtype, token, startDate, endDate)
+    return calendar.tradingDays(str(startDate)[:10], str(endDate)[:10])
+
+
+def planWindows(dates: list, days: int) -> list:
+    """
+    将交易日按days个一组拆分为窗口，相邻窗口不重叠，窗口之间的非交易日不会产生数据
+    :param dates : 交易日，yyyy-MM-dd格式，按日期排序
+    :param days  : 每个窗口的交易日数量
+    :return: list，[(开始日期, 结束日期), ...]
+    """
+    return [(dates[i], dates[min(i + days, len(dates)) - 1]) for i in range(0, len(dates), days)]
+
+
+def stitch(responses: list) -> str:
+    """
+    按顺序拼接多个窗口返回的Json字符串。窗口之间不重叠，数据原样拼接，
+    分时成交等同一股票同一时间有多条数据的接口不会丢失数据
+    :param responses : 各窗口返回的Json字符串，同一股票代码分组的窗口按日期顺序排列
+    :return: str
+    """
+    merged = None
+    for response in responses:
+        payload = json.loads(response)
+        if "data" not in payload:
+            raise ValueError("请求失败：%s" % payload.get("message", response[:200]))
+        if merged is None:
+            merged = payload
+        else:
+            merged["data"].extend(payload["data"])
+    return json.dumps(merged, ensure_ascii=False)
+
+
+def planTasks(func, codes, startDate: str, endDate: str, token: str, dates: list = None, days: int = None,
+              chunk_size: int = batch_tool.MAX_CODES, **kwargs) -> list:
+    """
+    按股票代码分组和交易日窗口拆分请求，同一分组的窗口按日期顺序排列，code为all时每个窗口为1个交易日
+    :param func       : stock_api中带code、startDate、endDate参数的接口函数
+    :param codes      : 股票代码，列表或逗号分隔的字符串；若为all，则不拆分股票代码（接口不支持all时抛出ValueError）
+    :param startDate  : 开始日期，yyyy-MM-dd格式
+    :param endDate    : 结束日期，yyyy-MM-dd格式
+    :param token      : 令牌，登录后可获取
+    :param dates      : 交易日列表，为空时按资产类型通过getTradeDate获取
+    :param days       : 每个窗口的交易日数量，为空时按windowDays计算
+    :param chunk_size : 每组股票数量，默认50
+    :param kwargs     : 接口的其余参数，按参数名传入，用到其中的type和ktype
+    :return: list，[(股票代码分组, (开始日期, 结束日期)), ...]
+    """
+    chunks = planChunks(func, codes, chunk_size)
+    if dates is None:
+        dates = tradeDates(startDate, endDate, token, MTYPES.get(kwargs.get("type"), 1))
+    start, end = str(startDate)[:10], str(endDate)[:10]
+    dates = [date for date in dates if start <= date <= end]
+    windows = planWindows(dates, chunkDays(func.__name__, kwargs.get("ktype"), chunks, days))
+    return [(chunk, window) for chunk in chunks for window in windows]
+
+
+def fetchTask(func, task: tuple, token: str, **kwargs) -> str:
+    """
+    请求一个 (股票代码分组, (开始日期, 结束日期)) 任务，返回Json字符串，日期按接口要求的格式转换
+    :param func   : stock_api中带code、startDate、endDate参数的接口函数
+    :param task   : planTasks返回的任务
+    :param token  : 令牌，登录后可获取
+    :param kwargs : 接口的其余参数，按参数名传入，fields默认为all，export固定为1|Json字符串
+    :return: str
+    """
+    chunk, (first, last) = task
+    kwargs.setdefault("fields", "all")
+    kwargs.setdefault("filter", "")
+    kwargs.update(export=1, token=token)
+    params = batch_tool.endpointKwargs(func, code=chunk, startDate=batch_tool.formatDate(func, first),
+                                       endDate=batch_tool.formatDate(func, last, True), **kwargs)
+    return func(**params)
+
+
+def rangeRequest(func, codes, startDate: str, endDate: str, token: str, dates: list = None, days: int = None,
+                 max_workers: int = 8, chunk_size: int = batch_tool.MAX_CODES, **kwargs) -> str:
+    """
+    按交易日窗口拆分日期范围并发请求，返回拼接后的Json字符串
+    例如：rangeRequest(stock_api.getMinuteKLine, codes, "2024-01-01", "2024-12-31", token, type=1, fields="all")
+    :param func        : stock_api中带startDate、endDate参数的接口函数，例如：stock_api.getMinuteKLine
+    :param codes       : 股票代码，列表或逗号分隔的字符串；若为all，则按单个交易日逐日请求（接口支持all时）
+    :param startDate   : 开始日期，yyyy-MM-dd格式
+    :param endDate     : 结束日期，yyyy-MM-dd格式
+    :param token       : 令牌，登录后可获取
+    :param dates       : 交易日列表，为空时按资产类型通过getTradeDate获取
+    :param days        : 每个窗口的交易日数量，为空时按windowDays计算；code为all时固定为1
+    :param max_workers : 并发线程数
+    :param chunk_size  : 每组股票数量，默认50
+    :param kwargs      : 接口的其余参数，按参数名传入，export固定为1|Json字符串
+    :return: str
+    """
+    tasks = planTasks(func, codes, startDate, endDate, token, dates, days, chunk_size, **kwargs)
+    if not tasks:
+        return json.dumps({"code": 200, "message": "执行成功", "data": []}, ensure_ascii=False)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        responses = list(executor.map(lambda task: fetchTask(func, task, token, **kwargs), tasks))
+    return stitch(responses)
+
+
+def rangeDataFrame(func, codes, startDate: str, endDate: str, token: str, dates: list = None, days: int = None,
+                   max_workers: int = 8, chunk_size: int = batch_tool.MAX_CODES, **kwargs) -> pd.DataFrame:
+    """
+    按交易日窗口拆分日期范围并发请求，返回拼接后的DataFrame，字段按schema_tool中注册的类型转换，参数同rangeRequest
+    :return: pandas.DataFrame
+    """
+    return export_tool.toDataFrame(rangeRequest(func, codes, startDate, endDate, token, dates, days, max_workers,
+                                                chunk_size, **kwargs), func.__name__)
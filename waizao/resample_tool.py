@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，K线重采样工具。由本地缓存的1分钟K线（getMinuteKLine）向量化合成5、15、30、60分钟K线（getHourKLine）
+      以及日线、周线、月线（getDayKLine，不复权），分钟K线按交易时段分桶，不跨越午间休市，
+      一次分线下载即可得到所有K线类别
+http://www.waizaowang.com/
+"""
+
+import numpy as np
+import pandas as pd
+
+# 交易时段，按交易日历的市场类型，单位为当天的分钟数：(开始, 结束)
+# 沪深京A股：9:30--11:30，13:00--15:00；港股：9:30--12:00，13:00--16:00（早盘竞价和收市竞价并入相邻的K线）
+SESSIONS = {
+    1: ((570, 690), (780, 900)),
+    2: ((570, 720), (780, 960)),
+}
+
+# 分钟K线类别
+MINUTE_KTYPES = (5, 15, 30, 60)
+
+# 日线、周线、月线
+PERIOD_KTYPES = (101, 102, 103)
+
+# 重采样的聚合方式，不在此列的字段（除code、name外）不保留
+AGGREGATIONS = {
+    "open": "first",
+    "close": "last",
+    "high": "max",
+    "low": "min",
+    "cjl": "sum",
+    "cje": "sum",
+    "hsl": "sum",
+}
+
+
+def minuteLabels(tdate, ktype: int, mtype: int = 1) -> np.ndarray:
+    """
+    计算每根1分钟K线所属的ktype分钟K线的时间（K线结束时间），每个交易时段内单独分桶，
+    开盘竞价的K线并入第一根K线，收盘后的K线并入最后一根K线
+    :param tdate : 1分钟K线的时间，K线结束时间，例如9:31为9:30--9:31的K线
+    :param ktype : K线类别，取值范围：5|5分钟；15|15分钟；30|30分钟；60|60分钟
+    :param mtype : 市场类型，取值范围：1|沪深京A股；2|港股
+    :return: numpy.ndarray，datetime64[s]
+    """
+    if ktype not in MINUTE_KTYPES:
+        raise ValueError("K线类别%s无效，取值范围：%s" % (ktype, MINUTE_KTYPES))
+    if mtype not in SESSIONS:
+        raise ValueError("市场类型%s不支持，取值范围：%s" % (mtype, tuple(SESSIONS)))
+    starts = np.array([start for start, _ in SESSIONS[mtype]])
+    ends = np.array([end for _, end in SESSIONS[mtype]])
+    tdate = np.asarray(pd.to_datetime(tdate)).astype("datetime64[s]")
+    day = tdate.astype("datetime64[D]")
+    minute = (tdate - day).astype("int64") / 60.0
+    session = np.clip(np.searchsorted(starts, minute, side="right") - 1, 0, len(starts) - 1)
+    start, end = starts[session], ends[session]
+    offset = np.clip(minute - start, 1, end - start)
+    label = np.minimum(start + np.ceil(offset / ktype) * ktype, end)
+    return day.astype("datetime64[s]") + (label * 60).astype("int64").astype("timedelta64[s]")
+
+
+def periodKeys(tdate, ktype: int) -> np.ndarray:
+    """
+    计算日线、周线、月线的分组键：日线为日期，周线为所在周的周一，月线为所在月的第一天
+    :param tdate : K线时间
+    :param ktype : K线类别，取值范围：101|日线；102|周线；103|月线
+    :return: numpy.ndarray，datetime64[D]
+    """
+    day = np.asarray(pd.to_datetime(tdate)).astype("datetime64[D]")
+    if ktype == 101:
+        return day
+    if ktype == 102:
+        # 1970-01-01为周四，偏移3天后按7天取整即为周一
+        return day - ((day.astype("int64") + 3) % 7).astype("timedelta64[D]")
+    if ktype == 103:
+        return day.astype("datetime64[M]").astype("datetime64[D]")
+    raise ValueError("K线类别%s无效，取值范围：%s" % (ktype, PERIOD_KTYPES))
+
+
+def resample(bars: pd.DataFrame, ktype: int, mtype: int = 1, dates=None) -> pd.DataFrame:
+    """
+    将1分钟K线（或较细的K线）重采样为ktype的K线，开盘价取第一根、收盘价取最后一根、最高价取最大、最低价取最小、
+    成交量、成交额和换手率求和，涨跌额、涨跌幅和振幅按上一根K线的收盘价重新计算
+    例如：resample(store.readFrame(1, 1, 0, codes), 30)
+    :param bars  : K线数据，包含code、tdate及open、close、high、low、cjl、cje等字段，按 (code, tdate) 排序
+    :param ktype : 目标K线类别，取值范围：5|5分钟；15|15分钟；30|30分钟；60|60分钟；101|日线；102|周线；103|月线
+    :param mtype : 交易时段的市场类型，取值范围：1|沪深京A股；2|港股
+    :param dates : 交易日列表（例如range_tool.tradeDates的返回值），不为空时丢弃非交易日的K线
+    :return: pandas.DataFrame，tdate为K线结束时间，日线、周线、月线为最后一个交易日
+    """
+    if bars.empty:
+        return bars.copy()
+    if dates is not None:
+        trading = np.asarray(pd.to_datetime(list(dates))).astype("datetime64[D]")
+        day = np.asarray(pd.to_datetime(bars["tdate"])).astype("datetime64[D]")
+        bars = bars[np.isin(day, trading)]
+    if ktype in MINUTE_KTYPES:
+        key = minuteLabels(bars["tdate"], ktype, mtype)
+    else:
+        key = periodKeys(bars["tdate"], ktype)
+    spec = {"tdate": ("tdate", "last")}
+    if "name" in bars.columns:
+        spec["name"] = ("name", "last")
+    spec.update({field: (field, how) for field, how in AGGREGATIONS.items() if field in bars.columns})
+    codes = bars["code"].astype(str).to_numpy()
+    result = bars.groupby([codes, key], sort=False).agg(**spec)
+    result.index = result.index.set_names(["code", "key"])
+    result = result.reset_index()
+    if ktype in MINUTE_KTYPES:
+        result["tdate"] = result["key"].to_numpy().astype("datetime64[s]")
+    else:
+        result["tdate"] = np.asarray(pd.to_datetime(result["tdate"])).astype("datetime64[D]").astype("datetime64[s]")
+    result = result.drop(columns="key")
+    if "close" in result.columns:
+        close = result["close"].to_numpy(dtype="float64")
+        previous = result.groupby("code", sort=False)["close"].shift(1).to_numpy(dtype="float64")
+        result["zde"] = close - previous
+        result["zdf"] = result["zde"] / previous * 100
+        if "high" in result.columns and "low" in result.columns:
+            result["zf"] = (result["high"].to_numpy(dtype="float64") -
+                            result["low"].to_numpy(dtype="float64")) / previous * 100
+    return result
+
+
+def resampleAll(bars: pd.DataFrame, ktypes=MINUTE_KTYPES + PERIOD_KTYPES, mtype: int = 1, dates=None) -> dict:
+    """
+    由同一份1分钟K线合成多个K线类别，周线、月线由合成的日线再聚合，减少重复计算
+    :param bars   : 1分钟K线，按 (code, tdate) 排序
+    :param ktypes : 目标K线类别
+    :param mtype  : 交易时段的市场类型，取值范围：1|沪深京A股；2|港股
+    :param dates  : 交易日列表，不为空时丢弃非交易日的K线
+    :return: dict，{K线类别: pandas.DataFrame}
+    """
+    result = {}
+    daily = None
+    for ktype in ktypes:
+        if ktype in MINUTE_KTYPES or ktype == 101:
+            result[ktype] = resample(bars, ktype, mtype, dates)
+        else:
+            if daily is None:
+                daily = result.get(101)
+                if daily is None:
+                    daily = resample(bars, 101, mtype, dates)
+            result[ktype] = resample(daily, ktype, mtype)
+    return result
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，接口字段类型注册表。为每个接口声明返回字段的紧凑类型：价格和比例使用float32，成交量在不溢出时使用int32，
+      股票代码、名称、行业等重复取值多的字段使用category，日期使用datetime64，加载数据时按注册表转换，
+      可显著降低全市场历史数据的内存占用，并加快groupby等操作
+http://www.waizaowang.com/
+"""
+
+import numpy as np
+import pandas as pd
+
+# 分类字段：股票代码、名称、行业、概念、地域、市场
+CATEGORY_FIELDS = ("code", "name", "hy", "gn", "dy", "market")
+
+# 日期字段
+DATE_FIELDS = ("tdate", "ttime", "date")
+
+# 价格、涨跌幅、换手率等精度要求不高的字段
+FLOAT32_FIELDS = ("open", "close", "high", "low", "zrsp", "zde", "zdf", "zf", "hsl", "lb", "wb", "avg", "price")
+
+# 成交量字段，取值超出int32范围时使用int64
+INT32_FIELDS = ("cjl", "vol")
+
+# 成交额、市值等数值较大的字段保持float64
+FLOAT64_FIELDS = ("cje", "zsz", "ltsz", "amount")
+
+
+def _fields(*groups) -> dict:
+    schema = {}
+    for fields, dtype in groups:
+        schema.update({field: dtype for field in fields})
+    return schema
+
+
+# 所有接口共用的字段类型
+COMMON = _fields((CATEGORY_FIELDS, "category"), (DATE_FIELDS, "datetime64[s]"), (FLOAT32_FIELDS, "float32"),
+                 (INT32_FIELDS, "int32"), (FLOAT64_FIELDS, "float64"))
+
+KLINE = _fields((("code", "name"), "category"), (("tdate",), "datetime64[s]"),
+                (("open", "close", "high", "low", "zde", "zdf", "zf", "hsl"), "float32"),
+                (("cjl",), "int32"), (("cje",), "float64"))
+
+# 接口名称对应的字段类型，未注册的接口使用COMMON
+SCHEMAS = {
+    "getDayKLine": KLINE,
+    "getHourKLine": KLINE,
+    "getMinuteKLine": KLINE,
+    "getDailyMarket": COMMON,
+    "getStockHSADailyMarket": COMMON,
+    "getBaseInfo": _fields((CATEGORY_FIELDS, "category")),
+    "getStockHSABaseInfo": _fields((CATEGORY_FIELDS, "category"), (DATE_FIELDS, "datetime64[s]")),
+    "getLevel2TimeDeal": _fields((("code", "name"), "category"), (("tdate", "ttime"), "datetime64[s]"),
+                                 (("price",), "float32"), (("cjl", "vol"), "int32"), (("cje",), "float64")),
+    "getTradeDate": _fields((("tdate",), "datetime64[s]")),
+    "getStockTradeDate": _fields((("tdate",), "datetime64[s]")),
+}
+
+
+def getSchema(endpoint: str = None) -> dict:
+    """
+    获取接口的字段类型，未注册的接口返回COMMON
+    :param endpoint : 接口名称
+    :return: dict，{字段名称: 类型}
+    """
+    return dict(SCHEMAS.get(endpoint, COMMON))
+
+
+def register(endpoint: str, schema: dict, replace: bool = False):
+    """
+    注册接口的字段类型，默认与已注册的字段类型合并
+    :param endpoint : 接口名称
+    :param schema   : 字段类型，例如{"close": "float32", "cjl": "int32", "tdate": "datetime64[s]", "code": "category"}
+    :param replace  : 是否替换已注册的字段类型
+    """
+    SCHEMAS[endpoint] = dict(schema) if replace else dict(SCHEMAS.get(endpoint, COMMON), **schema)
+
+
+def toInt(values, dtype: str = "int32"):
+    """
+    转换为整数，取值超出dtype范围时使用int64，存在空值时使用float64
+    :param values : 数组或Series
+    :param dtype  : 目标整数类型
+    """
+    values = pd.to_numeric(values, errors="coerce")
+    array = np.asarray(values, dtype="float64")
+    if np.isnan(array).any():
+        return values.astype("float64") if isinstance(values, pd.Series) else array
+    info = np.iinfo(dtype)
+    if len(array) and (array.min() < info.min or array.max() > info.max):
+        dtype = "int64"
+    return values.astype(dtype) if isinstance(values, pd.Series) else array.astype(dtype)
+
+
+def convert(series: pd.Series, dtype: str) -> pd.Series:
+    """
+    按类型转换一列数据，无法转换的取值为空
+    :param series : 数据列
+    :param dtype  : 类型，取值范围：category、datetime64[s]、float32、float64、int32、int64、str
+    """
+    if dtype == "category":
+        return series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype("category")
+    if dtype.startswith("datetime64"):
+        return pd.to_datetime(series, errors="coerce").astype(dtype)
+    if dtype in ("int32", "int64"):
+        return toInt(series, dtype)
+    if dtype in ("float32", "float64"):
+        return pd.to_numeric(series, errors="coerce").astype(dtype)
+    return series.astype(dtype)
+
+
+def applySchema(df: pd.DataFrame, schema) -> pd.DataFrame:
+    """
+    按字段类型转换DataFrame，只转换DataFrame中存在的字段，原DataFrame不变
+    :param df     : 数据
+    :param schema : 字段类型或接口名称
+    :return: pandas.DataFrame
+    """
+    if isinstance(schema, str) or schema is None:
+        schema = getSchema(schema)
+    columns = {column: convert(df[column], schema[column]) for column in df.columns if column in schema}
+    if not columns:
+        return df
+    return df.assign(**columns)
@@ -0,0 +1,6 @@
+"""
+歪枣网，本地K线数据存储
+"""
+
+from waizao.store.kline_store import KLineStore
+from waizao.store.shared_panel import SharedPanel
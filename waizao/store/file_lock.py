@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，跨进程文件锁，供本地K线存储的写入和共享内存面板的加载使用
+http://www.waizaowang.com/
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+# 等待锁时检查的间隔，单位秒
+POLL_INTERVAL = 0.1
+
+
+@contextmanager
+def fileLock(path: str, timeout: float):
+    """
+    跨进程（同一进程的不同线程之间同样互斥）的排他锁，优先使用fcntl.flock，持有锁的进程退出时自动释放；
+    不支持fcntl时以O_EXCL创建锁文件，退出with时删除
+    :param path    : 锁文件路径
+    :param timeout : 等待锁的时间，单位秒，超时抛出TimeoutError
+    """
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+    deadline = time.monotonic() + timeout
+    if fcntl is not None:
+        fd = os.open(path, os.O_CREAT | os.O_RDWR)
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError("等待文件锁%s超过%s秒" % (path, timeout))
+                    time.sleep(POLL_INTERVAL)
+            yield
+        finally:
+            os.close(fd)
+        return
+    while True:
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_RDWR))
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                raise TimeoutError("等待文件锁%s超过%s秒" % (path, timeout))
+            time.sleep(POLL_INTERVAL)
+    try:
+        yield
+    finally:
+        os.remove(path)
@@ -0,0 +1,329 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，本地列式K线存储。getDayKLine、getHourKLine、getMinuteKLine的数据按
+      资产类型/K线类别/复权信息/年份分区保存，每列一个.npy文件，同一股票的数据连续存放，
+      读取时通过内存映射返回每只股票的NumPy视图，无需重新解析Json。增量写入追加为分区内的增量段，
+      不重写整个年份分区，增量段达到MAX_DELTAS个时合并；写入按 (资产类型, K线类别, 复权信息) 加文件锁
+http://www.waizaowang.com/
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from waizao import export_tool
+from waizao.store.file_lock import fileLock
+
+# K线类别，取值范围：1|1分钟；5|5分钟；15|15分钟；30|30分钟；60|60分钟；101|日线；102|周线；103|月线
+KTYPES = (1, 5, 15, 30, 60, 101, 102, 103)
+
+# 分区键或索引中已包含的字段，不再按列保存
+PARTITION_COLUMNS = ("code", "type", "ktype", "fq")
+
+INDEX_FILE = "index.json"
+
+# 增量段的目录名前缀，位于年份分区目录内，按编号顺序写入，后写入的数据覆盖先写入的相同 (code, tdate)
+DELTA_PREFIX = "delta-"
+
+# 分区内的增量段数量上限，达到时与基础数据合并为一个分区
+MAX_DELTAS = 32
+
+# 写入锁文件，位于 root/type=1/ktype=101/fq=1/ 目录
+LOCK_FILE = ".lock"
+
+
+class KLineStore:
+    """
+    本地列式K线存储，目录结构为 root/type=1/ktype=101/fq=1/year=2024/{列名}.npy 和 index.json。
+    index.json 记录每只股票在分区内的行范围 [start, stop) 和股票名称，分区内数据按 (code, tdate) 排序。
+    增量写入保存在 year=2024/delta-000001/ 等子目录中，格式与分区相同
+    """
+
+    def __init__(self, root: str, lock_timeout: float = 600):
+        """
+        :param root         : 存储根目录
+        :param lock_timeout : 等待其他进程写入完成的时间，单位秒
+        """
+        self.root = root
+        self.lock_timeout = lock_timeout
+
+    def partitionPath(self, type: int, ktype: int, fq: int, year: int) -> str:
+        """
+        获取分区目录
+        :param type  : 资产类型
+        :param ktype : K线类别，取值范围：1|1分钟；5|5分钟；15|15分钟；30|30分钟；60|60分钟；101|日线；102|周线；103|月线
+        :param fq    : 复权信息，取值范围：0|不复权；1|前复权；2|后复权
+        :param year  : 年份
+        """
+        if ktype not in KTYPES:
+            raise ValueError("K线类别%s无效，取值范围：%s" % (ktype, KTYPES))
+        return os.path.join(self.root, "type=%s" % type, "ktype=%s" % ktype, "fq=%s" % fq, "year=%s" % year)
+
+    def years(self, type: int, ktype: int, fq: int) -> list:
+        """
+        获取已存储的年份
+        """
+        path = os.path.dirname(self.partitionPath(type, ktype, fq, 0))
+        if not os.path.isdir(path):
+            return []
+        return sorted(int(name[5:]) for name in os.listdir(path)
+                      if name.startswith("year=") and name[5:].isdigit())
+
+    def write(self, df: pd.DataFrame, type: int, ktype: int, fq: int = 0):
+        """
+        写入K线数据，与已有数据按 (code, tdate) 去重合并，新数据覆盖旧数据。
+        新数据追加为增量段，写入量与新数据的大小成正比；多个进程（或线程）同时写入时按顺序执行
+        :param df    : K线数据，至少包含code和tdate字段，例如export_tool.toDataFrame的返回值
+        :param type  : 资产类型
+        :param ktype : K线类别
+        :param fq    : 复权信息，分线和时线数据均为不复权数据，取0
+        """
+        if df.empty:
+            return
+        df = df.copy()
+        df["code"] = df["code"].astype(str)
+        df["tdate"] = pd.to_datetime(df["tdate"])
+        folder = os.path.dirname(self.partitionPath(type, ktype, fq, 0))
+        os.makedirs(folder, exist_ok=True)
+        with fileLock(os.path.join(folder, LOCK_FILE), self.lock_timeout):
+            for year, part in df.groupby(df["tdate"].dt.year):
+                path = self.partitionPath(type, ktype, fq, int(year))
+                part = _sortRows(part)
+                deltas = self._deltas(path)
+                if self._readIndex(path) is None:
+                    self._writePartition(path, part)
+                elif len(deltas) >= MAX_DELTAS:
+                    self._writePartition(path, _sortRows(pd.concat([self._readPartition(path), part],
+                                                                   ignore_index=True)))
+                else:
+                    number = int(os.path.basename(deltas[-1])[len(DELTA_PREFIX):]) + 1 if deltas else 1
+                    temp = tempfile.mkdtemp(prefix=".tmp-", dir=path)
+                    self._writeColumns(temp, part)
+                    os.replace(temp, os.path.join(path, "%s%06d" % (DELTA_PREFIX, number)))
+
+    def writeJson(self, data: str, type: int, ktype: int, fq: int = 0):
+        """
+        写入接口返回的Json格式数据
+        :param data  : Json格式数据
+        :param type  : 资产类型
+        :param ktype : K线类别
+        :param fq    : 复权信息
+        """
+        self.write(export_tool.toDataFrame(data), type, ktype, fq)
+
+    def _writeColumns(self, folder: str, df: pd.DataFrame):
+        codes = df["code"].to_numpy()
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        stops = np.r_[starts[1:], len(codes)]
+        names = df["name"].astype(str).to_numpy() if "name" in df.columns else None
+        index = {"rows": len(df), "codes": {}}
+        for start, stop in zip(starts, stops):
+            index["codes"][codes[start]] = {
+                "start": int(start), "stop": int(stop),
+                "name": None if names is None else names[stop - 1],
+            }
+        for column in df.columns:
+            if column in PARTITION_COLUMNS or column == "name":
+                continue
+            np.save(os.path.join(folder, column + ".npy"), _toArray(df[column]), allow_pickle=False)
+        with open(os.path.join(folder, INDEX_FILE), "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+
+    def _writePartition(self, path: str, df: pd.DataFrame):
+        # 先写入临时目录，再整体替换旧分区（连同其中的增量段），避免读到写了一半的数据
+        parent = os.path.dirname(path)
+        os.makedirs(parent, exist_ok=True)
+        temp = tempfile.mkdtemp(prefix=".tmp-", dir=parent)
+        self._writeColumns(temp, df)
+        trash = None
+        if os.path.isdir(path):
+            trash = tempfile.mkdtemp(prefix=".old-", dir=parent)
+            os.replace(path, os.path.join(trash, "partition"))
+        os.replace(temp, path)
+        if trash is not None:
+            shutil.rmtree(trash, ignore_errors=True)
+
+    def _deltas(self, path: str) -> list:
+        # 分区内的增量段目录，按写入顺序排列
+        if not os.path.isdir(path):
+            return []
+        return [os.path.join(path, name) for name in sorted(os.listdir(path)) if name.startswith(DELTA_PREFIX)]
+
+    def _readIndex(self, path: str):
+        file = os.path.join(path, INDEX_FILE)
+        if not os.path.isfile(file):
+            return None
+        with open(file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _columns(self, path: str) -> dict:
+        # 以只读方式内存映射每一列
+        return {name[:-4]: np.load(os.path.join(path, name), mmap_mode="r", allow_pickle=False)
+                for name in sorted(os.listdir(path)) if name.endswith(".npy")}
+
+    def _segments(self, path: str) -> list:
+        # 分区的基础数据和增量段，按写入顺序排列，每段只读取一次索引并内存映射一次各列
+        segments = []
+        for folder in [path] + self._deltas(path):
+            index = self._readIndex(folder)
+            if index is not None:
+                segments.append((index, self._columns(folder)))
+        return segments
+
+    def _readPartition(self, path: str):
+        frames = []
+        for index, columns in self._segments(path):
+            df = pd.DataFrame({column: np.asarray(array) for column, array in columns.items()})
+            codes = np.empty(index["rows"], dtype=object)
+            names = np.empty(index["rows"], dtype=object)
+            for code, item in index["codes"].items():
+                codes[item["start"]:item["stop"]] = code
+                names[item["start"]:item["stop"]] = item["name"]
+            df.insert(0, "code", codes)
+            if any(name is not None for name in names):
+                df.insert(1, "name", names)
+            frames.append(df)
+        if not frames:
+            return None
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    def _partitions(self, type: int, ktype: int, fq: int, start, end) -> list:
+        # 与 [start, end] 相交的年份分区，[(年份, 分区的各段), ...]
+        result = []
+        for year in self.years(type, ktype, fq):
+            if (start is not None and year < start.astype(object).year) or \
+                    (end is not None and year > end.astype(object).year):
+                continue
+            segments = self._segments(self.partitionPath(type, ktype, fq, year))
+            if segments:
+                result.append((year, segments))
+        return result
+
+    def codes(self, type: int, ktype: int, fq: int = 0) -> list:
+        """
+        获取已存储的股票代码
+        """
+        result = set()
+        for year in self.years(type, ktype, fq):
+            path = self.partitionPath(type, ktype, fq, year)
+            for folder in [path] + self._deltas(path):
+                index = self._readIndex(folder)
+                if index is not None:
+                    result.update(index["codes"])
+        return sorted(result)
+
+    def read(self, type: int, ktype: int, fq: int, code: str, startDate: str = None, endDate: str = None) -> dict:
+        """
+        读取一只股票的K线数据，返回 {列名: numpy数组}。
+        数据只位于一个年份分区时返回内存映射的只读视图（零拷贝），跨多个年份时拼接为新数组
+        :param type      : 资产类型
+        :param ktype     : K线类别
+        :param fq        : 复权信息
+        :param code      : 股票代码
+        :param startDate : 开始日期，yyyy-MM-dd或yyyy-MM-dd HH:mm:ss格式，为空时不限制
+        :param endDate   : 结束日期，yyyy-MM-dd或yyyy-MM-dd HH:mm:ss格式，为空时不限制
+        :return: dict
+        """
+        start, end = _bounds(startDate, endDate)
+        parts = [part for _, segments in self._partitions(type, ktype, fq, start, end)
+                 for part in [_slice(segments, code, start, end)] if part]
+        return _concat(parts)
+
+    def readFrame(self, type: int, ktype: int, fq: int, codes=None, startDate: str = None,
+                  endDate: str = None) -> pd.DataFrame:
+        """
+        读取多只股票的K线数据，返回DataFrame
+        :param codes     : 股票代码，列表或逗号分隔的字符串，为空时读取全部
+        :return: pandas.DataFrame
+        """
+        start, end = _bounds(startDate, endDate)
+        partitions = self._partitions(type, ktype, fq, start, end)
+        if codes is None:
+            codes = sorted({code for _, segments in partitions for index, _ in segments for code in index["codes"]})
+        elif isinstance(codes, str):
+            codes = codes.split(",")
+        frames = []
+        for code in codes:
+            parts = [part for _, segments in partitions for part in [_slice(segments, code, start, end)] if part]
+            if parts:
+                frame = pd.DataFrame(_concat(parts))
+                frame.insert(0, "code", code)
+                frames.append(frame)
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+
+def _bounds(startDate: str, endDate: str) -> tuple:
+    start = None if startDate is None else np.datetime64(pd.Timestamp(startDate), "s")
+    end = None if endDate is None else np.datetime64(_endOfDay(endDate), "s")
+    return start, end
+
+
+def _sortRows(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.drop_duplicates(["code", "tdate"], keep="last")
+    return df.sort_values(["code", "tdate"], kind="stable").reset_index(drop=True)
+
+
+def _slice(segments: list, code: str, start, end) -> dict:
+    # 一只股票在一个分区内 [start, end] 的数据；只位于一段时返回内存映射的视图，
+    # 位于多段时按tdate合并，后写入的段覆盖先写入的相同时间
+    parts = []
+    for index, columns in segments:
+        item = index["codes"].get(code)
+        if item is not None:
+            parts.append({column: array[item["start"]:item["stop"]] for column, array in columns.items()})
+    if not parts:
+        return {}
+    part = parts[0]
+    if len(parts) > 1:
+        if all(part.keys() == other.keys() for other in parts[1:]):
+            tdate = np.concatenate([other["tdate"] for other in parts])
+            order = np.argsort(tdate, kind="stable")
+            ordered = tdate[order]
+            rows = order[np.r_[ordered[1:] != ordered[:-1], True]]
+            part = {column: np.concatenate([other[column] for other in parts])[rows] for column in part}
+        else:
+            # 各段的字段不同时（例如后写入的数据增加了字段），缺少的值为NaN
+            df = pd.concat([pd.DataFrame(other) for other in parts], ignore_index=True)
+            df = df.drop_duplicates("tdate", keep="last").sort_values("tdate", kind="stable")
+            part = {column: _toArray(df[column]) for column in df.columns}
+    tdate = part["tdate"]
+    lo = 0 if start is None else int(np.searchsorted(tdate, start, "left"))
+    hi = len(tdate) if end is None else int(np.searchsorted(tdate, end, "right"))
+    if hi <= lo:
+        return {}
+    return {column: array[lo:hi] for column, array in part.items()}
+
+
+def _concat(parts: list) -> dict:
+    if not parts:
+        return {}
+    if len(parts) == 1:
+        return parts[0]
+    return {column: np.concatenate([part[column] for part in parts]) for column in parts[0]}
+
+
+def _toArray(series: pd.Series) -> np.ndarray:
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.to_numpy().astype("datetime64[s]")
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy()
+    numeric = pd.to_numeric(series, errors="coerce")
+    if numeric.notna().sum() == series.notna().sum():
+        return numeric.to_numpy(dtype="float64")
+    return series.astype(str).to_numpy(dtype="U")
+
+
+def _endOfDay(date: str) -> pd.Timestamp:
+    # 只有日期时，结束日期包含当天的所有分钟数据
+    timestamp = pd.Timestamp(date)
+    if len(str(date).strip()) <= 10:
+        timestamp += pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+    return timestamp
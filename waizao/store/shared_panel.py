@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，共享内存K线面板。将全市场K线数据按 (code, tdate) 排序后，以固定类型的列数组发布到
+      multiprocessing.shared_memory（或内存映射文件）中，并记录每只股票的行范围；
+      同一台机器上的其他进程直接附加到同一块内存，得到零拷贝的只读NumPy视图，不必各自请求和解析一遍
+http://www.waizaowang.com/
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from waizao.store.file_lock import fileLock
+
+# 内存块开头的标记，发布完成后最后写入，附加时据此判断数据是否完整
+MAGIC = b"WZPANEL1"
+
+# 标记和头部长度各占8字节，头部为Json
+PREFIX = struct.Struct("<8sQ")
+
+# 每列的起始位置按64字节对齐
+ALIGNMENT = 64
+
+# 由索引记录、不按列保存的字段
+INDEX_COLUMNS = ("code", "name")
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _toArray(series: pd.Series) -> np.ndarray:
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.to_numpy().astype("datetime64[s]")
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy()
+    return series.astype(str).to_numpy(dtype="U")
+
+
+def _mapShared(shm, access: int = mmap.ACCESS_DEFAULT):
+    # 单独映射共享内存，由视图经memoryview引用映射对象，最后一个视图释放后才解除映射；映射后即可关闭shm
+    if getattr(shm, "_fd", -1) >= 0:
+        return mmap.mmap(shm._fd, shm.size, access=access)
+    return mmap.mmap(-1, shm.size, tagname=shm.name, access=access)
+
+
+def _lockPath(name: str) -> str:
+    # 共享内存模式的锁文件，位于临时目录
+    return os.path.join(tempfile.gettempdir(), "waizao-panel-%s.lock" % name)
+
+
+def _untrack(shm):
+    # Python 3.13之前，附加共享内存的进程退出时resource_tracker会删除共享内存，附加方需要取消跟踪
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+
+
+class SharedPanel:
+    """
+    共享内存K线面板。内存布局：标记(8字节) + 头部长度(8字节) + 头部Json + 按64字节对齐的各列数据。
+    头部记录行数、每列的类型和位置、每只股票的行范围 [start, stop) 和股票名称。
+    返回的视图引用同一个映射，close后已取出的视图仍然有效，最后一个视图释放后才解除映射
+    """
+
+    def __init__(self, mapping: mmap.mmap, header: dict, name: str = None, path: str = None):
+        self.header = header
+        self.name = name
+        self.path = path
+        self.rows = header["rows"]
+        self.index = header["codes"]
+        self._mapping = mapping
+        view = memoryview(mapping)
+        self.columns = {}
+        for column, (dtype, offset) in header["columns"].items():
+            array = np.frombuffer(view, dtype=np.dtype(dtype), count=self.rows, offset=offset)
+            array.flags.writeable = False
+            self.columns[column] = array
+
+    @staticmethod
+    def layout(df: pd.DataFrame) -> tuple:
+        """
+        按 (code, tdate) 排序并计算内存布局
+        :param df : K线数据，包含code、tdate字段
+        :return: tuple，(排序后的各列数组, 头部dict, 总字节数)
+        """
+        df = df.assign(code=df["code"].astype(str)).sort_values(["code", "tdate"], kind="stable")
+        codes = df["code"].to_numpy()
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.empty(0, dtype=int)
+        stops = np.r_[starts[1:], len(codes)].astype(int)
+        names = df["name"].astype(str).to_numpy() if "name" in df.columns else None
+        index = {codes[start]: [int(start), int(stop), None if names is None else names[stop - 1]]
+                 for start, stop in zip(starts, stops)}
+        arrays = {column: np.ascontiguousarray(_toArray(df[column]))
+                  for column in df.columns if column not in INDEX_COLUMNS}
+        header = {"rows": len(df), "codes": index, "columns": {}}
+        # 头部长度与列的位置相互依赖，先按足够大的位置估算头部长度，再计算各列的位置
+        for column, array in arrays.items():
+            header["columns"][column] = [array.dtype.str, 10 ** 15]
+        offset = _align(PREFIX.size + len(json.dumps(header, ensure_ascii=False).encode("utf-8")))
+        for column, array in arrays.items():
+            header["columns"][column] = [array.dtype.str, offset]
+            offset = _align(offset + array.nbytes)
+        return arrays, header, max(offset, ALIGNMENT)
+
+    @staticmethod
+    def _write(buffer, arrays: dict, header: dict):
+        content = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        buffer[PREFIX.size:PREFIX.size + len(content)] = content
+        for column, array in arrays.items():
+            offset = header["columns"][column][1]
+            target = np.ndarray(array.shape, dtype=array.dtype, buffer=buffer, offset=offset)
+            target[...] = array
+        buffer[:PREFIX.size] = PREFIX.pack(MAGIC, len(content))
+
+    @staticmethod
+    def _readHeader(buffer) -> dict:
+        magic, length = PREFIX.unpack(bytes(buffer[:PREFIX.size]))
+        if magic != MAGIC:
+            return None
+        return json.loads(bytes(buffer[PREFIX.size:PREFIX.size + length]).decode("utf-8"))
+
+    @classmethod
+    def publish(cls, df: pd.DataFrame, name: str = None, path: str = None) -> "SharedPanel":
+        """
+        发布K线数据。name与path二选一：name为共享内存名称，path为内存映射文件路径（适合/dev/shm或需要跨重启保留时）。
+        共享内存已存在时抛出FileExistsError，可改用load
+        :param df   : K线数据，包含code、tdate字段，例如batch_tool.batchDataFrame(stock_api.getDayKLine, ...)的返回值
+        :param name : 共享内存名称
+        :param path : 内存映射文件路径
+        :return: SharedPanel，发布方负责在不再需要时调用unlink
+        """
+        if (name is None) == (path is None):
+            raise ValueError("name和path参数必须指定且只能指定一个")
+        arrays, header, size = cls.layout(df)
+        if path is not None:
+            folder = os.path.dirname(os.path.abspath(path))
+            os.makedirs(folder, exist_ok=True)
+            fd, temp = tempfile.mkstemp(prefix=".panel-", dir=folder)
+            try:
+                with os.fdopen(fd, "r+b") as f:
+                    f.truncate(size)
+                    with mmap.mmap(f.fileno(), size) as mapping:
+                        cls._write(mapping, arrays, header)
+                os.replace(temp, path)
+            except BaseException:
+                os.remove(temp)
+                raise
+            return cls.attach(path=path)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        try:
+            mapping = _mapShared(shm)
+            cls._write(mapping, arrays, header)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        shm.close()
+        return cls(mapping, header, name=name)
+
+    @classmethod
+    def attach(cls, name: str = None, path: str = None, timeout: float = 60) -> "SharedPanel":
+        """
+        附加到已发布的K线面板，返回只读的零拷贝视图；发布尚未完成时最多等待timeout秒
+        :param name    : 共享内存名称
+        :param path    : 内存映射文件路径
+        :param timeout : 等待发布完成的时间，单位秒
+        """
+        if (name is None) == (path is None):
+            raise ValueError("name和path参数必须指定且只能指定一个")
+        if path is not None:
+            with open(path, "rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            header = cls._readHeader(mapping)
+            if header is None:
+                mapping.close()
+                raise ValueError("文件%s不是K线面板" % path)
+            return cls(mapping, header, path=path)
+        shm = shared_memory.SharedMemory(name=name)
+        _untrack(shm)
+        try:
+            mapping = _mapShared(shm, mmap.ACCESS_READ)
+        finally:
+            shm.close()
+        deadline = time.monotonic() + timeout
+        header = cls._readHeader(mapping)
+        while header is None:
+            if time.monotonic() > deadline:
+                mapping.close()
+                raise TimeoutError("共享内存%s的发布未在%s秒内完成" % (name, timeout))
+            time.sleep(0.05)
+            header = cls._readHeader(mapping)
+        return cls(mapping, header, name=name)
+
+    @classmethod
+    def load(cls, name: str = None, path: str = None, loader=None, timeout: float = 600) -> "SharedPanel":
+        """
+        已发布时直接附加，否则调用loader()获取数据并发布；多个进程同时调用时只有一个进程调用loader
+        例如：SharedPanel.load("day-2024", loader=lambda: batch_tool.batchDataFrame(stock_api.getDayKLine, codes, ...))
+        :param name    : 共享内存名称
+        :param path    : 内存映射文件路径
+        :param loader  : 无参数的函数，返回K线DataFrame
+        :param timeout : 等待其他进程发布完成的时间，单位秒
+        """
+        if path is not None:
+            if os.path.isfile(path):
+                return cls.attach(path=path)
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with fileLock(path + ".lock", timeout):
+                # 等锁期间其他进程可能已发布完成
+                if os.path.isfile(path):
+                    return cls.attach(path=path)
+                return cls.publish(loader(), path=path)
+        try:
+            return cls.attach(name=name, timeout=0)
+        except (FileNotFoundError, TimeoutError):
+            pass
+        # 发布方在持有锁期间发布，加载失败或进程退出时锁随之释放，由下一个等待者重新加载
+        with fileLock(_lockPath(name), timeout):
+            try:
+                return cls.attach(name=name, timeout=0)
+            except FileNotFoundError:
+                pass
+            except TimeoutError:
+                # 持有锁时仍未发布完成，说明发布方在写入过程中退出，删除残留的共享内存后重新发布
+                stale = shared_memory.SharedMemory(name=name)
+                stale.close()
+                stale.unlink()
+            return cls.publish(loader(), name=name)
+
+    def codes(self) -> list:
+        """
+        面板中的股票代码，按代码排序
+        """
+        return list(self.index)
+
+    def read(self, code: str) -> dict:
+        """
+        读取一只股票的K线，返回 {列名: 只读numpy视图}，不复制数据
+        :param code : 股票代码
+        """
+        item = self.index.get(code)
+        if item is None:
+            return {}
+        start, stop, _ = item
+        return {column: array[start:stop] for column, array in self.columns.items()}
+
+    def frame(self, codes=None) -> pd.DataFrame:
+        """
+        转换为DataFrame（复制数据），包含code、name字段
+        :param codes : 股票代码，列表或逗号分隔的字符串，为空时为全部
+        """
+        if codes is None:
+            codes = self.codes()
+        elif isinstance(codes, str):
+            codes = codes.split(",")
+        items = [(code, self.index[code]) for code in codes if code in self.index]
+        if not items:
+            return pd.DataFrame()
+        rows = np.concatenate([np.arange(start, stop) for _, (start, stop, _) in items])
+        counts = [stop - start for _, (start, stop, _) in items]
+        df = pd.DataFrame({column: array[rows] for column, array in self.columns.items()})
+        df.insert(0, "code", np.repeat([code for code, _ in items], counts))
+        if any(name is not None for _, (_, _, name) in items):
+            df.insert(1, "name", np.repeat([name for _, (_, _, name) in items], counts))
+        return df
+
+    def close(self):
+        """
+        释放本面板持有的视图，不影响其他进程；已通过read、columns取出的视图仍然有效，全部释放后才解除映射
+        """
+        self.columns = {}
+        if self._mapping is not None:
+            try:
+                self._mapping.close()
+            except BufferError:
+                # 仍有视图引用映射，映射随最后一个视图一起释放
+                pass
+            self._mapping = None
+
+    def unlink(self):
+        """
+        删除共享内存或内存映射文件，通常由发布方在所有进程结束后调用
+        """
+        self.close()
+        if self.path is not None:
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+        elif self.name is not None:
+            shm = shared_memory.SharedMemory(name=self.name)
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
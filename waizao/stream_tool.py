@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，Csv数据流式下载工具。export为4（Csv文件）时以stream方式读取响应体，按块直接写入磁盘（可选gzip、zstd压缩），
+      或按行分批解析为DataFrame，不在内存中保留完整的响应字符串，适合code为all或较长日期范围的分线数据
+http://www.waizaowang.com/
+"""
+
+import codecs
+import gzip
+import inspect
+import io
+import os
+import tempfile
+import time
+import zlib
+
+import pandas as pd
+
+from waizao import schema_tool
+from waizao.api import errors
+from waizao.api import http_client
+from waizao.api.retry import RetryPolicy
+
+# 每次读取的响应块大小，单位字节
+CHUNK_SIZE = 1024 * 1024
+
+# 每批解析的数据行数
+BATCH_ROWS = 100000
+
+# Csv文件前两行为英文标题和中文标题
+CSV_HEADER_LINES = 2
+
+COMPRESSIONS = (None, "gzip", "zstd")
+
+
+def requestParams(func, kwargs: dict) -> tuple:
+    """
+    按接口签名组装请求参数，export固定为4|Csv文件
+    :param func   : stock_api中的接口函数，例如：stock_api.getMinuteKLine
+    :param kwargs : 接口参数，按参数名传入
+    :return: tuple，(接口名称, 请求参数, 请求方式)
+    """
+    kwargs = dict(kwargs, export=4)
+    bound = inspect.signature(func).bind(**kwargs)
+    bound.apply_defaults()
+    params = dict(bound.arguments)
+    method = params.pop("method", "post")
+    return func.__name__, params, method
+
+
+def _open(client, endpoint: str, params: dict, method: str, chunk_size: int) -> tuple:
+    # 发送请求并读取第一个响应块；服务端出错时返回的是Json而不是Csv，此时读取完整响应并校验
+    response = client.send(endpoint, params, method, stream=True)
+    try:
+        if response.status_code >= 400:
+            errors.checkResponse(endpoint, response.status_code, response.text)
+        chunks = response.iter_content(chunk_size)
+        first = next(chunks, b"")
+        if first.lstrip(codecs.BOM_UTF8 + b" \r\n").startswith(b"{"):
+            text = (first + b"".join(chunks)).decode("utf-8")
+            errors.checkResponse(endpoint, response.status_code, text)
+            raise errors.ApiError("响应不是Csv格式：%s" % text[:200], None, endpoint)
+        if not first:
+            raise errors.ApiError("响应为空", None, endpoint)
+    except Exception:
+        response.close()
+        raise
+    return response, first, chunks
+
+
+def _checkCsv(endpoint: str, text: str):
+    # 不支持stream的客户端返回完整的响应字符串，同样需要识别Json格式的错误响应
+    if text.lstrip("\ufeff \r\n").startswith("{"):
+        errors.checkResponse(endpoint, 200, text)
+        raise errors.ApiError("响应不是Csv格式：%s" % text[:200], None, endpoint)
+    if not text:
+        raise errors.ApiError("响应为空", None, endpoint)
+
+
+def _stream(client, endpoint: str, params: dict, method: str, chunk_size: int):
+    """
+    依次返回响应块。客户端没有send方法（例如通过setClient替换、只实现了request的客户端）时退化为一次性读取完整响应；
+    读取中途出错时按客户端的重试策略重新请求，跳过已读取的字节后继续，已读取部分的校验和不一致时抛出ApiError
+    """
+    retry = getattr(client, "retry", None) or RetryPolicy()
+    if not callable(getattr(client, "send", None)):
+        text = retry.call(lambda: client.request(endpoint, params, method))
+        _checkCsv(endpoint, text)
+        data = text.encode("utf-8")
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+        return
+    offset = 0
+    checksum = 0
+    attempt = 0
+    while True:
+        response, first, chunks = retry.call(lambda: _open(client, endpoint, params, method, chunk_size))
+        resume, resume_checksum = offset, checksum
+        skipped = 0
+        skipped_checksum = 0
+        try:
+            with response:
+                for chunk in _prepend(first, chunks):
+                    if skipped < resume:
+                        head = chunk[:resume - skipped]
+                        skipped += len(head)
+                        skipped_checksum = zlib.crc32(head, skipped_checksum)
+                        if skipped == resume and skipped_checksum != resume_checksum:
+                            raise errors.ApiError("重新请求的数据与已读取的数据不一致", None, endpoint)
+                        chunk = chunk[len(head):]
+                        if not chunk:
+                            continue
+                    offset += len(chunk)
+                    checksum = zlib.crc32(chunk, checksum)
+                    yield chunk
+            if skipped < resume:
+                raise errors.ApiError("重新请求的数据比已读取的数据短", None, endpoint)
+            return
+        except Exception as e:
+            if not retry.shouldRetry(e, attempt):
+                raise
+        time.sleep(retry.delay(attempt))
+        attempt += 1
+
+
+def _writer(raw, compress: str, level: int = None):
+    if compress is None:
+        return raw
+    if compress == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6 if level is None else level)
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd压缩需要安装zstandard：pip install zstandard") from e
+    return zstandard.ZstdCompressor(level=3 if level is None else level).stream_writer(raw, closefd=False)
+
+
+def download(func, file: str, compress: str = None, level: int = None, chunk_size: int = CHUNK_SIZE,
+             **kwargs) -> str:
+    """
+    以stream方式下载Csv数据并按块写入文件，先写入同目录下的临时文件，下载完成后再重命名，避免留下不完整的文件。
+    响应不经过DiskCache，下载中断时按客户端的重试策略重新请求，并从中断处继续写入
+    例如：download(stock_api.getMinuteKLine, "minute.csv.gz", "gzip", type=1, code="600000", startDate="2024-01-01",
+                   endDate="2024-12-31", fields="all", token=token, filter="")
+    :param func       : stock_api中的接口函数，例如：stock_api.getMinuteKLine
+    :param file       : 文件路径
+    :param compress   : 压缩格式，取值范围：None|不压缩；gzip；zstd（需要安装zstandard）
+    :param level      : 压缩级别，为空时gzip为6，zstd为3
+    :param chunk_size : 每次读取的响应块大小，单位字节
+    :param kwargs     : 接口的其余参数，按参数名传入，export固定为4|Csv文件
+    :return: str，文件路径
+    """
+    if compress not in COMPRESSIONS:
+        raise ValueError("压缩格式%s不支持，请使用None、gzip或zstd" % compress)
+    endpoint, params, method = requestParams(func, kwargs)
+    client = http_client.getClient()
+    folder = os.path.dirname(os.path.abspath(file))
+    os.makedirs(folder, exist_ok=True)
+
+    fd, temp = tempfile.mkstemp(prefix=".download-", dir=folder)
+    try:
+        with os.fdopen(fd, "wb") as raw:
+            writer = _writer(raw, compress, level)
+            for chunk in _stream(client, endpoint, params, method, chunk_size):
+                writer.write(chunk)
+            if writer is not raw:
+                writer.close()
+        os.replace(temp, file)
+    except BaseException:
+        os.remove(temp)
+        raise
+    return file
+
+
+def _frame(text: str, columns: list, endpoint: str, schema) -> pd.DataFrame:
+    df = pd.read_csv(io.StringIO(text), header=None, names=columns, dtype={"code": str}, skip_blank_lines=True)
+    if schema:
+        df = schema_tool.applySchema(df, endpoint if schema is True else schema)
+    return df
+
+
+def iterRows(func, batch_rows: int = BATCH_ROWS, schema=True, chunk_size: int = CHUNK_SIZE, **kwargs):
+    """
+    以stream方式读取Csv数据，每累计约batch_rows行解析为一个DataFrame并返回，内存中最多保留一批数据，
+    读取中途出错时重新请求并从中断处继续
+    例如：for df in iterRows(stock_api.getDailyMarket, code="all", ..., token=token, filter=""): ...
+    :param func       : stock_api中的接口函数
+    :param batch_rows : 每批数据行数，实际行数可能多出一个响应块中的行数
+    :param schema     : 字段类型，True|按schema_tool中注册的字段类型转换；False|不转换；也可以传入字段类型dict
+    :param chunk_size : 每次读取的响应块大小，单位字节
+    :param kwargs     : 接口的其余参数，按参数名传入，export固定为4|Csv文件
+    :return: generator，每次返回一个pandas.DataFrame，字段名称为英文标题
+    """
+    endpoint, params, method = requestParams(func, kwargs)
+    client = http_client.getClient()
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    headers = []
+    buffer = ""
+    pending = []
+    rows = 0
+    for chunk in _stream(client, endpoint, params, method, chunk_size):
+        buffer += decoder.decode(chunk)
+        while len(headers) < CSV_HEADER_LINES and "\n" in buffer:
+            line, buffer = buffer.split("\n", 1)
+            headers.append(line.rstrip("\r"))
+        if len(headers) < CSV_HEADER_LINES:
+            continue
+        text, _, buffer = buffer.rpartition("\n")
+        if text:
+            pending.append(text + "\n")
+            rows += text.count("\n") + 1
+        if rows >= batch_rows:
+            yield _frame("".join(pending), headers[0].split(","), endpoint, schema)
+            pending, rows = [], 0
+    buffer += decoder.decode(b"", final=True)
+    if buffer.strip():
+        pending.append(buffer)
+    if pending and headers:
+        yield _frame("".join(pending), headers[0].split(","), endpoint, schema)
+
+
+def _prepend(first: bytes, chunks):
+    yield first
+    yield from chunks
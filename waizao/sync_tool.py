@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 歪枣网，增量同步工具。根据getUpdateInfo接口返回的各数据集更新时间，记录每个数据集已同步到的日期（高水位），
+      只拉取新增日期范围内的数据写入本地存储；若全局客户端启用了DiskCache，拉取的数据同时进入缓存
+http://www.waizaowang.com/
+"""
+
+import datetime
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+from waizao import batch_tool
+from waizao import export_tool
+from waizao import iter_tool
+from waizao import range_tool
+from waizao.api import stock_api
+
+DEFAULT_STATE = os.path.join(os.path.expanduser("~"), ".waizao", "sync.json")
+
+
+class SyncEngine:
+    """
+    增量同步引擎，同步状态保存在Json文件中：{数据集名称: {"date": 已同步到的日期, "updated": 服务端更新时间}}
+    """
+
+    def __init__(self, token: str, state_file: str = DEFAULT_STATE, key_field: str = None, time_field: str = None):
+        """
+        :param token      : 令牌，登录后可获取
+        :param state_file : 同步状态文件
+        :param key_field  : getUpdateInfo中数据集名称的字段名，为空时自动识别
+        :param time_field : getUpdateInfo中更新时间的字段名，为空时自动识别
+        """
+        self.token = token
+        self.state_file = state_file
+        self.key_field = key_field
+        self.time_field = time_field
+        self.datasets = {}
+        self.state = self._loadState()
+
+    def _loadState(self) -> dict:
+        if not os.path.isfile(self.state_file):
+            return {}
+        with open(self.state_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _saveState(self):
+        folder = os.path.dirname(os.path.abspath(self.state_file))
+        os.makedirs(folder, exist_ok=True)
+        fd, temp = tempfile.mkstemp(prefix=".sync-", dir=folder)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(temp, self.state_file)
+
+    def add(self, name: str, fetch, update_key: str = None, initial_date: str = "2000-01-01"):
+        """
+        注册数据集
+        :param name         : 数据集名称
+        :param fetch        : 拉取函数fetch(startDate, endDate)，日期为yyyy-MM-dd格式，负责将数据写入本地存储
+        :param update_key   : 数据集在getUpdateInfo中的名称，为空时与name相同
+        :param initial_date : 首次同步的开始日期
+        """
+        self.datasets[name] = {"fetch": fetch, "update_key": update_key or name, "initial_date": initial_date}
+
+    def addKLine(self, name: str, store, func, codes, type: int, ktype: int, fq: int = 0, update_key: str = None,
+                 initial_date: str = "2000-01-01", max_workers: int = 8):
+        """
+        注册K线数据集，按股票代码分组和交易日窗口拆分请求（iter_tool.iterRequest），逐块写入KLineStore
+        例如：engine.addKLine("day", store, stock_api.getDayKLine, codes, 1, 101, 1, update_key="日线数据")
+        :param name         : 数据集名称
+        :param store        : waizao.store.KLineStore
+        :param func         : 接口函数，例如：stock_api.getDayKLine、stock_api.getHourKLine、stock_api.getMinuteKLine
+        :param codes        : 股票代码，列表或逗号分隔的字符串；若为all，则按单个交易日请求（接口支持all时）
+        :param type         : 资产类型
+        :param ktype        : K线类别，getMinuteKLine取1
+        :param fq           : 复权信息，分线和时线数据取0
+        :param update_key   : 数据集在getUpdateInfo中的名称
+        :param initial_date : 首次同步的开始日期
+        :param max_workers  : 并发请求的数据块数量
+        """
+        # 提前检查股票代码，接口不支持all时在注册时抛出ValueError
+        range_tool.planChunks(func, codes)
+
+        def fetch(startDate: str, endDate: str):
+            # 按交易日窗口逐块请求并写入，首次同步多年的分线数据时每个请求也不会超出接口的数据条数上限
+            for df in iter_tool.iterRequest(func, codes, startDate, endDate, self.token, prefetch=max_workers,
+                                            **batch_tool.endpointKwargs(func, type=type, ktype=ktype, fq=fq)):
+                if not df.empty:
+                    store.write(df, type, ktype, fq)
+
+        self.add(name, fetch, update_key, initial_date)
+
+    def updateInfo(self) -> dict:
+        """
+        获取服务端各数据集的更新时间
+        :return: dict，{数据集名称: 更新时间}
+        """
+        df = export_tool.toDataFrame(stock_api.getUpdateInfo("all", 1, self.token, ""))
+        if df.empty:
+            return {}
+        key_field = self.key_field or _detectKeyField(df)
+        time_field = self.time_field or _detectTimeField(df)
+        return {str(key): str(value) for key, value in zip(df[key_field], df[time_field])}
+
+    def pending(self, info: dict = None) -> dict:
+        """
+        计算需要同步的日期范围
+        :param info : updateInfo的返回值，为空时重新获取；数据集的update_key不在其中时抛出ValueError
+        :return: dict，{数据集名称: (开始日期, 结束日期, 服务端更新时间)}
+        """
+        if info is None:
+            info = self.updateInfo()
+        today = datetime.date.today().isoformat()
+        result = {}
+        for name, dataset in self.datasets.items():
+            updated = info.get(dataset["update_key"])
+            if updated is None:
+                raise ValueError("getUpdateInfo中没有数据集%s（%s），请检查update_key" % (dataset["update_key"], name))
+            state = self.state.get(name, {})
+            if state.get("updated") == updated:
+                continue
+            # 从上次同步到的日期（含）开始，覆盖当天可能未完整的数据
+            start = state.get("date", dataset["initial_date"])
+            end = min(updated[:10], today)
+            if start <= end:
+                result[name] = (start, end, updated)
+        return result
+
+    def run(self, names=None) -> dict:
+        """
+        执行增量同步，每个数据集同步成功后立即保存状态
+        :param names : 需要同步的数据集名称，为空时同步全部
+        :return: dict，{数据集名称: (开始日期, 结束日期, 服务端更新时间)}
+        """
+        tasks = self.pending()
+        if names is not None:
+            tasks = {name: task for name, task in tasks.items() if name in names}
+        for name, (start, end, updated) in tasks.items():
+            self.datasets[name]["fetch"](start, end)
+            self.state[name] = {"date": end, "updated": updated}
+            self._saveState()
+        return tasks
+
+
+def _isTextColumn(series: pd.Series) -> bool:
+    return series.dtype == object or pd.api.types.is_string_dtype(series)
+
+
+def _isTimeColumn(series: pd.Series) -> bool:
+    if not _isTextColumn(series):
+        return False
+    values = series.dropna().astype(str)
+    return len(values) > 0 and values.str.match(r"^\d{4}-\d{2}-\d{2}").all()
+
+
+def _detectKeyField(df: pd.DataFrame) -> str:
+    for column in df.columns:
+        if _isTextColumn(df[column]) and not _isTimeColumn(df[column]):
+            return column
+    raise ValueError("无法识别getUpdateInfo中的数据集名称字段，请指定key_field")
+
+
+def _detectTimeField(df: pd.DataFrame) -> str:
+    columns = [column for column in df.columns if _isTimeColumn(df[column])]
+    if not columns:
+        raise ValueError("无法识别getUpdateInfo中的更新时间字段，请指定time_field")
+    return columns[-1]